@@ -0,0 +1,173 @@
+"""
+오디오 헤드리스 벤치마크
+
+소리 장치 없이 AudioManager + 믹서를 기록용 출력(RecordingAudioBackend)에 연결해서
+- 효과음 지연: play_sfx()를 부른 뒤 그 소리가 처음 출력에 쓰일 때까지의 시간
+- 믹서 CPU: 소리 1초를 만드는 데 믹싱 스레드가 쓴 CPU 시간 (조용할 때 / 효과음을 연달아 틀 때)
+을 재서 JSON으로 출력합니다.
+
+    python audio_benchmark.py
+    python audio_benchmark.py --triggers 100 --load-sec 10 --record out.wav --output result.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict, List
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+# 에셋 경로("src/assets/...")가 실행 위치 기준이므로
+os.chdir(current_dir)
+
+from classes.audio_backend import RecordingAudioBackend
+from managers.audio_manager import AudioList, AudioManager
+from settings.mushitroom_config import (
+    AUDIO_LATENCY_MS,
+    AUDIO_PERIOD_FRAMES,
+    AUDIO_SAMPLE_RATE,
+    SFX_COOLDOWN_MS,
+)
+
+PERIOD_SEC = AUDIO_PERIOD_FRAMES / AUDIO_SAMPLE_RATE
+
+
+def percentile(sorted_values: List[float], ratio: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(ratio * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def wait_for_silence(audio_manager: AudioManager, timeout: float = 2.0) -> None:
+    """재생 중인 효과음이 모두 끝나고, 그 뒤 period가 하나 더 쓰일 때까지 기다림"""
+    deadline = time.perf_counter() + timeout
+    while audio_manager.get_sfx_stats()["voices"] > 0:
+        if time.perf_counter() > deadline:
+            break
+        time.sleep(PERIOD_SEC)
+    time.sleep(PERIOD_SEC * 2)
+
+
+def measure_latency(
+    audio_manager: AudioManager, backend: RecordingAudioBackend, triggers: int
+) -> Dict:
+    latencies_ms: List[float] = []
+    missed = 0
+    for _ in range(triggers):
+        wait_for_silence(audio_manager)
+        # 쿨다운에 걸리지 않도록
+        time.sleep(SFX_COOLDOWN_MS / 1000)
+        triggered_at = time.perf_counter()
+        audio_manager.play_sfx(AudioList.CLICK)
+        sounded_at = backend.wait_for_sound(triggered_at, timeout=1.0)
+        if sounded_at is None:
+            missed += 1
+            continue
+        latencies_ms.append((sounded_at - triggered_at) * 1000)
+
+    sorted_values = sorted(latencies_ms)
+    if not sorted_values:
+        return {"triggers": triggers, "missed": missed}
+    return {
+        "triggers": triggers,
+        "missed": missed,
+        "mean": round(sum(sorted_values) / len(sorted_values), 3),
+        "p50": round(percentile(sorted_values, 0.50), 3),
+        "p95": round(percentile(sorted_values, 0.95), 3),
+        "max": round(sorted_values[-1], 3),
+    }
+
+
+def measure_cpu(audio_manager: AudioManager, seconds: float, sfx_interval_ms: int):
+    """
+    seconds 동안 믹서 CPU를 잽니다.
+    :param sfx_interval_ms: 이 간격으로 효과음을 틈 (0이면 조용히)
+    :return: 소리 1초당 CPU ms
+    """
+    before = audio_manager.get_mixer_stats()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        if sfx_interval_ms > 0:
+            audio_manager.play_sfx(AudioList.CLICK)
+            time.sleep(sfx_interval_ms / 1000)
+        else:
+            time.sleep(0.05)
+    after = audio_manager.get_mixer_stats()
+
+    audio_sec = after["audio_sec"] - before["audio_sec"]
+    cpu_sec = after["cpu_sec"] - before["cpu_sec"]
+    return round(cpu_sec * 1000 / audio_sec, 3) if audio_sec > 0 else 0.0
+
+
+def run(args) -> Dict:
+    backend = RecordingAudioBackend(args.record)
+    audio_manager = AudioManager(backend=backend)
+    audio_manager.wait_idle(timeout=5.0)
+    if audio_manager.get_mixer_stats() is None:
+        raise RuntimeError("오디오 믹서를 시작할 수 없습니다. (numpy 필요)")
+
+    latency = measure_latency(audio_manager, backend, args.triggers)
+    idle_cpu = measure_cpu(audio_manager, args.idle_sec, sfx_interval_ms=0)
+
+    # BGM 파일이 있으면 깔아 두고 효과음을 연달아 틈 (덕킹, 스트리밍 포함)
+    has_bgm = os.path.exists(AudioList.BGM_00.value)
+    if has_bgm:
+        audio_manager.play_bgm(AudioList.BGM_00)
+    load_cpu = measure_cpu(
+        audio_manager, args.load_sec, sfx_interval_ms=args.sfx_interval_ms
+    )
+    if has_bgm:
+        audio_manager.stop_bgm()
+
+    audio_manager.wait_idle(timeout=2.0)
+    result = {
+        "backend": backend.name,
+        "sfx_latency_ms": latency,
+        # 실제 장치에서는 여기에 출력 버퍼만큼(최대 AUDIO_LATENCY_MS) 더 늦게 들림
+        "output_buffer_ms": AUDIO_LATENCY_MS,
+        "mixer_cpu_ms_per_audio_sec": {
+            "idle": idle_cpu,
+            "load": load_cpu,
+            "load_with_bgm": has_bgm,
+        },
+        "mixer": audio_manager.get_mixer_stats(),
+        "sfx": audio_manager.get_sfx_stats(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+    audio_manager.stop_worker()  # 녹음 파일도 여기서 닫힘
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="MUSHITROOM audio benchmark")
+    parser.add_argument("--triggers", type=int, default=30, help="지연을 잴 효과음 수")
+    parser.add_argument("--idle-sec", type=float, default=1.0, help="조용할 때 CPU 측정 시간")
+    parser.add_argument("--load-sec", type=float, default=3.0, help="효과음을 틀 때 CPU 측정 시간")
+    parser.add_argument(
+        "--sfx-interval-ms", type=int, default=50, help="CPU 측정 중 효과음 간격"
+    )
+    parser.add_argument("--record", default=None, help="섞은 소리를 저장할 WAV 경로")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로 (없으면 stdout)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    result = run(args)
+
+    report = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"📊 오디오 벤치마크 결과 저장: {args.output}")
+    else:
+        print(report)
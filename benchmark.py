@@ -0,0 +1,290 @@
+"""
+헤드리스 벤치마크
+
+Tk 창이나 실제 ST7789 없이 게임 루프를 돌리고 프레임 시간을 JSON으로 출력합니다.
+스크립트 입력으로 타이틀 → 유저 선택 → 버섯 선택 → 로비를 반복해서 지나갑니다.
+
+    python benchmark.py --frames 1200
+    python benchmark.py --frames 600 --display recording --output result.json
+    python benchmark.py --check-display     # RGB565 창 전송 검사만
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+# 에셋 경로("./src/assets/...")가 실행 위치 기준이므로
+os.chdir(current_dir)
+
+import main
+from PIL import Image
+
+from classes.headless_display import (
+    NullDisplay,
+    NullSpi,
+    RecordingDisplay,
+    RecordingSpi,
+)
+from classes.render_rect import RenderRect
+from classes.spi_pixel_writer import SpiPixelWriter
+from managers.display_manager import DisplayManager
+from managers.input_manager.input_manager import (
+    InputManager,
+    ScriptedInputStrategy,
+    ScriptStep,
+)
+from managers.asset_registry import AssetRegistry
+from managers.render_manager import RenderManager
+from managers.scene_manager import SceneManager
+from managers.sq_manager import SqManager
+from managers.timer_manager import TimerManager
+from settings.mushitroom_config import DISPLAY_HEIGHT, DISPLAY_ROTATE, DISPLAY_WIDTH
+from settings.mushitroom_enums import InputActions, SceneType
+from utils.resource_loader import get_cache_stats
+from utils.rgb565 import encode_rgb565, is_rgb565_available
+from utils.text_bitmap_cache import get_text_bitmap_cache_stats
+
+# 버튼 사이 간격 (프레임). 커서/버섯 애니메이션이 그려질 시간을 줍니다.
+STEP_GAP = 12
+
+
+def go_to_lobby() -> None:
+    """버섯 선택 화면에서 로비로 이동 (로비는 입력만으로는 갈 수 없음)"""
+    scene_manager = SceneManager()
+    user_id = getattr(scene_manager.current_scene, "_user_id", None)
+    scene_manager.switch_scene(SceneType.LOBBY_SCENE, user_id=user_id)
+
+
+def build_script() -> List[ScriptStep]:
+    A = InputActions
+    presses: List[InputActions | Callable[[], None]] = [
+        # 타이틀: 커서 깨우기 → START
+        A.ENTER,
+        A.ENTER,
+        # 유저 선택: 커서 깨우기 → NEW USER → 커서 깨우기 → 첫 유저로 이동 → 선택
+        A.ENTER,
+        A.ENTER,
+        A.DOWN,
+        A.DOWN,
+        A.ENTER,
+        # 버섯 선택: 커서 이동 → 입양 1번
+        A.ENTER,
+        A.RIGHT,
+        A.LEFT,
+        A.ENTER,
+        # 로비: 커서 이동 후 유저 선택 → 타이틀로 돌아가기
+        go_to_lobby,
+        A.RIGHT,
+        A.RIGHT,
+        A.LEFT,
+        A.ESCAPE,
+        A.ESCAPE,
+    ]
+    return [(STEP_GAP, press) for press in presses]
+
+
+def percentile(sorted_values: List[float], ratio: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(ratio * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def get_peak_rss_kb() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 byte, Linux는 KB 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# luma rotate(시계방향 90도 단위)대로 논리 화면을 패널 방향으로 돌리는 transpose
+PANEL_TRANSPOSE = {
+    1: Image.Transpose.ROTATE_270,
+    2: Image.Transpose.ROTATE_180,
+    3: Image.Transpose.ROTATE_90,
+}
+
+
+def check_display_transfers(rotations=(0, 1, 2, 3)) -> List[str]:
+    """
+    가짜 spidev로 RGB565 창 전송을 검사합니다.
+    보낸 창마다 '논리 화면을 패널 방향으로 돌려 그 창만큼 자른 것'의 RGB565와 같은지 비교
+    :return: 틀린 항목 설명 목록 (비어 있으면 통과)
+    """
+    width, height = DISPLAY_WIDTH, DISPLAY_HEIGHT
+    frame = Image.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+    dirty_rects = [
+        RenderRect(0, 0, 17, 9),
+        RenderRect(40, 50, 121, 77),
+        RenderRect(width - 30, height - 11, width, height),
+    ]
+
+    failures: List[str] = []
+    display_manager = DisplayManager()
+    for rotate in rotations:
+        device = RecordingDisplay(width, height, rotate)
+        spi = RecordingSpi()
+        display_manager.set_device(
+            device, pixel_writer=SpiPixelWriter(spi, set_data_mode=lambda: None)
+        )
+        display_manager.present(frame, dirty_rects)
+
+        panel = frame.transpose(PANEL_TRANSPOSE[rotate]) if rotate else frame
+        windows = [box for _, box in device.transfers]
+        if len(windows) != len(dirty_rects) or len(spi.payloads) != len(windows):
+            failures.append(
+                f"rotate {rotate}: 창 {len(windows)}개 / 데이터 {len(spi.payloads)}개"
+                f" (기대 {len(dirty_rects)}개)"
+            )
+            continue
+        for box, payload in zip(windows, spi.payloads):
+            if payload != encode_rgb565(panel.crop(box)):
+                failures.append(f"rotate {rotate}: 창 {box} 데이터가 다름")
+    return failures
+
+
+def run(frames: int, display_kind: str, warmup: int) -> Dict:
+    device = (
+        RecordingDisplay(DISPLAY_WIDTH, DISPLAY_HEIGHT, DISPLAY_ROTATE)
+        if display_kind == "recording"
+        else NullDisplay(DISPLAY_WIDTH, DISPLAY_HEIGHT, DISPLAY_ROTATE)
+    )
+    spi = RecordingSpi() if display_kind == "recording" else NullSpi()
+    display_manager = DisplayManager()
+    display_manager.set_device(
+        device,
+        pixel_writer=(
+            SpiPixelWriter(spi, set_data_mode=lambda: None)
+            if is_rgb565_available()
+            else None
+        ),
+    )
+
+    TimerManager().start()
+    input_manager = InputManager(is_windows=False, script=build_script())
+    input_manager.initialize()
+    strategy = input_manager.strategy
+    assert isinstance(strategy, ScriptedInputStrategy)
+
+    scene_manager = SceneManager()
+    main.render_manager = RenderManager()
+    main.display_manager = display_manager
+    main.input_manager = input_manager
+    main.scene_manager = scene_manager
+    main.device = device
+    scene_manager.switch_scene(SceneType.TITLE_SCENE)
+
+    frame_times_ms: List[float] = []
+    scene_frames: Dict[str, int] = {}
+
+    start = time.perf_counter()
+    for index in range(warmup + frames):
+        if index == warmup:
+            start = time.perf_counter()
+        frame_start = time.perf_counter()
+
+        strategy.advance()
+        main.handle_game_logic()
+        main.render_windows()  # 그리기 + 같은 스레드에서 전송
+
+        if index >= warmup:
+            frame_times_ms.append((time.perf_counter() - frame_start) * 1000)
+            scene_name = type(scene_manager.current_scene).__name__
+            scene_frames[scene_name] = scene_frames.get(scene_name, 0) + 1
+    elapsed = time.perf_counter() - start
+
+    sorted_times = sorted(frame_times_ms)
+    result = {
+        "frames": frames,
+        "elapsed_sec": round(elapsed, 4),
+        "fps": round(frames / elapsed, 2) if elapsed > 0 else 0.0,
+        "frame_time_ms": {
+            "mean": round(sum(sorted_times) / len(sorted_times), 3),
+            "p50": round(percentile(sorted_times, 0.50), 3),
+            "p95": round(percentile(sorted_times, 0.95), 3),
+            "p99": round(percentile(sorted_times, 0.99), 3),
+            "max": round(sorted_times[-1], 3),
+        },
+        "peak_rss_kb": get_peak_rss_kb(),
+        "display": {
+            "device": display_kind,
+            "rgb565": is_rgb565_available(),
+            "full_frames": device.frames,
+            "windows": device.windows,
+            "bytes": device.bytes_written + spi.bytes_written,
+        },
+        "scenes": scene_frames,
+        "caches": {
+            **get_cache_stats(),
+            "text_bitmap": get_text_bitmap_cache_stats(),
+        },
+        # 측정이 끝났을 때 씬들이 빌리고 있는 에셋
+        "asset_registry": AssetRegistry().get_stats(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+    if isinstance(device, RecordingDisplay):
+        result["display"]["transfers"] = len(device.transfers)
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="MUSHITROOM headless benchmark")
+    parser.add_argument("--frames", type=int, default=1200, help="측정할 프레임 수")
+    parser.add_argument("--warmup", type=int, default=24, help="측정 전 버릴 프레임 수")
+    parser.add_argument(
+        "--display",
+        choices=["null", "recording"],
+        default="null",
+        help="가짜 화면 장치 종류",
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로 (없으면 stdout)")
+    parser.add_argument(
+        "--check-display",
+        action="store_true",
+        help="벤치마크 대신 RGB565 창 전송이 화면과 같은지만 검사",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.check_display:
+        if not is_rgb565_available():
+            print("⚠️ numpy가 없어 RGB565 전송 검사를 건너뜁니다.")
+            sys.exit(0)
+        failures = check_display_transfers()
+        for failure in failures:
+            print(f"❌ {failure}")
+        if failures:
+            sys.exit(1)
+        print("✅ RGB565 창 전송 검사 통과 (rotate 0~3)")
+        sys.exit(0)
+
+    # 실제 DB를 건드리지 않도록 임시 DB 사용
+    with tempfile.TemporaryDirectory() as temp_dir:
+        SqManager(db_name=os.path.join(temp_dir, "benchmark.db"))
+        result = run(args.frames, args.display, args.warmup)
+
+    report = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"📊 벤치마크 결과 저장: {args.output}")
+    else:
+        print(report)
@@ -1,11 +1,397 @@
-import zipapp
 import os
+import re
+import ast
+import sys
+import json
+import argparse
+import stat
+import string
 import shutil
+import pkgutil
+import importlib
 import tempfile
+import zipfile
 from pathlib import Path
+from typing import Callable
 
+from PIL import Image
+
+IMAGE_DIR = Path("src") / "assets" / "images"
+ATLAS_DIR = Path("src") / "assets" / "atlas"
+ATLAS_MAX_WIDTH = 1024
+# 아틀라스에 넣지 않을 이미지 (백업본 등)
+ATLAS_EXCLUDE_SUFFIXES = ("_backup",)
+# 한 장짜리 이미지들을 모아 둘 시트 이름
+ATLAS_MISC_SHEET = "misc"
+# 씬 asset_manifest에 적힌 (이미지, 크기)를 미리 리사이즈해 둘 에셋 팩
+ASSET_PACK_PATH = Path("src") / "assets" / "pack" / "sprites.mpk"
+FONT_DIR = Path("src") / "assets" / "fonts"
+FONT_SUBSET_DIR = FONT_DIR / "subset"
+# 글자를 모을 소스 (UI 문자열, 이름 생성기 단어 목록)
+FONT_TEXT_SOURCES = [Path("main.py"), Path("src")]
+# 이미 압축된 형식과 에셋 팩은 .pyz에 압축 없이 저장 (실행 시 mmap으로 복사 없이 읽음)
+ARCHIVE_STORED_SUFFIXES = {".png", ".jpg", ".mp3", ".ogg", ".mpk"}
+
+
+def _pack_shelves(
+    sizes: list[tuple[int, int]], max_width: int
+) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+    """
+    선반(shelf) 방식으로 사각형들을 배치합니다.
+    :return: (각 사각형의 왼쪽 위 좌표, 시트 크기)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    positions: list[tuple[int, int]] = [(0, 0)] * len(sizes)
+
+    x = y = shelf_height = sheet_width = 0
+    for index in order:
+        width, height = sizes[index]
+        if x > 0 and x + width > max_width:
+            # 다음 선반으로
+            y += shelf_height
+            x = shelf_height = 0
+        positions[index] = (x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+        sheet_width = max(sheet_width, x)
+
+    return positions, (max(1, sheet_width), max(1, y + shelf_height))
+
+
+def _add_src_to_path():
+    """게임 모듈(settings, scenes ...)을 import 하기 위해 src를 경로에 추가"""
+    src_path = str(Path("src").resolve())
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+
+
+def build_atlas():
+    """
+    src/assets/images의 PNG를 시트 몇 장 + JSON 인덱스로 묶습니다.
+    - 애니메이션 프레임(gombo1~5 처럼 숫자만 다른 파일)은 종류별로 한 시트
+    - 나머지 한 장짜리 이미지는 misc 시트 하나
+    - 투명한 테두리는 잘라내고, 원래 위치(offset)와 크기를 인덱스에 기록
+    """
+    print(f"🧩 아틀라스 생성: {IMAGE_DIR} -> {ATLAS_DIR}")
+
+    groups: dict[str, list[Path]] = {}
+    for path in sorted(IMAGE_DIR.glob("*.png")):
+        if path.stem.endswith(ATLAS_EXCLUDE_SUFFIXES):
+            continue
+        base_name = re.sub(r"\d+$", "", path.stem)
+        groups.setdefault(base_name, []).append(path)
+
+    sheets: dict[str, list[Path]] = {}
+    for base_name, paths in groups.items():
+        if len(paths) > 1:
+            sheets[base_name] = paths
+        else:
+            sheets.setdefault(ATLAS_MISC_SHEET, []).extend(paths)
+
+    if ATLAS_DIR.exists():
+        shutil.rmtree(ATLAS_DIR)
+    ATLAS_DIR.mkdir(parents=True)
+
+    index: dict = {"version": 1, "sheets": {}, "sprites": {}}
+    for sheet_name, paths in sheets.items():
+        sprites = []
+        for path in paths:
+            with Image.open(path) as img:
+                img = img.convert("RGBA")
+            bbox = img.getchannel("A").getbbox() or (0, 0, 0, 0)
+            sprites.append((path, img.size, bbox, img.crop(bbox)))
+
+        positions, sheet_size = _pack_shelves(
+            [trimmed.size for _, _, _, trimmed in sprites], ATLAS_MAX_WIDTH
+        )
+        sheet = Image.new("RGBA", sheet_size, (0, 0, 0, 0))
+        for (path, source_size, bbox, trimmed), (x, y) in zip(sprites, positions):
+            sheet.paste(trimmed, (x, y))
+            index["sprites"][path.as_posix()] = {
+                "sheet": sheet_name,
+                "rect": [x, y, trimmed.width, trimmed.height],
+                "offset": [bbox[0], bbox[1]],
+                "source_size": list(source_size),
+            }
+
+        file_name = f"{sheet_name}.png"
+        sheet.save(ATLAS_DIR / file_name, optimize=True)
+        index["sheets"][sheet_name] = {"file": file_name, "size": list(sheet_size)}
+        print(f"   - {file_name}: {len(sprites)}장, {sheet_size[0]}x{sheet_size[1]}")
+
+    with open(ATLAS_DIR / "atlas.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"✅ 아틀라스 완료: 시트 {len(sheets)}장 / 이미지 {len(index['sprites'])}장")
+
+
+class _RenderedStringCollector(ast.NodeVisitor):
+    """
+    소스의 문자열 상수를 모읍니다. (f-string의 고정 부분 포함)
+    docstring과 print()에 넘긴 로그 문자열은 화면에 그리지 않으므로 뺍니다.
+    """
+
+    def __init__(self) -> None:
+        self.strings: set[str] = set()
+
+    def visit_Constant(self, node: ast.Constant):
+        if isinstance(node.value, str):
+            self.strings.add(node.value)
+
+    def visit_Call(self, node: ast.Call):
+        if isinstance(node.func, ast.Name) and node.func.id == "print":
+            return
+        self.generic_visit(node)
+
+    def visit_Expr(self, node: ast.Expr):
+        # 문장으로 홀로 쓰인 문자열 = docstring / 주석 대용
+        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            return
+        self.generic_visit(node)
+
+
+def _collect_manifest_images() -> list[tuple[str, int, int]]:
+    """모든 씬의 asset_manifest에 적힌 (이미지 경로, 너비, 높이)"""
+    _add_src_to_path()
+    import scenes
+    from classes.scene_base import BaseScene
+
+    for module_info in pkgutil.walk_packages(scenes.__path__, "scenes."):
+        importlib.import_module(module_info.name)
+
+    images: list[tuple[str, int, int]] = []
+    for scene_class in BaseScene.__subclasses__():
+        for key in scene_class.asset_manifest.images:
+            if key not in images:
+                images.append(key)
+    return images
+
+
+def build_sprite_variants(zoom: int | None = None):
+    """
+    씬 asset_manifest의 (이미지, 크기)마다 실행 시와 똑같이 리사이즈한 픽셀을
+    에셋 팩(헤더 + 인덱스 + RGBA 블록) 하나로 저장합니다.
+    실행 시 PNG 디코딩과 리사이즈 없이 mmap 위에서 바로 이미지를 만듭니다.
+    :param zoom: 게임을 실행할 기기의 ZOOM_IN (없으면 이 PC의 ZOOM_IN)
+        팩의 크기가 실행 시 요청과 다르면 전부 실행 시 리사이즈로 넘어가므로,
+        Windows(ZOOM_IN 3)에서 라즈베리파이용으로 빌드할 때는 1을 줘야 합니다.
+    """
+    images = _collect_manifest_images()
+    from settings.mushitroom_config import ZOOM_IN
+
+    target_zoom = zoom if zoom is not None else ZOOM_IN
+    from utils.asset_pack import (
+        PACK_ALIGNMENT,
+        PACK_HEADER,
+        PACK_MAGIC,
+        PACK_MODE,
+        PACK_VERSION,
+    )
+    from utils.sprite_blit import classify_sprite
+
+    print(
+        f"🍳 스프라이트 미리 리사이즈: {len(images)}개 (ZOOM_IN {target_zoom})"
+        f" -> {ASSET_PACK_PATH}"
+    )
+
+    # (키, "WxH", 픽셀, [보이는 영역, paste 방식], 한 줄 바이트 수)
+    blocks: list[tuple[str, str, bytes, list, int]] = []
+    for path, width, height in images:
+        # manifest 크기에는 이 PC의 ZOOM_IN이 곱해져 있음
+        width = width // ZOOM_IN * target_zoom
+        height = height // ZOOM_IN * target_zoom
+        source_path = Path(os.path.normpath(path))
+        if not source_path.exists():
+            print(f"⚠️ 이미지 없음: {path}")
+            continue
+        with Image.open(source_path) as img:
+            # resource_loader.load_resized_image와 같은 변환
+            resized = img.convert(PACK_MODE).resize(
+                (width, height), resample=Image.Resampling.NEAREST
+            )
+        # 실행 시 load_sprite가 자르거나 마스크를 만들지 않도록 영역과 방식을 미리 정함
+        sprite = classify_sprite(resized)
+        bbox = None
+        if sprite.image is not None:
+            left, top = sprite.offset
+            bbox = [left, top, left + sprite.image.width, top + sprite.image.height]
+        blocks.append(
+            (
+                source_path.as_posix(),
+                f"{width}x{height}",
+                resized.tobytes(),
+                [bbox, sprite.kind],
+                width * Image.getmodebands(PACK_MODE),
+            )
+        )
+
+    def align(offset: int) -> int:
+        return (offset + PACK_ALIGNMENT - 1) // PACK_ALIGNMENT * PACK_ALIGNMENT
+
+    # offset은 픽셀 영역 시작부터 (블록마다 PACK_ALIGNMENT로 정렬)
+    index: dict = {"mode": PACK_MODE, "zoom": target_zoom, "images": {}}
+    offset = 0
+    for key, size_key, data, sprite_info, row_bytes in blocks:
+        index["images"].setdefault(key, {})[size_key] = [offset, *sprite_info]
+        # bbox 뷰는 마지막 줄도 한 줄 길이만큼 읽을 수 있어야 하므로 한 줄 여유
+        offset = align(offset + len(data) + row_bytes)
+    index_bytes = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    data_start = align(PACK_HEADER.size + len(index_bytes))
+
+    ASSET_PACK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(ASSET_PACK_PATH, "wb") as f:
+        f.write(
+            PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes), data_start)
+        )
+        f.write(index_bytes)
+        for key, size_key, data, _, _ in blocks:
+            f.seek(data_start + index["images"][key][size_key][0])
+            f.write(data)
+        # 마지막 블록의 여유분까지 파일 길이를 맞춤
+        f.truncate(data_start + offset)
+    pack_size = ASSET_PACK_PATH.stat().st_size
+    print(f"✅ 미리 리사이즈 완료: {len(blocks)}개, 팩 {pack_size // 1024}KB")
+
+
+def _collect_font_chars() -> str:
+    """게임이 그릴 수 있는 글자 모음 (UI 문자열 + 이름 생성기 단어 + ASCII)"""
+    collector = _RenderedStringCollector()
+    for source in FONT_TEXT_SOURCES:
+        paths = [source] if source.is_file() else sorted(source.rglob("*.py"))
+        for path in paths:
+            try:
+                collector.visit(ast.parse(path.read_text(encoding="utf-8")))
+            except SyntaxError as e:
+                print(f"⚠️ 글자 수집 건너뜀: {path} / {e}")
+
+    # 유저 / 버섯 이름은 DB에 저장된 값을 그리므로 생성기 단어 목록을 직접 넣음
+    _add_src_to_path()
+    from utils.name_generator import NameGenerator
+    from utils.name_after_mushitroom import MushroomNameGenerator
+    from classes.mushroom_class import MushroomType
+
+    words: list[str] = []
+    for generator in (NameGenerator, MushroomNameGenerator):
+        for value in vars(generator).values():
+            if isinstance(value, list):
+                words.extend(word for word in value if isinstance(word, str))
+    words.extend(member.name_kr for member in MushroomType)
+    words.extend(member.name_en for member in MushroomType)
+
+    chars = set(string.printable) | set("".join(collector.strings)) | set("".join(words))
+    # 줄바꿈 등 제어 문자는 글리프가 없음
+    return "".join(sorted(ch for ch in chars if ch.isprintable()))
+
+
+def _get_packaged_font_names() -> set[str]:
+    """FontStyle에 등록된 폰트 파일 (나머지 폰트는 게임에서 쓰지 않음)"""
+    _add_src_to_path()
+    from settings.mushitroom_enums import FontStyle
+
+    return {style.value for style in FontStyle}
+
+
+def build_font_subsets():
+    """
+    FontStyle의 폰트를 게임이 쓰는 글자만 남겨 src/assets/fonts/subset에 저장합니다.
+    charset.json에 담긴 글자만 쓰는 문자열은 실행 시 서브셋 폰트로,
+    그 밖의 글자(예: 새로 추가한 문구)가 섞이면 원본 폰트로 그립니다.
+    fontTools가 없으면 건너뜁니다. (원본 폰트만 사용)
+    """
+    try:
+        from fontTools import subset
+    except ImportError:
+        print("⚠️ fontTools가 없어 폰트 서브셋을 건너뜁니다. (pip install fonttools)")
+        return
+
+    chars = _collect_font_chars()
+    print(f"🔤 폰트 서브셋 생성: {len(chars)}자 -> {FONT_SUBSET_DIR}")
+
+    if FONT_SUBSET_DIR.exists():
+        shutil.rmtree(FONT_SUBSET_DIR)
+    FONT_SUBSET_DIR.mkdir(parents=True)
+
+    options = subset.Options()
+    # 커닝 등 레이아웃 정보와 힌팅은 그대로 두어 원본과 같은 모양으로 그림
+    options.layout_features = ["*"]
+    # Pillow 기본 레이아웃은 GPOS가 아니라 옛 kern 테이블로 자간을 맞춤
+    options.legacy_kern = True
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+
+    fonts: list[str] = []
+    for font_name in sorted(_get_packaged_font_names()):
+        source_path = FONT_DIR / font_name
+        if not source_path.exists():
+            print(f"⚠️ 폰트 파일 없음: {source_path}")
+            continue
+        font = subset.load_font(str(source_path), options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=chars)
+        subsetter.subset(font)
+        subset.save_font(font, str(FONT_SUBSET_DIR / font_name), options)
+        font.close()
+        fonts.append(font_name)
+
+        before_kb = source_path.stat().st_size // 1024
+        after_kb = (FONT_SUBSET_DIR / font_name).stat().st_size // 1024
+        print(f"   - {font_name}: {before_kb}KB -> {after_kb}KB")
+
+    with open(FONT_SUBSET_DIR / "charset.json", "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": 1, "fonts": fonts, "chars": chars},
+            f,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+    print(f"✅ 폰트 서브셋 완료: {len(fonts)}개")
+
+
+def _create_archive(
+    source: Path,
+    target: Path,
+    interpreter: str,
+    main: str,
+    filter: Callable[[Path], bool],
+):
+    """
+    zipapp.create_archive와 같은 .pyz를 만들되, 파일마다 압축 여부를 정합니다.
+    (zipapp은 전체를 압축하거나 전체를 압축하지 않는 것만 고를 수 있음)
+    """
+    module_name, function_name = main.split(":")
+    main_py = (
+        "# -*- coding: utf-8 -*-\n"
+        f"import {module_name}\n"
+        f"{module_name}.{function_name}()\n"
+    )
+
+    stored_count = 0
+    with open(target, "wb") as f:
+        f.write(b"#!" + interpreter.encode("utf-8") + b"\n")
+        with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            for child in sorted(source.rglob("*")):
+                arcname = child.relative_to(source)
+                if not filter(arcname):
+                    continue
+                if child.suffix.lower() in ARCHIVE_STORED_SUFFIXES:
+                    z.write(child, arcname.as_posix(), compress_type=zipfile.ZIP_STORED)
+                    stored_count += 1
+                else:
+                    z.write(child, arcname.as_posix())
+            z.writestr("__main__.py", main_py.encode("utf-8"))
+
+    target.chmod(target.stat().st_mode | stat.S_IEXEC)
+    print(f"📦 압축 없이 저장한 에셋: {stored_count}개")
+
+
+def build(zoom: int | None = None):
+    # 0. 빌드 산출물(에셋) 생성
+    build_atlas()
+    build_sprite_variants(zoom)
+    build_font_subsets()
+    packaged_font_names = _get_packaged_font_names()
 
-def build():
     # 1. 최종 결과물 위치 설정
     os.makedirs("dist", exist_ok=True)
     final_output_path = Path("dist") / "mushitroom.pyz"
@@ -21,12 +407,17 @@ def build():
             ".vscode",
             "__pycache__",
             "build.py",
+            "benchmark.py",
+            "audio_benchmark.py",
             "mushitroom.pyz",
             ".idea",
         }
         for part in path.parts:
             if part in ignore_list:
                 return False
+        # FontStyle에 없는 폰트는 넣지 않음 (서브셋 폴더는 그대로)
+        if path.parent == FONT_DIR and path.suffix.lower() in (".ttf", ".otf"):
+            return path.name in packaged_font_names
         return True
 
 
@@ -34,13 +425,12 @@ def build():
         temp_output_path = Path(temp_dir) / "mushitroom.pyz"
 
         try:
-            zipapp.create_archive(
+            _create_archive(
                 source=source_dir,
                 target=temp_output_path,
                 interpreter="/usr/bin/env python3",
                 main="main:main",
                 filter=filter_func,
-                compressed=True,
             )
 
             if final_output_path.exists():
@@ -55,4 +445,22 @@ def build():
 
 
 if __name__ == "__main__":
-    build()
+    # python build.py atlas : 아틀라스만 다시 생성 (개발 중 확인용)
+    # python build.py sprites : 미리 리사이즈한 스프라이트 팩만 다시 생성
+    # python build.py fonts : 폰트 서브셋만 다시 생성
+    # --zoom 1 : 라즈베리파이(ZOOM_IN 1)용 스프라이트 팩 (다른 OS에서 빌드할 때)
+    parser = argparse.ArgumentParser(description="MUSHITROOM build")
+    parser.add_argument("target", nargs="?", choices=("atlas", "sprites", "fonts"))
+    parser.add_argument(
+        "--zoom", type=int, default=None, help="게임을 실행할 기기의 ZOOM_IN"
+    )
+    args = parser.parse_args()
+
+    if args.target == "atlas":
+        build_atlas()
+    elif args.target == "sprites":
+        build_sprite_variants(args.zoom)
+    elif args.target == "fonts":
+        build_font_subsets()
+    else:
+        build(args.zoom)
@@ -19,9 +19,9 @@ try:
     # =========
     # 외부 라이브러리 import
     # =========
-    import time
+    import math
     import platform
-    from PIL import Image, ImageDraw
+    from PIL import Image
 
     # ===================
     # 프로젝트 모듈 import
@@ -30,16 +30,23 @@ try:
     from managers.scene_manager import SceneManager, SceneType
     from managers.input_manager.input_manager import InputManager
     from managers.timer_manager import TimerManager
+    from managers.render_manager import RenderManager
+    from managers.display_manager import DisplayManager
+    from managers.profiler_manager import ProfilerManager
+    from components.profiler_overlay import ProfilerOverlay
+    from classes.render_rect import RenderRect
+    from classes.game_loop import GameLoop
 
     from managers.sq_manager import SqManager
     from settings.mushitroom_config import (
         GPIO_PINS,
-        BG_COLOR,
         DISPLAY_WIDTH,
         DISPLAY_HEIGHT,
         DISPLAY_ROTATE,
         FPS,
         SPI_SPEED,
+        MAX_CATCH_UP_STEPS,
+        MAX_FRAME_SKIP,
     )
 
     if TYPE_CHECKING:
@@ -70,6 +77,10 @@ timer_manager: TimerManager | None = None
 audio_manager: AudioManager | None = None
 scene_manager: SceneManager | None = None
 input_manager: InputManager | None = None
+render_manager: RenderManager | None = None
+display_manager: DisplayManager | None = None
+game_loop: GameLoop | None = None
+profiler_overlay: ProfilerOverlay | None = None
 root: "Tk | None" = None
 device = None
 
@@ -79,49 +90,105 @@ device = None
 # ============
 def handle_game_logic():
     global scene_manager, input_manager
+    profiler = ProfilerManager()
+    with profiler.measure("handle_game_logic"):
+        if scene_manager:
+            with profiler.measure("handle_input"):
+                scene_manager.handle_input()
+        if scene_manager:
+            with profiler.measure("update"):
+                scene_manager.update()
+        if input_manager:
+            input_manager.clear_just_pressed()
+
+
+def draw_frame() -> tuple[Image.Image, list[RenderRect]]:
+    """
+    프레임을 그리고 (완성된 front 캔버스, 바뀐 영역 목록)을 반환합니다.
+    캔버스는 매 프레임 새로 만들지 않고 FrameBufferManager의 front/back 버퍼를 번갈아 씁니다.
+    """
+    global scene_manager, render_manager, profiler_overlay
+    if render_manager is None:
+        render_manager = RenderManager()
+    profiler = ProfilerManager()
+    draw_tool = render_manager.begin_frame()
     if scene_manager:
-        scene_manager.handle_input()
-    if scene_manager:
-        scene_manager.update()
-    if input_manager:
-        input_manager.clear_just_pressed()
-
-
-def draw_frame() -> Image.Image:
-    global scene_manager
-    canvas = Image.new(
-        "RGBA",
-        (DISPLAY_WIDTH, DISPLAY_HEIGHT),
-        BG_COLOR,
+        with profiler.measure("draw"):
+            scene_manager.draw(draw_tool)
+    if profiler.overlay_visible:
+        if profiler_overlay is None:
+            profiler_overlay = ProfilerOverlay()
+        render_manager.submit(profiler_overlay)
+    with profiler.measure("render"):
+        dirty_rects = render_manager.end_frame()
+    return render_manager.frame_buffer.front.canvas, dirty_rects
+
+
+def render_windows():
+    global device, display_manager
+    pil_image, dirty_rects = draw_frame()
+    if device is not None and display_manager is not None:
+        with ProfilerManager().measure("display"):
+            display_manager.present(pil_image, dirty_rects)
+    ProfilerManager().end_frame()
+
+
+def render_rpi():
+    global device, display_manager
+    pil_image, dirty_rects = draw_frame()
+    if device is not None and display_manager is not None:
+        # 바뀐 창(window)만 출력 스레드에 넘기고 바로 다음 프레임으로 (전송을 기다리지 않음)
+        with ProfilerManager().measure("display"):
+            display_manager.submit(pil_image, dirty_rects)
+    ProfilerManager().end_frame()
+
+
+def setup_profiler_controls():
+    """
+    프로파일러 조작 키/시그널 연결
+    - Windows: F11 오버레이 켜고 끄기 / F12 CSV 저장
+    - RPi: kill -USR2 <pid> 오버레이 / kill -USR1 <pid> CSV 저장
+    """
+    global root
+    profiler = ProfilerManager()
+
+    if IS_WINDOWS:
+        if root is not None:
+            root.bind("<F11>", lambda event: profiler.toggle_overlay())
+            root.bind("<F12>", lambda event: profiler.dump_csv())
+        return
+
+    import signal
+
+    signal.signal(signal.SIGUSR1, lambda signum, frame: profiler.dump_csv())
+    signal.signal(signal.SIGUSR2, lambda signum, frame: profiler.toggle_overlay())
+
+
+def create_game_loop(render) -> GameLoop:
+    return GameLoop(
+        step_sec=FRAME_TIME_SEC,
+        update=handle_game_logic,
+        render=render,
+        max_catch_up=MAX_CATCH_UP_STEPS,
+        max_frame_skip=MAX_FRAME_SKIP,
     )
-    draw_tool = ImageDraw.Draw(canvas)
-    if scene_manager:
-        scene_manager.draw(draw_tool)
-    return canvas
 
 
 def main_loop_windows():
-    global root, device
-    handle_game_logic()
-    pil_image = draw_frame()
+    global root, game_loop
+    if game_loop is None:
+        game_loop = create_game_loop(render_windows)
+    remaining = game_loop.tick()
 
-    if device is not None and root is not None:
-        device.display(pil_image)
-        # Tkinter 이벤트 루프에 다시 예약
-        root.after(int(FRAME_TIME_SEC * 1000), main_loop_windows)
+    if root is not None:
+        # 다음 프레임 시각(절대 시각 기준)에 맞춰 Tkinter 이벤트 루프에 다시 예약
+        root.after(math.ceil(remaining * 1000), main_loop_windows)
 
 
 def main_loop_rpi():
-    global device
-    while True:
-        start_time = time.time()
-        handle_game_logic()
-        pil_image = draw_frame()
-        if device is not None:
-            device.display(pil_image)
-        elapsed = time.time() - start_time
-        sleep_time = max(0, FRAME_TIME_SEC - elapsed)
-        time.sleep(sleep_time)
+    global game_loop
+    game_loop = create_game_loop(render_rpi)
+    game_loop.run()
 
 
 # ============
@@ -129,6 +196,7 @@ def main_loop_rpi():
 # ============
 def main():
     global db, timer_manager, audio_manager, scene_manager, input_manager, root, device
+    global render_manager, display_manager
 
     try:
         print(">>> 프로그램 초기화 시작...")
@@ -203,6 +271,15 @@ def main():
                 rotate=DISPLAY_ROTATE,
             )
 
+        # set render / display manager
+        render_manager = RenderManager()
+        display_manager = DisplayManager()
+        display_manager.set_device(device)
+        setup_profiler_controls()
+        if not IS_WINDOWS:
+            # Tkinter는 메인 스레드에서만 그릴 수 있으므로 RPi에서만 출력 스레드 사용
+            display_manager.start_worker()
+
         # set timer_manager
         timer_manager = TimerManager()
         timer_manager.start()
@@ -0,0 +1,74 @@
+from typing import Iterable, List, Tuple
+
+from classes.mushroom_class import MushroomType
+from classes.render_size import RenderSize
+from settings.mushitroom_config import ZOOM_IN
+from settings.mushitroom_enums import FontStyle
+
+# resource_loader 캐시 키와 같은 모양
+ImageKey = Tuple[str, int, int]  # (경로, 너비, 높이)
+FontKey = Tuple[str, int]  # (경로, 크기)
+
+_BUTTON_IMAGE = "./src/assets/images/button.png"
+
+
+class AssetManifest:
+    """
+    씬이 쓰는 이미지/폰트 목록 (AssetPreloader가 미리 불러옴)
+
+    크기는 컴포넌트에 넘기는 것과 같은 논리 크기로 적고, ZOOM_IN은 여기서 곱합니다.
+    컴포넌트가 resource_loader에 요청하는 키와 정확히 같아야 캐시가 맞습니다.
+    """
+
+    images: List[ImageKey]
+    fonts: List[FontKey]
+
+    def __init__(self) -> None:
+        self.images = []
+        self.fonts = []
+
+    def __len__(self) -> int:
+        return len(self.images) + len(self.fonts)
+
+    def add_image(self, src: str, size: RenderSize) -> "AssetManifest":
+        """RenderImage(size=size, src=src)"""
+        key = (src, size.width * ZOOM_IN, size.height * ZOOM_IN)
+        if key not in self.images:
+            self.images.append(key)
+        return self
+
+    def add_font(self, font_style: FontStyle, font_size: int) -> "AssetManifest":
+        """RenderText(font_style=font_style, font_size=font_size)"""
+        key = (f"./src/assets/fonts/{font_style.value}", font_size * ZOOM_IN)
+        if key not in self.fonts:
+            self.fonts.append(key)
+        return self
+
+    def add_button(
+        self,
+        size: RenderSize,
+        font_size: int = 15,
+        font_style: FontStyle = FontStyle.COOKIE_BOLD,
+        img_src: str = _BUTTON_IMAGE,
+    ) -> "AssetManifest":
+        """RenderButton (배경 이미지 + 글자)"""
+        return self.add_image(img_src, size).add_font(font_style, font_size)
+
+    def add_cursor(self, size: RenderSize) -> "AssetManifest":
+        """CursorComponent (링 + 모자, 모자 높이는 링의 1/3)"""
+        hat_size = RenderSize(size.width, int(size.height / 3))
+        return self.add_image("./src/assets/images/cursor_ring.png", size).add_image(
+            "./src/assets/images/cursor_hat.png", hat_size
+        )
+
+    def add_mushrooms(
+        self, mushroom_types: Iterable[MushroomType], size: RenderSize
+    ) -> "AssetManifest":
+        """MushroomComponent (종류마다 1~5 방향 이미지)"""
+        for mushroom_type in mushroom_types:
+            for direction in range(1, 6):
+                self.add_image(
+                    f"./src/assets/images/{mushroom_type.image_name}{direction}.png",
+                    size,
+                )
+        return self
@@ -0,0 +1,232 @@
+import bisect
+import json
+from abc import ABC, abstractmethod
+import os
+import subprocess
+import threading
+import time
+import wave
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class AudioBackend(ABC):
+    """
+    AudioMixer가 섞은 PCM(S16_LE)을 받는 출력
+
+    - open(): 믹서가 시작할 때 한 번
+    - write(): period마다 (믹싱 스레드). 출력이 끊겼으면 False
+    - close(): 믹서가 멈출 때
+    is_device_backend가 True면 실제 오디오 장치가 있어야 하므로 AudioManager가 장치를 점검합니다.
+    """
+
+    name: str = "base"
+    is_device_backend: bool = False
+
+    def open(
+        self, sample_rate: int, channels: int, period_frames: int, latency_ms: int
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def write(self, data: bytes) -> bool:
+        """PCM 한 period를 보냅니다. 출력이 끊겼으면 False"""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class AplayBackend(AudioBackend):
+    """aplay 하나를 계속 띄워 두고 stdin으로 raw PCM을 보냄 (Linux 기본)"""
+
+    name = "aplay"
+    is_device_backend = True
+
+    def __init__(self) -> None:
+        self._process: Optional[subprocess.Popen] = None
+
+    def open(
+        self, sample_rate: int, channels: int, period_frames: int, latency_ms: int
+    ) -> None:
+        buffer_us = latency_ms * 1000
+        process = subprocess.Popen(
+            [
+                "aplay",
+                "-q",
+                "-t",
+                "raw",
+                "-f",
+                "S16_LE",
+                "-c",
+                str(channels),
+                "-r",
+                str(sample_rate),
+                f"--buffer-time={buffer_us}",
+            ],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        # 파이프 버퍼(기본 64KB = 약 0.4초)에 쌓이는 만큼 소리가 늦어지므로 줄여 둠
+        set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None) if fcntl else None
+        if set_pipe_size is not None and process.stdin is not None:
+            period_bytes = period_frames * channels * 2
+            try:
+                fcntl.fcntl(
+                    process.stdin.fileno(), set_pipe_size, max(4096, period_bytes * 2)
+                )
+            except OSError:
+                pass
+        self._process = process
+
+    def write(self, data: bytes) -> bool:
+        process = self._process
+        if process is None or process.stdin is None:
+            return False
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(process.stdin.fileno(), view)
+                view = view[written:]
+            return True
+        except (BrokenPipeError, OSError) as e:
+            print(f"⚠️ 오디오 출력이 끊겼습니다 (믹서 중지): {e}")
+            return False
+
+    def close(self) -> None:
+        if self._process is None:
+            return
+        try:
+            if self._process.stdin is not None:
+                self._process.stdin.close()
+            self._process.terminate()
+        except Exception:
+            pass
+        self._process = None
+
+
+class NullAudioBackend(AudioBackend):
+    """소리 장치 없이 실행할 때 쓰는 출력. 받은 내용은 버리고 양만 셉니다."""
+
+    name = "null"
+
+    frames_written: int
+    bytes_written: int
+
+    def __init__(self) -> None:
+        self.frames_written = 0
+        self.bytes_written = 0
+        self._frame_bytes = 4
+
+    def open(
+        self, sample_rate: int, channels: int, period_frames: int, latency_ms: int
+    ) -> None:
+        self._frame_bytes = channels * 2
+
+    def write(self, data: bytes) -> bool:
+        self.bytes_written += len(data)
+        self.frames_written += len(data) // self._frame_bytes
+        return True
+
+
+class RecordingAudioBackend(NullAudioBackend):
+    """
+    NullAudioBackend + 기록
+    - periods: (쓴 시각, 시작 프레임, 소리가 있었는지) 목록. 시각은 time.perf_counter()
+    - path를 주면 받은 PCM을 WAV로 저장하고, 닫을 때 시각 목록을 "<path>.times.json"으로 저장
+    - wait_for_sound(): 어떤 시각 이후 처음으로 소리가 담긴 period를 기다림 (지연 측정용)
+    """
+
+    name = "record"
+
+    periods: List[Tuple[float, int, bool]]
+
+    def __init__(self, path: str | None = None) -> None:
+        super().__init__()
+        self.path = path
+        self.periods = []
+        self.sample_rate = 0
+        self.channels = 0
+        self._wav_file: wave.Wave_write | None = None
+        self._silence = b""
+        self._written = threading.Condition()
+
+    def open(
+        self, sample_rate: int, channels: int, period_frames: int, latency_ms: int
+    ) -> None:
+        super().open(sample_rate, channels, period_frames, latency_ms)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._silence = bytes(period_frames * channels * 2)
+        if self.path is not None:
+            wav_file = wave.open(self.path, "wb")
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            self._wav_file = wav_file
+
+    def write(self, data: bytes) -> bool:
+        start_frame = self.frames_written
+        super().write(data)
+        has_sound = data != self._silence and data.count(0) != len(data)
+        with self._written:
+            self.periods.append((time.perf_counter(), start_frame, has_sound))
+            self._written.notify_all()
+        if self._wav_file is not None:
+            self._wav_file.writeframesraw(data)
+        return True
+
+    def wait_for_sound(self, after: float, timeout: float) -> float | None:
+        """after 이후에 쓴 period 중 처음으로 소리가 있는 것의 시각. 없으면 None"""
+        deadline = time.perf_counter() + timeout
+        with self._written:
+            # 시각 순서로 쌓이므로 after 이전은 건너뜀
+            checked = bisect.bisect_left(self.periods, after, key=lambda p: p[0])
+            while True:
+                for written_at, _, has_sound in self.periods[checked:]:
+                    if has_sound and written_at >= after:
+                        return written_at
+                checked = len(self.periods)
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                self._written.wait(remaining)
+
+    def close(self) -> None:
+        if self._wav_file is None:
+            return
+        self._wav_file.close()
+        self._wav_file = None
+
+        times_path = f"{self.path}.times.json"
+        first_time = self.periods[0][0] if self.periods else 0.0
+        with open(times_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "sample_rate": self.sample_rate,
+                    "channels": self.channels,
+                    # [녹음 시작부터 초, 시작 프레임, 소리 여부]
+                    "periods": [
+                        [round(written_at - first_time, 6), frame, has_sound]
+                        for written_at, frame, has_sound in self.periods
+                    ],
+                },
+                f,
+            )
+        print(f"🔊 오디오 녹음 저장: {self.path} (+ {os.path.basename(times_path)})")
+
+
+def create_audio_backend(name: str, record_path: str | None = None) -> AudioBackend:
+    """설정 이름으로 출력을 만듭니다. ("aplay" / "null" / "record")"""
+    if name == "null":
+        return NullAudioBackend()
+    if name == "record":
+        return RecordingAudioBackend(record_path)
+    if name != "aplay":
+        print(f"⚠️ 알 수 없는 오디오 출력 '{name}', aplay를 사용합니다.")
+    return AplayBackend()
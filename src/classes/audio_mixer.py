@@ -0,0 +1,476 @@
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from classes.audio_backend import AplayBackend, AudioBackend
+from utils.pcm import WavStream
+
+
+# 버스: 소리를 종류별로 모아 볼륨을 따로 적용하는 단위
+BUS_BGM = "bgm"
+BUS_SFX = "sfx"
+
+
+class GainRamp:
+    """
+    볼륨 값 하나. set_target()으로 바꾸면 frame_count 프레임 동안 직선으로 바뀝니다.
+    (한 번에 바꾸면 파형이 튀어 '틱' 소리가 남)
+    """
+
+    value: float
+    target: float
+
+    def __init__(self, value: float = 1.0) -> None:
+        self.value = value
+        self.target = value
+        # 한 프레임에 바뀌는 양 (0이면 바뀌는 중 아님)
+        self._step = 0.0
+        # set_target(오디오 작업 스레드)과 next(믹싱 스레드)가 value/target/_step을 함께 바꿈
+        self._lock = threading.Lock()
+
+    @property
+    def is_ramping(self) -> bool:
+        return self._step != 0.0
+
+    def set_target(self, target: float, frame_count: int) -> None:
+        """아무 스레드에서나 부를 수 있음"""
+        with self._lock:
+            self.target = target
+            if frame_count <= 0 or target == self.value:
+                self._step = 0.0
+                self.value = target
+            else:
+                self._step = (target - self.value) / frame_count
+
+    def snap(self) -> None:
+        """바뀌는 중이면 바로 목표 값으로"""
+        with self._lock:
+            self._step = 0.0
+            self.value = self.target
+
+    def next(self, frame_count: int) -> "float | np.ndarray":
+        """
+        다음 frame_count 프레임의 gain (믹싱 스레드에서 부름)
+        바뀌는 중이 아니면 float, 바뀌는 중이면 (frame_count, 1) 배열
+        """
+        with self._lock:
+            step = self._step
+            if step == 0.0:
+                return self.value
+            ramp = self.value + step * np.arange(1, frame_count + 1, dtype=np.float32)
+            if step > 0:
+                np.minimum(ramp, self.target, out=ramp)
+            else:
+                np.maximum(ramp, self.target, out=ramp)
+            # float32 배열 값은 float64 target(0.3 등)과 정확히 같아지지 않으므로
+            # 도달 여부는 float64로 따지고, 도달하면 target을 그대로 씀
+            end = self.value + step * frame_count
+            if (end >= self.target) if step > 0 else (end <= self.target):
+                self.value = self.target
+                self._step = 0.0
+            else:
+                self.value = end
+            return ramp[:, None]
+
+
+class MixerVoice:
+    """지금 재생 중인 소리 하나 (PCM 버퍼와 읽은 위치)"""
+
+    samples: "np.ndarray"
+    position: int
+    gain: GainRamp
+    bus: str
+    # 다른 소리에 자리를 내주고 줄어드는 중 (동시 재생 수에 세지 않음)
+    is_stopping: bool
+
+    def __init__(self, samples: "np.ndarray", gain: float, bus: str = BUS_SFX) -> None:
+        self.samples = samples
+        self.position = 0
+        self.gain = GainRamp(gain)
+        self.bus = bus
+        self.is_stopping = False
+
+    @property
+    def is_finished(self) -> bool:
+        if self.position >= len(self.samples):
+            return True
+        return self.is_stopping and not self.gain.is_ramping and self.gain.value <= 0
+
+    def fade_out(self, frame_count: int) -> None:
+        """frame_count 프레임 동안 줄이고 끝냄 (바로 끊으면 '틱' 소리가 남)"""
+        self.is_stopping = True
+        self.gain.set_target(0.0, frame_count)
+
+    def mix_into(self, bus_buffer: "np.ndarray", frame_count: int) -> None:
+        chunk = self.samples[self.position : self.position + frame_count]
+        count = len(chunk)
+        gain = self.gain.next(count)
+        if isinstance(gain, float) and gain == 1.0:
+            bus_buffer[:count] += chunk
+        else:
+            bus_buffer[:count] += chunk * gain
+        self.position += count
+
+    def stop(self) -> None:
+        self.position = len(self.samples)
+
+
+class StreamVoice:
+    """
+    파일에서 조금씩 읽으며 재생하는 소리 (BGM)
+    fade()로 gain을 천천히 바꾸고, 0까지 줄이며 멈추면 다 줄어든 뒤 끝납니다.
+    """
+
+    stream: WavStream
+    gain: GainRamp
+    bus: str
+
+    def __init__(
+        self, stream: WavStream, gain: float = 1.0, bus: str = BUS_BGM
+    ) -> None:
+        self.stream = stream
+        self.gain = GainRamp(gain)
+        self.bus = bus
+        self._stop_after_fade = False
+        self._is_stopped = False
+
+    @property
+    def is_finished(self) -> bool:
+        return self._is_stopped or self.stream.is_finished
+
+    def fade(self, target_gain: float, frame_count: int, stop: bool = False) -> None:
+        """
+        frame_count 프레임 동안 gain을 target_gain까지 바꿉니다. (아무 스레드에서나)
+        :param stop: 다 바뀌면 재생을 끝냄 (페이드 아웃)
+        """
+        self._stop_after_fade = stop
+        self.gain.set_target(target_gain, frame_count)
+
+    def mix_into(self, bus_buffer: "np.ndarray", frame_count: int) -> None:
+        if self._is_stopped:
+            return
+        chunk = self.stream.read(frame_count)
+        count = len(chunk)
+        gain = self.gain.next(count)
+        if isinstance(gain, float) and gain == 1.0:
+            bus_buffer[:count] += chunk
+        else:
+            bus_buffer[:count] += chunk * gain
+
+        if self._stop_after_fade and not self.gain.is_ramping and self.gain.value <= 0:
+            self._is_stopped = True
+
+    def stop(self) -> None:
+        """페이드 없이 바로 끝냄"""
+        self._is_stopped = True
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class AudioMixer:
+    """
+    효과음 / BGM 믹서
+
+    출력(AudioBackend, 기본은 계속 띄워 둔 aplay 하나)에 raw PCM(S16_LE)을 보냅니다.
+    믹싱 스레드가 period_frames씩 재생 중인 소리를 NumPy로 더해서 쓰고,
+    재생할 것이 없으면 무음을 씁니다. (aplay가 멈추지 않아야 다음 소리가 바로 나옴)
+
+    - play(): 미리 디코딩한 PCM 버퍼를 목록에 넣기만 함 (프로세스 생성 없음)
+    - play_stream(): 파일에서 읽으며 재생하는 소리(BGM)를 같은 출력에 섞음
+    - 볼륨: 소리를 버스(BGM / SFX)별로 모아 버스 gain을 곱하고, 합친 뒤 master gain을 곱함
+      (amixer처럼 ALSA 전체 볼륨을 바꾸지 않으므로 BGM과 효과음 크기를 따로 정할 수 있음)
+    - 덕킹: 효과음이 나는 동안 BGM 버스를 duck_gain까지 줄였다가 끝나면 되돌림
+    - 동시 재생 수: play()로 시작한 소리는 max_voices개까지. 넘으면 가장 오래 재생된 소리를
+      짧게 줄이고 빼거나 (steal_voices) 새 소리를 버림. 입력이 몰려도 믹싱 비용이 일정함
+    - 출력 장치보다 latency_ms 이상 앞서 쓰지 않도록 기다리므로
+      play() 후 소리가 나기까지 최대 latency_ms + period 정도 걸립니다.
+    """
+
+    sample_rate: int
+    channels: int
+    period_frames: int
+    latency_ms: int
+    # 출력에 쓴 프레임 수 (속도 조절 기준)
+    frames_written: int
+    # play()로 동시에 재생하는 최대 수 (0이면 제한 없음)
+    max_voices: int
+    steal_voices: bool
+    # 시작한 / 자리가 없어 버린 / 자리를 빼앗긴 소리 수
+    played_count: int
+    dropped_count: int
+    stolen_count: int
+    # 지금까지 출력한 프레임 수 / 믹싱 스레드가 쓴 CPU 시간 (잠든 시간 제외)
+    total_frames: int
+    cpu_seconds: float
+    # 출력보다 latency 이상 늦어져 기준 시각을 다시 잡은 횟수 (소리가 끊겼을 수 있음)
+    late_count: int
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int,
+        period_frames: int,
+        latency_ms: int,
+        max_voices: int = 0,
+        steal_voices: bool = True,
+        steal_fade_ms: int = 5,
+        backend: AudioBackend | None = None,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.period_frames = period_frames
+        self.latency_ms = latency_ms
+        self.frames_written = 0
+
+        self.max_voices = max_voices
+        self.steal_voices = steal_voices
+        self._steal_fade_frames = self.ms_to_frames(steal_fade_ms)
+        self.played_count = 0
+        self.dropped_count = 0
+        self.stolen_count = 0
+        self.total_frames = 0
+        self.cpu_seconds = 0.0
+        self.late_count = 0
+        self.backend = backend if backend is not None else AplayBackend()
+
+        self._voices: List[Union[MixerVoice, StreamVoice]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._silence = bytes(period_frames * channels * 2)
+
+        self.master_gain = GainRamp(1.0)
+        self.bus_gains: Dict[str, GainRamp] = {
+            BUS_BGM: GainRamp(1.0),
+            BUS_SFX: GainRamp(1.0),
+        }
+        # 덕킹 (duck_gain = 1이면 사용 안 함)
+        self._duck = GainRamp(1.0)
+        self._duck_gain = 1.0
+        self._duck_attack_frames = 0
+        self._duck_release_frames = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> bool:
+        """출력과 믹싱 스레드를 시작합니다. 실패하면 False"""
+        if self._running:
+            return True
+        if np is None:
+            print("⚠️ numpy가 없어 효과음 믹서를 쓸 수 없습니다.")
+            return False
+
+        try:
+            self.backend.open(
+                self.sample_rate, self.channels, self.period_frames, self.latency_ms
+            )
+        except Exception as e:
+            print(f"⚠️ 오디오 출력 시작 실패: {e}")
+            return False
+
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._mix_loop, name="audio-mixer", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        try:
+            self.backend.close()
+        except Exception as e:
+            print(f"⚠️ 오디오 출력 닫기 실패: {e}")
+        with self._lock:
+            voices = self._voices
+            self._voices = []
+        for voice in voices:
+            if isinstance(voice, StreamVoice):
+                voice.close()
+
+    def play(
+        self, samples: "np.ndarray", gain: float = 1.0, bus: str = BUS_SFX
+    ) -> bool:
+        """
+        소리를 섞기 시작합니다. (바로 반환)
+        :param samples: int16 (프레임 수, channels) 배열
+        :return: 자리가 없어 버렸으면 False
+        """
+        if not self._running or gain <= 0 or len(samples) == 0:
+            return False
+        with self._lock:
+            if self.max_voices > 0:
+                playing = [
+                    voice
+                    for voice in self._voices
+                    if isinstance(voice, MixerVoice) and not voice.is_stopping
+                ]
+                if len(playing) >= self.max_voices:
+                    if not self.steal_voices:
+                        self.dropped_count += 1
+                        return False
+                    # 가장 많이 재생된 (= 가장 먼저 시작한) 소리의 자리를 빼앗음
+                    oldest = max(playing, key=lambda voice: voice.position)
+                    oldest.fade_out(self._steal_fade_frames)
+                    self.stolen_count += 1
+            self._voices.append(MixerVoice(samples, gain, bus))
+            self.played_count += 1
+        return True
+
+    def get_voice_count(self) -> int:
+        with self._lock:
+            return len(self._voices)
+
+    def play_stream(self, voice: StreamVoice) -> bool:
+        """스트림 재생을 시작합니다. 끝나거나 페이드 아웃되면 믹서가 닫습니다."""
+        if not self._running:
+            return False
+        with self._lock:
+            self._voices.append(voice)
+        return True
+
+    def ms_to_frames(self, milliseconds: int) -> int:
+        return self.sample_rate * milliseconds // 1000
+
+    def get_stats(self) -> Dict[str, float | int | str]:
+        audio_seconds = self.total_frames / self.sample_rate
+        return {
+            "backend": self.backend.name,
+            "audio_sec": round(audio_seconds, 3),
+            "cpu_sec": round(self.cpu_seconds, 4),
+            # 소리 1초를 만드는 데 쓴 CPU 시간 (ms)
+            "cpu_ms_per_audio_sec": (
+                round(self.cpu_seconds * 1000 / audio_seconds, 3)
+                if audio_seconds > 0
+                else 0.0
+            ),
+            "late": self.late_count,
+            "played": self.played_count,
+            "dropped": self.dropped_count,
+            "stolen": self.stolen_count,
+        }
+
+    # --- 볼륨 ---
+
+    def set_master_gain(self, gain: float, ramp_ms: int = 0) -> None:
+        self.master_gain.set_target(gain, self.ms_to_frames(ramp_ms))
+
+    def set_bus_gain(self, bus: str, gain: float, ramp_ms: int = 0) -> None:
+        self.bus_gains[bus].set_target(gain, self.ms_to_frames(ramp_ms))
+
+    def set_ducking(self, duck_gain: float, attack_ms: int, release_ms: int) -> None:
+        """
+        효과음이 나는 동안 BGM 버스에 곱할 gain
+        :param attack_ms: 줄이는 시간 / release_ms: 되돌리는 시간
+        """
+        self._duck_gain = duck_gain
+        self._duck_attack_frames = self.ms_to_frames(attack_ms)
+        self._duck_release_frames = self.ms_to_frames(release_ms)
+
+    # --- 내부 ---
+
+    def _mix_loop(self) -> None:
+        start_time = time.perf_counter()
+        latency = self.latency_ms / 1000
+        bus_buffers = {
+            bus: np.zeros((self.period_frames, self.channels), dtype=np.float32)
+            for bus in self.bus_gains
+        }
+
+        while self._running:
+            # 출력 장치보다 너무 앞서 쓰지 않도록 (앞선 만큼 소리가 늦게 나옴)
+            ahead = self.frames_written / self.sample_rate - (
+                time.perf_counter() - start_time
+            )
+            if ahead > latency:
+                time.sleep(ahead - latency)
+            elif ahead < -latency:
+                # 한참 밀렸으면 (스레드가 멈췄던 경우) 기준 시각을 다시 잡음
+                start_time = time.perf_counter()
+                self.frames_written = 0
+                self.late_count += 1
+
+            cpu_start = time.thread_time()
+            data = self._mix_period(bus_buffers)
+            is_written = self.backend.write(data)
+            self.cpu_seconds += time.thread_time() - cpu_start
+            if not is_written:
+                self._running = False
+                return
+            self.frames_written += self.period_frames
+            self.total_frames += self.period_frames
+
+    def _mix_period(self, bus_buffers: Dict[str, "np.ndarray"]) -> bytes:
+        with self._lock:
+            voices = list(self._voices)
+        if not voices:
+            # 들리는 것이 없으니 바뀌던 볼륨은 바로 목표 값으로
+            self.master_gain.snap()
+            for bus_gain in self.bus_gains.values():
+                bus_gain.snap()
+            self._duck.set_target(1.0, 0)
+            return self._silence
+
+        frame_count = self.period_frames
+        active_buses = set()
+        for bus_buffer in bus_buffers.values():
+            bus_buffer.fill(0)
+        for voice in voices:
+            try:
+                voice.mix_into(bus_buffers[voice.bus], frame_count)
+                active_buses.add(voice.bus)
+            except Exception as e:
+                # 파일을 읽다 실패한 스트림 등은 빼고 계속 재생
+                print(f"⚠️ 소리 재생 실패 (건너뜀): {e}")
+                voice.stop()
+
+        with self._lock:
+            finished = [voice for voice in self._voices if voice.is_finished]
+            if finished:
+                self._voices = [v for v in self._voices if not v.is_finished]
+        for voice in finished:
+            if isinstance(voice, StreamVoice):
+                voice.close()
+
+        # 덕킹: 이번 period에 효과음이 있었으면 줄이고, 없으면 되돌림
+        if self._duck_gain < 1.0:
+            if BUS_SFX in active_buses:
+                duck_target, duck_frames = self._duck_gain, self._duck_attack_frames
+            else:
+                duck_target, duck_frames = 1.0, self._duck_release_frames
+            if self._duck.target != duck_target:
+                self._duck.set_target(duck_target, duck_frames)
+
+        mixed = None
+        for bus, bus_buffer in bus_buffers.items():
+            if bus not in active_buses:
+                # 들리지 않는 버스의 볼륨 변화는 기다릴 필요 없음
+                self.bus_gains[bus].snap()
+                if bus == BUS_BGM:
+                    self._duck.snap()
+                continue
+            gain = self.bus_gains[bus].next(frame_count)
+            if bus == BUS_BGM:
+                gain = gain * self._duck.next(frame_count)
+            bus_buffer *= gain
+            if mixed is None:
+                mixed = bus_buffer
+            else:
+                mixed += bus_buffer
+        if mixed is None:
+            return self._silence
+
+        mixed *= self.master_gain.next(frame_count)
+        np.clip(mixed, -32768, 32767, out=mixed)
+        return mixed.astype("<i2").tobytes()
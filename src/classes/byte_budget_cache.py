@@ -0,0 +1,141 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Set, TypeVar
+
+from PIL import Image
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+POLICY_LRU = "lru"
+POLICY_LFU = "lfu"
+
+
+def get_image_byte_size(image: Image.Image) -> int:
+    """디코딩된 이미지가 차지하는 메모리 (채널 수 x 너비 x 높이)"""
+    return len(image.getbands()) * image.width * image.height
+
+
+class ByteBudgetCache(Generic[K, V]):
+    """
+    메모리 한도(byte)가 있는 캐시
+
+    - 넣을 때 항목 크기를 같이 받고, 합이 max_bytes를 넘으면 덜 쓴 것부터 버립니다.
+      lru: 가장 오래 안 쓴 것 / lfu: 가장 적게 쓴 것 (같으면 오래 안 쓴 것)
+    - pin()한 키는 버리지 않습니다. (커서처럼 항상 보이는 에셋)
+    - 방금 넣은 항목은 한도보다 커도 남깁니다. (바로 다시 읽게 되므로)
+    - hits / misses / evictions를 셉니다.
+    - 버려도 그 값을 들고 있는 컴포넌트가 있으면 메모리는 그대로입니다.
+      (한도는 '캐시만 붙잡고 있는' 메모리를 제한)
+
+    AssetPreloader 스레드도 넣으므로 lock으로 보호합니다.
+    """
+
+    name: str
+    max_bytes: int
+    policy: str
+    used_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, name: str, max_bytes: int, policy: str = POLICY_LRU) -> None:
+        if policy not in (POLICY_LRU, POLICY_LFU):
+            print(f"⚠️ 알 수 없는 캐시 정책: {policy} (lru 사용)")
+            policy = POLICY_LRU
+        self.name = name
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        # 키 -> (값, 크기). 앞쪽일수록 오래 안 쓴 것
+        self._entries: "OrderedDict[K, tuple[V, int]]" = OrderedDict()
+        self._use_counts: Dict[K, int] = {}
+        self._pinned: Set[K] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        """통계를 바꾸지 않고 들어 있는지만 확인"""
+        return key in self._entries
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            self._use_counts[key] += 1
+            return entry[0]
+
+    def put(self, key: K, value: V, byte_size: int) -> None:
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self.used_bytes -= old_entry[1]
+            self._entries[key] = (value, byte_size)
+            self._use_counts[key] = self._use_counts.get(key, 0) + 1
+            self.used_bytes += byte_size
+            self._evict_over_budget(keep=key)
+
+    def pin(self, key: K) -> None:
+        """key는 한도를 넘어도 버리지 않습니다. (아직 캐시에 없어도 미리 지정 가능)"""
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: K) -> None:
+        with self._lock:
+            self._pinned.discard(key)
+            self._evict_over_budget(keep=None)
+
+    def clear(self) -> None:
+        """모든 항목을 버립니다. (pin 지정과 통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._use_counts.clear()
+            self.used_bytes = 0
+
+    def get_stats(self) -> Dict[str, int | str]:
+        with self._lock:
+            return {
+                "policy": self.policy,
+                "entries": len(self._entries),
+                "pinned": sum(1 for key in self._pinned if key in self._entries),
+                "used_bytes": self.used_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _evict_over_budget(self, keep: Optional[K]) -> None:
+        """[내부 함수] lock을 잡은 상태에서 호출"""
+        while self.used_bytes > self.max_bytes:
+            victim = self._pick_victim(keep)
+            if victim is None:
+                return  # 남은 것이 모두 pin 되었거나 방금 넣은 것
+            _, byte_size = self._entries.pop(victim)
+            del self._use_counts[victim]
+            self.used_bytes -= byte_size
+            self.evictions += 1
+
+    def _pick_victim(self, keep: Optional[K]) -> Optional[K]:
+        victim: Optional[K] = None
+        victim_count = 0
+        for key in self._entries:  # 오래 안 쓴 것부터
+            if key == keep or key in self._pinned:
+                continue
+            if self.policy == POLICY_LRU:
+                return key
+            count = self._use_counts[key]
+            if victim is None or count < victim_count:
+                victim = key
+                victim_count = count
+        return victim
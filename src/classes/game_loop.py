@@ -0,0 +1,116 @@
+import time
+from typing import Callable
+
+
+class GameLoop:
+    """
+    고정 timestep 게임 루프 드라이버
+
+    - 시계는 time.monotonic (시스템 시간이 바뀌어도 튀지 않음)
+    - update()는 항상 step_sec 간격으로 실행하고, 늦었으면 여러 번 실행해서 따라잡습니다.
+    - 따라잡는 중(다음 update 시간이 이미 지남)이면 render()를 건너뜁니다.
+      단, 화면이 멈추지 않도록 max_frame_skip번 연속으로 건너뛰면 한 번은 그립니다.
+    - 다음 프레임 시간은 '시작 시각 + n * step' 절대 시각으로 계산해 sleep 오차가 쌓이지 않습니다.
+    """
+
+    step_sec: float
+    max_catch_up: int
+    max_frame_skip: int
+
+    # 통계
+    frame_count: int
+    update_count: int
+    skipped_renders: int
+    dropped_steps: int
+
+    def __init__(
+        self,
+        step_sec: float,
+        update: Callable[[], None],
+        render: Callable[[], None],
+        max_catch_up: int = 5,
+        max_frame_skip: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        :param max_catch_up: 한 번에 몰아서 실행할 최대 update 횟수. 넘으면 밀린 시간은 버림
+        :param max_frame_skip: 연속으로 render를 건너뛸 수 있는 최대 횟수
+        """
+        self.step_sec = step_sec
+        self.max_catch_up = max_catch_up
+        self.max_frame_skip = max_frame_skip
+        self._update = update
+        self._render = render
+        self._clock = clock
+        self._sleep = sleep
+
+        self._running = False
+        self._next_deadline: float | None = None
+        self._skipped_in_row = 0
+
+        self.frame_count = 0
+        self.update_count = 0
+        self.skipped_renders = 0
+        self.dropped_steps = 0
+
+    def reset(self) -> None:
+        """기준 시각을 지금으로 맞춥니다. (오래 멈췄다가 다시 돌릴 때)"""
+        self._next_deadline = self._clock()
+        self._skipped_in_row = 0
+
+    def tick(self) -> float:
+        """
+        밀린 update를 실행하고, 여유가 있으면 render까지 합니다.
+        :return: 다음 프레임까지 남은 시간(초). root.after 예약 등에 사용
+        """
+        if self._next_deadline is None:
+            self.reset()
+        assert self._next_deadline is not None
+
+        # 1. 고정 timestep update (밀린 만큼 따라잡기)
+        now = self._clock()
+        steps = 0
+        while now >= self._next_deadline and steps < self.max_catch_up:
+            self._update()
+            self.update_count += 1
+            self._next_deadline += self.step_sec
+            steps += 1
+            now = self._clock()
+
+        if now >= self._next_deadline + self.step_sec:
+            # 너무 밀렸음 (디버거 정지, 긴 로딩 등): 따라잡기를 포기하고 기준을 다시 잡음
+            missed = int((now - self._next_deadline) // self.step_sec)
+            self.dropped_steps += missed
+            self._next_deadline += missed * self.step_sec
+
+        # 2. render (다음 update 시간이 이미 지났으면 건너뜀)
+        if steps > 0:
+            is_behind = self._clock() >= self._next_deadline
+            if is_behind and self._skipped_in_row < self.max_frame_skip:
+                self._skipped_in_row += 1
+                self.skipped_renders += 1
+            else:
+                self._render()
+                self.frame_count += 1
+                self._skipped_in_row = 0
+
+        return max(0.0, self._next_deadline - self._clock())
+
+    def run(self) -> None:
+        """stop()이 호출될 때까지 루프를 돌립니다. (블로킹)"""
+        self._running = True
+        self.reset()
+        while self._running:
+            self.tick()
+            self._sleep_until_deadline()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _sleep_until_deadline(self) -> None:
+        if self._next_deadline is None:
+            return
+        remaining = self._next_deadline - self._clock()
+        if remaining > 0:
+            self._sleep(remaining)
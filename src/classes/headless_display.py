@@ -0,0 +1,98 @@
+import time
+from typing import Any, List, Tuple
+
+from PIL import Image
+
+
+class NullSpi:
+    """보낸 바이트 수만 세는 가짜 spidev"""
+
+    bytes_written: int
+    transfers: int
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+        self.transfers = 0
+
+    def writebytes2(self, data: Any) -> None:
+        self.bytes_written += len(data)
+        self.transfers += 1
+
+
+class RecordingSpi(NullSpi):
+    """
+    NullSpi + 전송 기록
+    - payloads: writebytes2로 받은 바이트 목록 (RecordingDisplay.transfers의 창과 순서가 같음)
+    """
+
+    payloads: List[bytes]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.payloads = []
+
+    def writebytes2(self, data: Any) -> None:
+        super().writebytes2(data)
+        self.payloads.append(bytes(data))
+
+
+class NullDisplay:
+    """
+    화면 없이 실행할 때 쓰는 가짜 ST7789 (luma 장치와 같은 메서드)
+    DisplayManager가 실제 장치와 같은 경로(창 전송, RGB565 변환)를 타도록 set_window/data를 가집니다.
+    받은 내용은 버리고 횟수만 셉니다.
+    """
+
+    width: int
+    height: int
+    rotate: int
+
+    frames: int
+    windows: int
+    bytes_written: int
+
+    def __init__(self, width: int, height: int, rotate: int = 0) -> None:
+        self.width = width
+        self.height = height
+        self.rotate = rotate
+        self.frames = 0
+        self.windows = 0
+        self.bytes_written = 0
+
+    def command(self, cmd: int, *args: int) -> None:
+        pass
+
+    def set_window(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        self.windows += 1
+
+    def data(self, data: Any) -> None:
+        self.bytes_written += len(data)
+
+    def display(self, image: Image.Image) -> None:
+        self.frames += 1
+        self.bytes_written += image.width * image.height * 3
+
+
+class RecordingDisplay(NullDisplay):
+    """
+    NullDisplay + 전송 기록
+    - transfers: (시각, 창 영역) 목록. 전체 화면 전송은 (0, 0, width, height)
+    - last_frame: 마지막으로 display()로 받은 전체 화면
+    """
+
+    transfers: List[Tuple[float, Tuple[int, int, int, int]]]
+    last_frame: Image.Image | None
+
+    def __init__(self, width: int, height: int, rotate: int = 0) -> None:
+        super().__init__(width, height, rotate)
+        self.transfers = []
+        self.last_frame = None
+
+    def set_window(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        super().set_window(x1, y1, x2, y2)
+        self.transfers.append((time.monotonic(), (x1, y1, x2, y2)))
+
+    def display(self, image: Image.Image) -> None:
+        super().display(image)
+        self.transfers.append((time.monotonic(), (0, 0, image.width, image.height)))
+        self.last_frame = image.copy()
@@ -1,10 +1,5 @@
 import src.classes.mushitroom_object as mushitroom_object
-import os
-import io
-import zipfile
-import PIL.ImageFont
 from typing import List, Callable
-import posixpath
 from PIL.ImageDraw import ImageDraw
 
 
@@ -13,6 +8,9 @@ from src.settings.mushitroom_enums import FontStyle
 from src.settings.mushitroom_enums import ObjectType
 from src.utils.none_function import noneFunction
 
+# 다른 컴포넌트와 같은 폰트 캐시/참조 관리를 쓰도록 src. 없이 import
+from managers.asset_registry import AssetRegistry
+
 
 class MushitroomInterfaceObject(mushitroom_object.MushitroomObject):
     text: str | None = ""
@@ -43,56 +41,13 @@ class MushitroomInterfaceObject(mushitroom_object.MushitroomObject):
 
         self.is_focusable = is_focusable  # [추가] 속성 저장
 
-        # 1. 일단 운영체제 기준 경로를 만듭니다.
-        current_dir = os.path.dirname(__file__)
-        font_path = os.path.join(
-            current_dir, "../", "assets", "fonts", font_weight.value
+        # 폰트는 공용 캐시에서 빌림 (인스턴스마다 truetype을 새로 만들지 않음)
+        # 개발 환경 / .pyz 배포 환경 모두 resource_loader가 처리, 실패하면 기본 폰트
+        self.font = (
+            AssetRegistry()
+            .acquire_font(path=f"./src/assets/fonts/{font_weight.value}", size=font_size)
+            .value
         )
-
-        try:
-            # [CASE 1] 개발 환경 (일반 폴더)
-            # OS가 ../ 처리를 알아서 해주므로 그냥 읽힙니다.
-            self.font = PIL.ImageFont.truetype(font_path, font_size)
-
-        except (OSError, FileNotFoundError):
-            # [CASE 2] .pyz 배포 환경
-            # 폰트 로드에 실패하면 Zip 내부라고 가정하고 로직을 실행합니다.
-            try:
-                # 경로 구분자를 무조건 / 로 통일 (Zip은 /만 씁니다)
-                unified_path = font_path.replace("\\", "/")
-
-                if ".pyz/" in unified_path:
-                    # 1. Zip 파일 경로와 내부 경로 쪼개기
-                    zip_file_path, internal_path_raw = unified_path.split(".pyz/")
-                    zip_file_path += ".pyz"
-
-                    # 2. [핵심 수정] 내부 경로의 ".." 계산하기
-                    # 예: "src/classes/../assets/font.ttf" -> "src/assets/font.ttf"로 변환
-                    internal_path_clean = posixpath.normpath(internal_path_raw)
-
-                    # 3. Zip 열고 데이터 읽기
-                    with zipfile.ZipFile(zip_file_path, "r") as z:
-                        # Zip 안에서 파일 찾기 (깨끗해진 경로 사용)
-                        font_data = z.read(internal_path_clean)
-
-                        # 바이트 데이터를 Pillow 폰트로 변환
-                        self.font = PIL.ImageFont.truetype(
-                            io.BytesIO(font_data), font_size
-                        )
-                else:
-                    # .pyz 파일이 아닌데도 못 찾은 경우 (진짜 경로 에러)
-                    print(f"❌ 폰트 경로를 찾을 수 없음: {font_path}")
-                    self.font = PIL.ImageFont.load_default()
-
-            except Exception as e:
-                unified_path = font_path.replace("\\", "/")
-                zip_file_path, internal_path_raw = unified_path.split(".pyz/")
-                internal_path_clean = posixpath.normpath(internal_path_raw)
-                print(f"❌ 폰트 로드 최종 실패 (기본 폰트 사용): {e}")
-                print(
-                    f"   - 시도한 내부 경로: {internal_path_clean if 'internal_path_clean' in locals() else '알수없음'}"
-                )
-                self.font = PIL.ImageFont.load_default()
         self.text = text
         self.text_color = text_color
         self.index = index
@@ -1,12 +1,16 @@
-import os
-from PIL import Image, ImageDraw, UnidentifiedImageError
+from PIL import Image, ImageDraw
 from src.classes.mushitroom_object import MushitroomObject
 from src.settings.mushitroom_enums import ObjectType
 
+# 다른 컴포넌트와 같은 모듈을 쓰도록 src. 없이 import
+# (get_canvas_image가 찾아 둔 캔버스도 같은 모듈이어야 프레임당 한 번만 찾음)
+from utils.sprite_blit import SpriteBlit, get_canvas_image
+from managers.asset_registry import AssetRegistry
+
 
 class PngObject(MushitroomObject):
     href: str
-    _image_cache: Image.Image | None  # 로드된 이미지를 저장할 변수
+    _sprite: SpriteBlit | None  # 붙여넣기 방식(마스크)을 미리 정해 둔 이미지
     velocity_y: float
 
     def __init__(
@@ -23,27 +27,24 @@ class PngObject(MushitroomObject):
     ):
         super().__init__(x, y, width, height, color, object_id, object_type)
         self.href = href
-        self._image_cache = None
+        self._sprite = None
         self._load_and_resize_image()
         self.velocity_y = velocity_y
 
     def _load_and_resize_image(self):
-        """이미지를 로드하고 크기를 조절하여 캐시에 저장합니다."""
-        if not self.href or not os.path.exists(self.href):
+        """이미지를 로드하고 크기를 조절한 뒤 붙여넣기 방식(마스크)을 정해 둡니다."""
+        if not self.href:
             print(f"Warning: Image path not found: {self.href}")
             return
 
-        try:
-            # 이미지 열기 및 RGBA 변환 (투명도 지원)
-            with Image.open(self.href) as img:
-                img = img.convert("RGBA")
-                # 객체의 width, height에 맞춰 리사이징
-                # Pi Zero 성능을 위해 리사이징 품질은 기본값(NEAREST) 또는 BILINEAR 권장
-                self._image_cache = img.resize((self.width, self.height))
-        except UnidentifiedImageError:
-            print(f"Error: Cannot identify image file: {self.href}")
-        except Exception as e:
-            print(f"Error loading image {self.href}: {e}")
+        # 다른 컴포넌트와 같은 캐시(메모리/디스크)에서 빌림 (지금 씬의 scope에 담김)
+        # 예전 img.resize 기본값(BICUBIC)과 같은 결과가 나오도록 리사이즈 방식을 지정
+        self._sprite = AssetRegistry().acquire_sprite(
+            path=self.href,
+            width=self.width,
+            height=self.height,
+            resample=Image.Resampling.BICUBIC,
+        ).value
 
     def update(self):
         # 필요하다면 여기에 애니메이션 로직 추가
@@ -62,17 +63,19 @@ class PngObject(MushitroomObject):
         top_left_x = self.x - half_width
         top_left_y = self.y - half_height
 
-        if self._image_cache:
+        if self._sprite is not None:
             try:
-                # ImageDraw 객체에서 내부 Image 객체를 가져옴 (Pillow 내부 속성 활용)
-                target_image = getattr(canvas, "_image", None) or getattr(
-                    canvas, "im", None
-                )
+                # ImageDraw 객체에서 내부 Image 객체를 가져옴 (프레임마다 한 번만 찾음)
+                target_image = get_canvas_image(canvas)
 
-                if isinstance(target_image, Image.Image):
-                    # 투명도를 살리기 위해 mask=self._image_cache 사용
-                    target_image.paste(
-                        self._image_cache, (top_left_x, top_left_y), self._image_cache
+                if target_image is not None:
+                    # 불투명하면 마스크 없이, 투명도가 있으면 미리 만든 마스크로
+                    self._sprite.paste(
+                        target_image,
+                        (
+                            top_left_x + self._sprite.offset[0],
+                            top_left_y + self._sprite.offset[1],
+                        ),
                     )
                 else:
                     # target_image를 찾을 수 없거나 타입이 안 맞으면 부모의 사각형 그리기(fallback)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Hashable
 
 
 from classes.render_size import RenderSize
@@ -7,12 +7,15 @@ from classes.render_coordinate import RenderCoordinate
 
 if TYPE_CHECKING:
     from PIL.ImageDraw import ImageDraw
+    from classes.render_rect import RenderRect
 
 
 class RenderObject:
     coordinate: "RenderCoordinate"
     size: "RenderSize"
     hidden: bool
+    # True면 draw_clipped()로 일부 영역만 잘라 그릴 수 있음 (이미지 붙여넣기 계열)
+    is_clippable: bool = False
 
     def __init__(
         self, coordinate: RenderCoordinate, size: RenderSize, hidden: bool = False
@@ -31,3 +34,24 @@ class RenderObject:
         if self.hidden == True:
             return
         pass
+
+    def draw_clipped(self, canvas: "ImageDraw", clip: "RenderRect"):
+        """
+        clip 영역 안쪽만 그립니다. is_clippable이 True인 객체만 잘라 그리기를 지원하며,
+        기본 구현은 전체를 그립니다.
+        """
+        self.draw(canvas)
+
+    def get_bounds(self) -> "RenderRect | None":
+        """
+        draw()가 실제로 칠하는 화면 영역을 반환합니다. (dirty rect 계산용)
+        아무것도 그리지 않으면 None
+        """
+        return None
+
+    def render_key(self) -> Hashable:
+        """
+        그려지는 '내용'을 나타내는 값. 위치가 같아도 이 값이 바뀌면 다시 그립니다.
+        """
+        key: Any = (self.hidden,)
+        return key
@@ -0,0 +1,117 @@
+from typing import List, Tuple
+
+
+class RenderRect:
+    """
+    화면 위의 사각 영역
+    left, top은 포함하고 right, bottom은 포함하지 않습니다. (PIL box와 같은 규칙)
+    """
+
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+    def __init__(self, left: int, top: int, right: int, bottom: int) -> None:
+        self.left = int(left)
+        self.top = int(top)
+        self.right = int(right)
+        self.bottom = int(bottom)
+
+    @property
+    def width(self) -> int:
+        return max(0, self.right - self.left)
+
+    @property
+    def height(self) -> int:
+        return max(0, self.bottom - self.top)
+
+    @property
+    def area(self) -> int:
+        return self.width * self.height
+
+    def is_empty(self) -> bool:
+        return self.right <= self.left or self.bottom <= self.top
+
+    def intersects(self, other: "RenderRect") -> bool:
+        return (
+            self.left < other.right
+            and other.left < self.right
+            and self.top < other.bottom
+            and other.top < self.bottom
+        )
+
+    def contains(self, other: "RenderRect") -> bool:
+        return (
+            self.left <= other.left
+            and self.top <= other.top
+            and self.right >= other.right
+            and self.bottom >= other.bottom
+        )
+
+    def union(self, other: "RenderRect") -> "RenderRect":
+        return RenderRect(
+            min(self.left, other.left),
+            min(self.top, other.top),
+            max(self.right, other.right),
+            max(self.bottom, other.bottom),
+        )
+
+    def clip(self, other: "RenderRect") -> "RenderRect | None":
+        """두 영역의 교집합을 반환합니다. 겹치지 않으면 None"""
+        clipped = RenderRect(
+            max(self.left, other.left),
+            max(self.top, other.top),
+            min(self.right, other.right),
+            min(self.bottom, other.bottom),
+        )
+        if clipped.is_empty():
+            return None
+        return clipped
+
+    def inflate(self, amount: int) -> "RenderRect":
+        return RenderRect(
+            self.left - amount,
+            self.top - amount,
+            self.right + amount,
+            self.bottom + amount,
+        )
+
+    def as_box(self) -> Tuple[int, int, int, int]:
+        return (self.left, self.top, self.right, self.bottom)
+
+    def __eq__(self, other: object) -> bool:
+        # isinstance로 거르지 않음: src.classes.render_rect / classes.render_rect 두 경로로
+        # 불러온 RenderRect는 서로 다른 클래스지만 같은 영역이면 같아야 함 (set, 비교)
+        try:
+            return self.as_box() == (other.left, other.top, other.right, other.bottom)
+        except AttributeError:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.as_box())
+
+    def __repr__(self) -> str:
+        return f"RenderRect({self.left}, {self.top}, {self.right}, {self.bottom})"
+
+
+def merge_rects(rects: List[RenderRect], gap: int = 0) -> List[RenderRect]:
+    """
+    겹치거나(gap 이내로) 가까운 영역들을 하나로 합칩니다.
+    SPI 창(window) 전송은 창마다 명령 오버헤드가 있으므로 잘게 쪼개진 영역을 줄입니다.
+    """
+    merged: List[RenderRect] = [r for r in rects if not r.is_empty()]
+    changed = True
+    while changed:
+        changed = False
+        result: List[RenderRect] = []
+        for rect in merged:
+            for i, existing in enumerate(result):
+                if existing.inflate(gap).intersects(rect):
+                    result[i] = existing.union(rect)
+                    changed = True
+                    break
+            else:
+                result.append(rect)
+        merged = result
+    return merged
@@ -1,10 +1,12 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List
 
+from classes.asset_manifest import AssetManifest
 from managers.audio_manager import AudioManager
 from managers.input_manager.input_manager import InputManager
 from managers.sq_manager import SqManager
 from managers.timer_manager import TimerManager
 from managers.ui_component_manager import UiComponentManager
+from settings.mushitroom_enums import SceneType
 
 
 if TYPE_CHECKING:
@@ -13,6 +15,11 @@ if TYPE_CHECKING:
 
 
 class BaseScene:
+    # 이 씬이 쓰는 이미지/폰트 (전환 전에 캐시에 올려 둠)
+    asset_manifest: AssetManifest = AssetManifest()
+    # 이 씬에 있는 동안 미리 불러올 다음 씬들
+    preload_scenes: List[SceneType] = []
+
     _timer_manager: TimerManager
     _scene_manager: "SceneManager"
     _audio_manager: AudioManager
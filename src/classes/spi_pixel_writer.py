@@ -0,0 +1,58 @@
+from typing import Any, Callable
+
+
+class SpiPixelWriter:
+    """
+    픽셀 데이터를 luma를 거치지 않고 spidev로 한 번에 보냅니다.
+    (luma의 data()는 바이트를 list로 바꿔 4KB씩 나눠 보내므로 느림)
+
+    :param spi: spidev.SpiDev 처럼 writebytes2(또는 writebytes)를 가진 객체
+    :param set_data_mode: D/C 핀을 데이터 모드(HIGH)로 바꾸는 함수
+    """
+
+    spi: Any
+    transfer_size: int
+    _set_data_mode: Callable[[], None]
+
+    def __init__(
+        self,
+        spi: Any,
+        set_data_mode: Callable[[], None],
+        transfer_size: int = 4096,
+    ) -> None:
+        self.spi = spi
+        self.transfer_size = transfer_size
+        self._set_data_mode = set_data_mode
+
+    @classmethod
+    def from_luma(cls, serial_interface: Any) -> "SpiPixelWriter | None":
+        """luma.core.interface.serial.spi 에서 spidev와 D/C 핀을 꺼내 만듭니다. 실패하면 None"""
+        spi = getattr(serial_interface, "_spi", None)
+        gpio = getattr(serial_interface, "_gpio", None)
+        dc_pin = getattr(serial_interface, "_DC", None)
+        if spi is None or gpio is None or dc_pin is None:
+            return None
+        if not (hasattr(spi, "writebytes2") or hasattr(spi, "writebytes")):
+            return None
+
+        data_level = getattr(serial_interface, "_data", getattr(gpio, "HIGH", 1))
+        return cls(
+            spi=spi,
+            set_data_mode=lambda: gpio.output(dc_pin, data_level),
+            transfer_size=getattr(serial_interface, "_transfer_size", 4096),
+        )
+
+    def write(self, buffer: bytes) -> None:
+        """RAMWR(0x2C) 이후에 호출해 픽셀 바이트를 그대로 보냅니다."""
+        if not buffer:
+            return
+        self._set_data_mode()
+
+        if hasattr(self.spi, "writebytes2"):
+            # writebytes2는 bytes를 그대로 받고 내부에서 알아서 나눠 보냄
+            self.spi.writebytes2(buffer)
+            return
+
+        view = memoryview(buffer)
+        for start in range(0, len(view), self.transfer_size):
+            self.spi.writebytes(list(view[start : start + self.transfer_size]))
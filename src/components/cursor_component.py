@@ -3,6 +3,7 @@ import math
 from typing import TYPE_CHECKING
 from classes.render_coordinate import RenderCoordinate
 from classes.render_object import RenderObject
+from classes.render_rect import RenderRect
 from classes.render_size import RenderSize
 from components.render_image import RenderImage
 
@@ -18,6 +19,7 @@ class CursorComponent(RenderObject):
     _cursor_hat: RenderImage
     _cursor_ring: RenderImage
     _ring_hidden: bool
+    is_clippable = True
 
     # 애니메이션 설정
     _bounce_amplitude: int = 5
@@ -53,14 +55,45 @@ class CursorComponent(RenderObject):
             src="./src/assets/images/cursor_ring.png",
         )
 
+    def update(self):
+        # 통통 튀는 애니메이션 위치는 그리기 전에 한 번만 계산합니다.
+        # (draw 중에 다시 계산하면 dirty rect 계산 시점과 위치가 어긋남)
+        self._update_children_positions()
+
     def draw(self, canvas: "ImageDraw"):
         if self.hidden == True:
             return
-        self._update_children_positions()
         if self._ring_hidden == False:
             self._cursor_ring.draw(canvas)
         self._cursor_hat.draw(canvas)
 
+    def draw_clipped(self, canvas: "ImageDraw", clip: RenderRect):
+        if self.hidden == True:
+            return
+        if self._ring_hidden == False:
+            self._cursor_ring.draw_clipped(canvas, clip)
+        self._cursor_hat.draw_clipped(canvas, clip)
+
+    def get_bounds(self) -> RenderRect | None:
+        if self.hidden == True:
+            return None
+        bounds = self._cursor_hat.get_bounds()
+        if self._ring_hidden == False:
+            ring_bounds = self._cursor_ring.get_bounds()
+            if bounds is None:
+                bounds = ring_bounds
+            elif ring_bounds is not None:
+                bounds = bounds.union(ring_bounds)
+        return bounds
+
+    def render_key(self):
+        return (
+            self.hidden,
+            self._ring_hidden,
+            self._cursor_hat.get_bounds(),
+            self._cursor_ring.get_bounds(),
+        )
+
     def _update_children_positions(self):
         cx, cy = self.coordinate.x, self.coordinate.y
 
@@ -6,13 +6,17 @@ from PIL import Image, ImageDraw, ImageFont
 from src.classes.mushitroom_interface_object import MushitroomInterfaceObject
 from src.settings.mushitroom_enums import FontStyle
 from src.utils.none_function import noneFunction
-from src.utils.resource_loader import load_custom_font, load_resized_image
+
+# 다른 컴포넌트와 같은 캐시/참조 관리를 쓰도록 src. 없이 import
+# (get_canvas_image가 찾아 둔 캔버스도 같은 모듈이어야 프레임당 한 번만 찾음)
+from utils.sprite_blit import SpriteBlit, get_canvas_image
+from managers.asset_registry import AssetRegistry
 
 
 class MushitroomButton(MushitroomInterfaceObject):
     button_href: str
     is_focusable: bool
-    _image_cache: Image.Image | None
+    _sprite: SpriteBlit | None
     _font: ImageFont.ImageFont | ImageFont.FreeTypeFont
     index: None | int
 
@@ -51,15 +55,12 @@ class MushitroomButton(MushitroomInterfaceObject):
 
         # 1. 이미지 로드
         # img_path = os.path.join(current_dir, "../", "assets", "images", "button.png")
-        self._image_cache = load_resized_image(
+        self._sprite = AssetRegistry().acquire_sprite(
             path="./src/assets/images/button.png", width=self.width, height=self.height
-        )
+        ).value
 
-        # 2. 폰트 로드 (나눔스퀘어네오 하드코딩 된 경로 안전하게 수정)
-
-        self._font = load_custom_font(
-            path=f"./src/assets/fonts/{font_weight.value}", size=font_size
-        )
+        # 2. 폰트 (부모가 공용 캐시에서 빌린 것과 같은 폰트)
+        self._font = self.font
 
     def draw(self, canvas: ImageDraw.ImageDraw):
         """
@@ -73,15 +74,17 @@ class MushitroomButton(MushitroomInterfaceObject):
 
         image_drawn = False  # 이미지를 성공적으로 그렸는지 확인용
 
-        if self._image_cache:
+        if self._sprite is not None:
             try:
-                target_image = getattr(canvas, "_image", None) or getattr(
-                    canvas, "im", None
-                )
+                target_image = get_canvas_image(canvas)
 
-                if isinstance(target_image, Image.Image):
-                    target_image.paste(
-                        self._image_cache, (top_left_x, top_left_y), self._image_cache
+                if target_image is not None:
+                    self._sprite.paste(
+                        target_image,
+                        (
+                            top_left_x + self._sprite.offset[0],
+                            top_left_y + self._sprite.offset[1],
+                        ),
                     )
                     image_drawn = True
                 else:
@@ -90,7 +93,7 @@ class MushitroomButton(MushitroomInterfaceObject):
                 print(f"Draw error: {e}")
                 super().draw(canvas)  # fallback
 
-        if not image_drawn and not self._image_cache:
+        if not image_drawn and self._sprite is None:
             super().draw(canvas)
 
         # 2. 텍스트 그리기 (이미지 위에 덮어쓰기)
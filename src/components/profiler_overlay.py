@@ -0,0 +1,83 @@
+# import pillow
+from PIL import ImageFont
+from PIL.ImageDraw import ImageDraw
+
+# import settings
+from settings.mushitroom_config import FPS, ZOOM_IN
+
+# import managers
+from managers.profiler_manager import ProfilerManager
+
+# import classes
+from classes.render_coordinate import RenderCoordinate
+from classes.render_size import RenderSize
+from classes.render_object import RenderObject
+from classes.render_rect import RenderRect
+
+_GRAPH_FRAMES = 90
+_GRAPH_HEIGHT = 24
+_TEXT_HEIGHT = 12
+# 그래프 세로 최대값 = 프레임 예산의 2배
+_GRAPH_MAX_MS = 2 * 1000 / FPS
+
+
+class ProfilerOverlay(RenderObject):
+    """
+    화면 왼쪽 위에 FPS와 최근 프레임 작업 시간(busy) 그래프를 그립니다.
+    가운데 선이 프레임 예산(1000 / FPS ms)이고, 넘은 막대는 빨간색입니다.
+    """
+
+    _profiler: ProfilerManager
+    _font: ImageFont.ImageFont | ImageFont.FreeTypeFont
+
+    def __init__(self) -> None:
+        super().__init__(
+            RenderCoordinate(0, 0),
+            RenderSize(_GRAPH_FRAMES + 4, _TEXT_HEIGHT + _GRAPH_HEIGHT + 4),
+        )
+        self._profiler = ProfilerManager()
+        self._font = ImageFont.load_default(size=10 * ZOOM_IN)
+
+    def get_bounds(self) -> RenderRect | None:
+        return RenderRect(0, 0, self.size.width, self.size.height)
+
+    def render_key(self):
+        # 측정값이 매 프레임 바뀌므로 매 프레임 다시 그림
+        if not self._profiler.samples:
+            return (0.0,)
+        return (self._profiler.samples[-1].timestamp,)
+
+    def draw(self, canvas: ImageDraw):
+        samples = list(self._profiler.samples)[-_GRAPH_FRAMES:]
+        width = self.size.width
+        height = self.size.height
+
+        canvas.rectangle((0, 0, width - 1, height - 1), fill=(0, 0, 0))
+
+        busy_ms = samples[-1].busy_ms if samples else 0.0
+        canvas.text(
+            (2 * ZOOM_IN, 1 * ZOOM_IN),
+            f"{self._profiler.get_fps():4.1f}fps {busy_ms:4.1f}ms",
+            fill=(255, 255, 255),
+            font=self._font,
+        )
+
+        graph_bottom = height - 2 * ZOOM_IN
+        graph_height = _GRAPH_HEIGHT * ZOOM_IN
+        budget_ms = 1000 / FPS
+        budget_y = graph_bottom - int(graph_height * budget_ms / _GRAPH_MAX_MS)
+
+        for index, sample in enumerate(samples):
+            ratio = min(1.0, sample.busy_ms / _GRAPH_MAX_MS)
+            bar_height = max(1, int(graph_height * ratio))
+            x = (2 + index) * ZOOM_IN
+            color = (255, 80, 80) if sample.busy_ms > budget_ms else (80, 220, 80)
+            canvas.rectangle(
+                (x, graph_bottom - bar_height, x + ZOOM_IN - 1, graph_bottom),
+                fill=color,
+            )
+
+        canvas.line(
+            (2 * ZOOM_IN, budget_y, width - 2 * ZOOM_IN, budget_y),
+            fill=(255, 255, 0),
+        )
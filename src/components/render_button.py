@@ -12,10 +12,12 @@ from components.render_image import RenderImage
 from classes.render_coordinate import RenderCoordinate
 from classes.render_size import RenderSize
 from classes.render_object import RenderObject
+from classes.render_rect import RenderRect
 
 
 class RenderButton(RenderObject):
 
+    is_clippable = True
     _render_button_image: RenderImage
     _render_text: RenderText
     _img_src: str
@@ -50,3 +52,24 @@ class RenderButton(RenderObject):
     def draw(self, canvas: ImageDraw):
         self._render_button_image.draw(canvas)
         self._render_text.draw(canvas)
+
+    def draw_clipped(self, canvas: ImageDraw, clip: RenderRect):
+        self._render_button_image.draw_clipped(canvas, clip)
+        self._render_text.draw_clipped(canvas, clip)
+
+    def get_bounds(self) -> RenderRect | None:
+        image_bounds = self._render_button_image.get_bounds()
+        text_bounds = self._render_text.get_bounds()
+        if image_bounds is None:
+            return text_bounds
+        if text_bounds is None:
+            return image_bounds
+        return image_bounds.union(text_bounds)
+
+    def render_key(self):
+        return (
+            self._render_button_image.get_bounds(),
+            self._render_button_image.render_key(),
+            self._render_text.get_bounds(),
+            self._render_text.render_key(),
+        )
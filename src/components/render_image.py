@@ -1,33 +1,85 @@
 # import pillow
 from PIL.ImageDraw import ImageDraw
-from PIL import Image
 
 # import utils
-from utils.resource_loader import load_resized_image
+from utils.sprite_blit import SpriteBlit, get_canvas_image
+
+# import managers
+from managers.asset_registry import AssetRegistry
 
 # import classes
 from classes.render_coordinate import RenderCoordinate
 from classes.render_size import RenderSize
 from classes.render_object import RenderObject
+from classes.render_rect import RenderRect
 
 
 class RenderImage(RenderObject):
     color: str
-    _image_cache: Image.Image | None
+    # 실제로 붙여넣는 부분 (투명 테두리를 뺀 영역, 마스크)과 이미지 안에서의 위치
+    _sprite: SpriteBlit | None
+    is_clippable = True
 
     def __init__(
         self, coordinate: RenderCoordinate, size: RenderSize, src: str
     ) -> None:
         super().__init__(coordinate, size)
-        self._image_cache = load_resized_image(
+        # 지금 씬이 빌린 것으로 기록 (씬을 나가면 반납)
+        # 투명한 테두리는 그려도 변화가 없으므로 보이는 부분만 붙여넣습니다. (dirty rect도 작아짐)
+        # (리사이즈한 원본 이미지는 빌리지 않음: 스프라이트만 있으면 그릴 수 있음)
+        self._sprite = AssetRegistry().acquire_sprite(
             path=src,
             width=self.size.width,
             height=self.size.height,
-        )
+        ).value
 
     def update(self):
         return super().update()
 
+    def get_bounds(self) -> RenderRect | None:
+        if self._sprite is None or self._sprite.image is None:
+            return None
+        blit_image = self._sprite.image
+        left = self.coordinate.x - self.size.width // 2 + self._sprite.offset[0]
+        top = self.coordinate.y - self.size.height // 2 + self._sprite.offset[1]
+        return RenderRect(
+            left,
+            top,
+            left + blit_image.width,
+            top + blit_image.height,
+        )
+
+    def render_key(self):
+        return (id(self._sprite),)
+
+    def draw_clipped(self, canvas: ImageDraw, clip: RenderRect):
+        bounds = self.get_bounds()
+        if bounds is None or self._sprite is None:
+            return
+
+        part = bounds.clip(clip)
+        if part is None:
+            return
+
+        target_image = get_canvas_image(canvas)
+        if target_image is None:
+            return self.draw(canvas)
+
+        if part == bounds:
+            self._sprite.paste(target_image, (part.left, part.top))
+            return
+        # 이미지 안에서의 상대 좌표로 잘라서 붙여넣기
+        self._sprite.paste(
+            target_image,
+            (part.left, part.top),
+            (
+                part.left - bounds.left,
+                part.top - bounds.top,
+                part.right - bounds.left,
+                part.bottom - bounds.top,
+            ),
+        )
+
     def draw(self, canvas: ImageDraw):
         half_width = self.size.width // 2
         half_height = self.size.height // 2
@@ -35,15 +87,17 @@ class RenderImage(RenderObject):
         top_left_y = self.coordinate.y - half_height
 
         image_drawn = False
-        if self._image_cache:
+        if self._sprite is not None:
             try:
-                target_image = getattr(canvas, "_image", None) or getattr(
-                    canvas, "im", None
-                )
+                target_image = get_canvas_image(canvas)
 
-                if isinstance(target_image, Image.Image):
-                    target_image.paste(
-                        self._image_cache, (top_left_x, top_left_y), self._image_cache
+                if target_image is not None:
+                    self._sprite.paste(
+                        target_image,
+                        (
+                            top_left_x + self._sprite.offset[0],
+                            top_left_y + self._sprite.offset[1],
+                        ),
                     )
                     image_drawn = True
                 else:
@@ -52,5 +106,5 @@ class RenderImage(RenderObject):
                 print(f"Draw error: {e}")
                 super().draw(canvas)  # fallback
 
-        if not image_drawn and not self._image_cache:
+        if not image_drawn and self._sprite is None:
             super().draw(canvas)
@@ -0,0 +1,122 @@
+from typing import List
+
+# import pillow
+from PIL import Image, ImageChops, ImageDraw
+
+# import settings
+from settings.mushitroom_config import BG_COLOR, DISPLAY_HEIGHT, DISPLAY_WIDTH
+
+# import utils
+from utils.sprite_blit import get_canvas_image
+
+# import classes
+from classes.render_coordinate import RenderCoordinate
+from classes.render_size import RenderSize
+from classes.render_object import RenderObject
+from classes.render_rect import RenderRect
+
+
+class RenderStaticLayer(RenderObject):
+    """
+    움직이지 않는 컴포넌트들을 한 장의 비트맵으로 미리 합쳐 둔 레이어
+    매 프레임 컴포넌트마다 그리는 대신 paste 한 번으로 그립니다.
+    """
+
+    is_clippable = True
+    version: int
+    _layer: Image.Image | None
+    _mask: Image.Image | None
+    _bounds: RenderRect | None
+
+    def __init__(self) -> None:
+        super().__init__(RenderCoordinate(0, 0), RenderSize(0, 0))
+        self.version = 0
+        self._layer = None
+        self._mask = None
+        self._bounds = None
+
+    def compose(self, render_objects: List[RenderObject]) -> None:
+        """주어진 객체들을 (순서대로) 투명 레이어에 그려서 캐시합니다."""
+        self.version += 1
+        self._layer = None
+        self._mask = None
+        self._bounds = None
+
+        frame_rect = RenderRect(0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+        bounds: RenderRect | None = None
+        visible: List[RenderObject] = []
+        for render_object in render_objects:
+            object_bounds = render_object.get_bounds()
+            if object_bounds is None:
+                continue
+            object_bounds = object_bounds.clip(frame_rect)
+            if object_bounds is None:
+                continue  # 화면 밖
+            visible.append(render_object)
+            bounds = object_bounds if bounds is None else bounds.union(object_bounds)
+
+        if bounds is None:
+            return
+
+        # 컴포넌트는 화면 좌표로 그리므로 화면 크기로 그린 뒤 필요한 부분만 잘라 둡니다.
+        # 1) 배경색 위에 그린 레이어: 평소처럼 배경 위에 바로 그린 것과 픽셀이 똑같음
+        background = Image.new("RGBA", (DISPLAY_WIDTH, DISPLAY_HEIGHT), BG_COLOR)
+        layer = background.copy()
+        layer_draw = ImageDraw.Draw(layer)
+        # 2) 투명 바탕에 그린 레이어: 어느 픽셀을 덮었는지(마스크) 계산용
+        probe = Image.new("RGBA", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0, 0))
+        probe_draw = ImageDraw.Draw(probe)
+        for render_object in visible:
+            render_object.draw(layer_draw)
+            render_object.draw(probe_draw)
+
+        # 두 바탕 중 하나라도 바뀐 픽셀 = 컴포넌트가 건드린 픽셀
+        box = bounds.as_box()
+        touched = ImageChops.add(
+            ImageChops.difference(layer.crop(box), background.crop(box)),
+            probe.crop(box),
+        )
+        red, green, blue, alpha = touched.split()
+        mask = ImageChops.lighter(
+            ImageChops.lighter(red, green), ImageChops.lighter(blue, alpha)
+        )
+
+        self._layer = layer.crop(box)
+        self._mask = mask.point(lambda value: 255 if value else 0)
+        self._bounds = bounds
+
+    def get_bounds(self) -> RenderRect | None:
+        return self._bounds
+
+    def render_key(self):
+        return (self.version,)
+
+    def draw(self, canvas: ImageDraw.ImageDraw):
+        if self._bounds is not None:
+            self.draw_clipped(canvas, self._bounds)
+
+    def draw_clipped(self, canvas: ImageDraw.ImageDraw, clip: RenderRect):
+        if self._layer is None or self._mask is None or self._bounds is None:
+            return
+
+        part = self._bounds.clip(clip)
+        if part is None:
+            return
+
+        target_image = get_canvas_image(canvas)
+        if target_image is None:
+            return
+
+        if part == self._bounds:
+            target_image.paste(self._layer, (part.left, part.top), self._mask)
+            return
+
+        box = (
+            part.left - self._bounds.left,
+            part.top - self._bounds.top,
+            part.right - self._bounds.left,
+            part.bottom - self._bounds.top,
+        )
+        target_image.paste(
+            self._layer.crop(box), (part.left, part.top), self._mask.crop(box)
+        )
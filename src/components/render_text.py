@@ -1,18 +1,30 @@
 from PIL.ImageDraw import ImageDraw
 from settings.mushitroom_config import ZOOM_IN
-from src.settings.mushitroom_enums import FontStyle
-from src.classes.render_coordinate import RenderCoordinate
-from src.classes.render_size import RenderSize
-from src.classes.render_object import RenderObject
+from settings.mushitroom_enums import FontStyle
+from classes.render_coordinate import RenderCoordinate
+from classes.render_size import RenderSize
+from classes.render_object import RenderObject
+from classes.render_rect import RenderRect
 from PIL import ImageFont
 
-from src.utils.resource_loader import load_custom_font
+# AssetPreloader가 채우고 벤치마크가 통계를 읽는 캐시와 같은 모듈을 써야 하므로 src. 없이 import
+from utils.resource_loader import resolve_font_path
+from utils.text_bitmap_cache import TextBitmap, get_text_bitmap
+from utils.sprite_blit import get_canvas_image
+from managers.asset_registry import AssetHandle, AssetRegistry, AssetScope
 
 
 class RenderText(RenderObject):
     text: str
     color: str
+    is_clippable = True
     _font: ImageFont.ImageFont | ImageFont.FreeTypeFont
+    _font_handle: AssetHandle | None
+    # 만들 때의 scope. 글자가 바뀌어 폰트를 다시 빌릴 때도 여기에 담음
+    _asset_scope: AssetScope | None
+    _font_path: str
+    _font_size: int
+    _bitmap_cache: tuple[str, str, TextBitmap | None] | None
 
     def __init__(
         self,
@@ -24,18 +36,103 @@ class RenderText(RenderObject):
         size: RenderSize = RenderSize(0, 0),
     ) -> None:
         super().__init__(coordinate, size)
-        self._font = load_custom_font(
-            path=f"./src/assets/fonts/{font_style.value}",
-            size=font_size * ZOOM_IN,
-        )
+        self._font_path = f"./src/assets/fonts/{font_style.value}"
+        self._font_size = font_size * ZOOM_IN
         self.text = text
         self.color = color
+        self._font_handle = None
+        self._asset_scope = AssetRegistry().get_active_scope()
+        self._font = self._load_font()
+        self._bitmap_cache = None
+
+    def _load_font(self) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+        """서브셋 폰트에 없는 글자가 섞인 text면 원본 폰트"""
+        font_path = resolve_font_path(self._font_path, self.text)
+        if self._font_handle is not None:
+            if self._font_handle.ref == ("font", (font_path, self._font_size)):
+                return self._font_handle.value
+            self._font_handle.release()  # 서브셋 <-> 원본이 바뀌면 이전 폰트는 반납
+        self._font_handle = AssetRegistry().acquire_font(
+            path=font_path,
+            size=self._font_size,
+            scope=self._asset_scope,
+        )
+        return self._font_handle.value
 
     def update(self):
         return super().update()
 
+    def _get_bitmap(self) -> TextBitmap | None:
+        """미리 그려 둔 글자 비트맵. 글자나 색이 바뀔 때만 다시 찾습니다."""
+        if (
+            self._bitmap_cache is not None
+            and self._bitmap_cache[0] == self.text
+            and self._bitmap_cache[1] == self.color
+        ):
+            return self._bitmap_cache[2]
+
+        if self._bitmap_cache is None or self._bitmap_cache[0] != self.text:
+            self._font = self._load_font()
+        # 서브셋 폰트는 원본과 글리프가 같으므로 비트맵 캐시는 원본 경로로 공유
+        bitmap = get_text_bitmap(
+            font=self._font,
+            font_path=self._font_path,
+            font_size=self._font_size,
+            text=self.text,
+            color=self.color,
+            anchor="mm",
+        )
+        self._bitmap_cache = (self.text, self.color, bitmap)
+        return bitmap
+
+    def get_bounds(self) -> RenderRect | None:
+        bitmap = self._get_bitmap()
+        if bitmap is None:
+            return None
+        left = self.coordinate.x + bitmap.offset[0]
+        top = self.coordinate.y + bitmap.offset[1]
+        return RenderRect(
+            left, top, left + bitmap.mask.width, top + bitmap.mask.height
+        )
+
+    def render_key(self):
+        return (self.text, self.color, id(self._font))
+
+    def draw_clipped(self, canvas: ImageDraw, clip: RenderRect):
+        bitmap = self._get_bitmap()
+        bounds = self.get_bounds()
+        if bitmap is None or bounds is None:
+            return
+
+        part = bounds.clip(clip)
+        if part is None:
+            return
+
+        target_image = get_canvas_image(canvas)
+        if target_image is None:
+            return self._draw_text(canvas)
+
+        mask = bitmap.mask
+        if part != bounds:
+            mask = mask.crop(
+                (
+                    part.left - bounds.left,
+                    part.top - bounds.top,
+                    part.right - bounds.left,
+                    part.bottom - bounds.top,
+                )
+            )
+        # 글자색을 마스크 모양대로 칠하기 (FreeType 래스터화 없음)
+        target_image.paste(bitmap.ink, part.as_box(), mask)
+
     def draw(self, canvas: ImageDraw):
+        bounds = self.get_bounds()
+        if bounds is None:
+            return
+        self.draw_clipped(canvas, bounds)
 
+    def _draw_text(self, canvas: ImageDraw):
+        """비트맵을 붙여넣을 수 없는 캔버스용 (직접 그리기)"""
         canvas.text(
             font=self._font,
             xy=(
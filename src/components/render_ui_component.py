@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
 class RenderUiComponent:
     is_selectable: bool
+    # True면 UiComponentManager가 정적 레이어에 미리 합쳐서 그립니다. (움직이지 않는 글자, 버튼 등)
+    is_static: bool
     render_object: RenderObject
     on_activate: Optional[Callable[[], None]]
 
@@ -16,10 +18,12 @@ class RenderUiComponent:
         is_selectable: bool = False,
         on_activate: Optional[Callable[[], None]] = None,
         on_focus_callback: Optional[Callable[[], Any]] = None,
+        is_static: bool = False,
     ) -> None:
         self.focused = False
         self.render_object = render_object
         self.is_selectable = is_selectable
+        self.is_static = is_static
         self.on_activate = on_activate
         self.on_focus_callback = on_focus_callback
         pass
@@ -0,0 +1,193 @@
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Set, Tuple
+
+from classes.asset_manifest import AssetManifest, FontKey, ImageKey
+from managers.profiler_manager import ProfilerManager
+from settings.mushitroom_config import ASSET_PRELOAD_ENABLED
+from utils.resource_loader import (
+    is_font_cached,
+    is_sprite_cached,
+    load_custom_font,
+    load_sprite,
+    resolve_font_path,
+)
+
+# ("image", (경로, 너비, 높이)) 또는 ("font", (경로, 크기))
+AssetEntry = Tuple[str, ImageKey | FontKey]
+
+
+class AssetPreloader:
+    """
+    에셋 미리 불러오기 (Singleton)
+
+    - preload(manifest): 백그라운드 스레드가 resource_loader 캐시를 미리 채웁니다.
+      (현재 씬이 도는 동안 다음에 갈 만한 씬의 에셋을 읽어 둠)
+    - wait_for(manifest): 씬 전환 직전에 호출. 아직 없는 것만 이 스레드에서 바로 읽고,
+      백그라운드가 읽는 중인 것은 끝날 때까지 기다립니다.
+    - get_progress(manifest): (준비된 수, 전체 수)
+    """
+
+    _instance: Optional["AssetPreloader"] = None
+
+    enabled: bool
+    # 백그라운드 스레드가 읽은 수 / 전환 때 기다리며 직접 읽은 수
+    preloaded_count: int
+    loaded_on_demand_count: int
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "initialized"):
+            return
+
+        self.enabled = ASSET_PRELOAD_ENABLED
+        self.preloaded_count = 0
+        self.loaded_on_demand_count = 0
+
+        self._queue: Deque[AssetEntry] = deque()
+        self._in_flight: AssetEntry | None = None
+        # 읽기에 실패한 에셋 (다시 시도하지 않고 준비된 것으로 침)
+        self._failed: Set[AssetEntry] = set()
+        self._changed = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._worker_running = False
+        self.initialized = True
+
+    # --- 스레드 ---
+
+    def start_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker_running = True
+        self._worker = threading.Thread(
+            target=self._worker_loop, name="asset-preloader", daemon=True
+        )
+        self._worker.start()
+
+    def stop_worker(self, timeout: float = 1.0) -> None:
+        """스레드를 멈춥니다. (대기열은 버림)"""
+        with self._changed:
+            self._worker_running = False
+            self._queue.clear()
+            self._changed.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+        self._worker = None
+
+    def _worker_loop(self) -> None:
+        batch_count = 0
+        batch_start = 0.0
+        while True:
+            with self._changed:
+                while self._worker_running and not self._queue:
+                    self._changed.wait()
+                if not self._worker_running:
+                    return
+                entry = self._queue.popleft()
+                if self._is_ready(entry):
+                    continue
+                self._in_flight = entry
+                if batch_count == 0:
+                    batch_start = time.perf_counter()
+
+            self._load(entry)
+
+            with self._changed:
+                self._in_flight = None
+                self.preloaded_count += 1
+                batch_count += 1
+                is_batch_done = not self._queue
+                self._changed.notify_all()
+
+            if is_batch_done:
+                elapsed_ms = (time.perf_counter() - batch_start) * 1000
+                print(f"📦 에셋 미리 불러오기 완료: {batch_count}개 ({elapsed_ms:.0f}ms)")
+                batch_count = 0
+
+    # --- 요청 ---
+
+    def preload(self, manifest: AssetManifest) -> None:
+        """아직 캐시에 없는 에셋을 백그라운드 대기열에 넣습니다. (기다리지 않음)"""
+        if not self.enabled:
+            return
+        with self._changed:
+            for entry in self._iter_entries(manifest):
+                if entry in self._queue or entry == self._in_flight:
+                    continue
+                if not self._is_ready(entry):
+                    self._queue.append(entry)
+            self._changed.notify_all()
+        if self._queue:
+            self.start_worker()
+
+    def wait_for(self, manifest: AssetManifest) -> int:
+        """
+        manifest의 에셋이 모두 캐시에 올라올 때까지 기다립니다.
+        :return: 미리 준비되지 않아 이 스레드에서 직접 읽은 수
+        """
+        if not self.enabled:
+            return 0
+
+        loaded_count = 0
+        with ProfilerManager().measure("asset_wait"):
+            for entry in self._iter_entries(manifest):
+                with self._changed:
+                    while entry == self._in_flight:
+                        self._changed.wait()
+                    if self._is_ready(entry):
+                        continue
+                    # 대기열에 있으면 빼고 여기서 바로 읽음
+                    if entry in self._queue:
+                        self._queue.remove(entry)
+                self._load(entry)
+                loaded_count += 1
+
+        if loaded_count:
+            self.loaded_on_demand_count += loaded_count
+            print(f"⚠️ 미리 불러오지 못한 에셋 {loaded_count}개를 전환 중에 읽었습니다.")
+        return loaded_count
+
+    def get_progress(self, manifest: AssetManifest) -> Tuple[int, int]:
+        """(캐시에 올라온 수, 전체 수)"""
+        entries = list(self._iter_entries(manifest))
+        ready = sum(1 for entry in entries if self._is_ready(entry))
+        return ready, len(entries)
+
+    # --- 내부 ---
+
+    def _iter_entries(self, manifest: AssetManifest):
+        for image_key in manifest.images:
+            yield ("image", image_key)
+        for font_key in manifest.fonts:
+            yield ("font", font_key)
+
+    def _is_ready(self, entry: AssetEntry) -> bool:
+        if entry in self._failed:
+            return True
+        kind, key = entry
+        if kind == "image":
+            return is_sprite_cached(*key)
+        path, size = key
+        return is_font_cached(resolve_font_path(path), size)
+
+    def _load(self, entry: AssetEntry) -> None:
+        kind, key = entry
+        if kind == "image":
+            path, width, height = key
+            # 붙여넣기 방식(마스크)까지 미리 정해 둠
+            sprite = load_sprite(path=path, width=width, height=height)
+            is_loaded = sprite is not None
+        else:
+            # 글자를 모르므로 서브셋 폰트가 있으면 서브셋을 읽음 (RenderText와 같은 선택)
+            path, size = resolve_font_path(key[0]), key[1]
+            load_custom_font(path=path, size=size)
+            # 실패하면 기본 폰트를 돌려주고 캐시에는 넣지 않음
+            is_loaded = is_font_cached(path, size)
+
+        if not is_loaded:
+            self._failed.add(entry)
@@ -0,0 +1,250 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageFont
+
+from classes.asset_manifest import FontKey
+from utils.resource_loader import (
+    load_custom_font,
+    load_resized_image,
+    load_sprite,
+    pin_font,
+    pin_image,
+    pin_sprite,
+    unpin_font,
+    unpin_image,
+    unpin_sprite,
+)
+from utils.sprite_blit import SpriteBlit
+
+# 참조 수를 세는 단위
+# ("image" 또는 "sprite", (경로, 너비, 높이, 리사이즈 방식)) 또는 ("font", (경로, 크기))
+AssetRef = Tuple[str, Tuple[str, int, int, int] | FontKey]
+
+# acquire_*의 scope 기본값: 지금 열려 있는 scope에 담음
+ACTIVE_SCOPE: Any = object()
+
+
+class AssetHandle:
+    """
+    AssetRegistry가 빌려준 에셋 하나
+    value를 쓰고, 더 이상 필요 없으면 release() (씬을 나갈 때는 scope가 한꺼번에 반납)
+    """
+
+    ref: AssetRef
+    value: Any
+    scope: Optional["AssetScope"]
+    # 지금 참조 수에 들어가 있는지 (scope가 쉬는 동안은 False)
+    is_counted: bool
+    is_released: bool
+
+    def __init__(self, ref: AssetRef, value: Any, scope: Optional["AssetScope"]):
+        self.ref = ref
+        self.value = value
+        self.scope = scope
+        self.is_counted = False
+        self.is_released = False
+
+    def release(self) -> None:
+        AssetRegistry().release(self)
+
+
+class AssetScope:
+    """
+    한 씬이 빌린 에셋 묶음
+    - close: 모두 반납 (on_enter에서 만든 컴포넌트 -> 씬을 나가면 버려짐)
+    - suspend / resume: 잠시 반납했다가 다시 빌림 (__init__에서 만든 컴포넌트 -> 씬 객체와 함께 남음)
+    """
+
+    name: str
+    handles: List[AssetHandle]
+    is_suspended: bool
+    is_closed: bool
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.handles = []
+        self.is_suspended = False
+        self.is_closed = False
+
+
+class AssetRegistry:
+    """
+    씬 단위 에셋 참조 관리 (Singleton)
+
+    컴포넌트는 resource_loader 대신 여기서 에셋을 빌립니다. (acquire_*)
+    빌린 곳이 하나라도 있는 에셋은 캐시에서 pin 되어 메모리 한도를 넘어도 버려지지 않고,
+    모두 반납되면 pin이 풀려 다른 에셋처럼 덜 쓴 순서대로 버려질 수 있습니다.
+    SceneManager가 씬마다 scope를 열고, 씬을 나가면 그 씬이 빌린 것을 반납합니다.
+    만든 뒤에도 에셋을 다시 빌리는 컴포넌트는 만들 때 get_active_scope()를 기억해 두고
+    scope=로 넘겨야 합니다. (씬 전환 뒤에 빌리면 지금 씬의 scope에 담겨 엉뚱하게 반납됨)
+    (그리기 스레드에서만 사용)
+    """
+
+    _instance: Optional["AssetRegistry"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "initialized"):
+            return
+
+        self._ref_counts: Dict[AssetRef, int] = {}
+        self._scopes: List[AssetScope] = []
+        # 새로 빌리는 에셋이 들어갈 scope (None이면 어느 씬에도 속하지 않음)
+        self._active_scope: AssetScope | None = None
+        self.initialized = True
+
+    # --- scope ---
+
+    def open_scope(self, name: str) -> AssetScope:
+        """새 scope를 열고, 이후 빌리는 에셋을 여기에 담습니다."""
+        scope = AssetScope(name)
+        self._scopes.append(scope)
+        self._active_scope = scope
+        return scope
+
+    def get_active_scope(self) -> AssetScope | None:
+        """지금 빌리면 담기는 scope"""
+        return self._active_scope
+
+    def close_scope(self, scope: AssetScope) -> None:
+        """scope가 빌린 에셋을 모두 반납합니다."""
+        scope.is_closed = True
+        for handle in list(scope.handles):
+            self.release(handle)
+        if scope in self._scopes:
+            self._scopes.remove(scope)
+        if self._active_scope is scope:
+            self._active_scope = None
+
+    def suspend_scope(self, scope: AssetScope) -> None:
+        """빌린 것은 그대로 두고 참조 수에서만 뺍니다. (resume_scope로 되돌림)"""
+        if scope.is_suspended:
+            return
+        scope.is_suspended = True
+        for handle in scope.handles:
+            self._uncount(handle)
+
+    def resume_scope(self, scope: AssetScope) -> None:
+        if not scope.is_suspended:
+            return
+        scope.is_suspended = False
+        for handle in scope.handles:
+            self._count(handle)
+
+    # --- 빌리기 / 반납 ---
+
+    def acquire_image(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        scope: Any = ACTIVE_SCOPE,
+        resample: int = Image.Resampling.NEAREST,
+    ) -> AssetHandle:
+        """value: Image.Image | None"""
+        image: Image.Image | None = load_resized_image(path, width, height, resample)
+        ref: AssetRef = ("image", (path, width, height, resample))
+        return self._make_handle(ref, image, scope)
+
+    def acquire_sprite(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        scope: Any = ACTIVE_SCOPE,
+        resample: int = Image.Resampling.NEAREST,
+    ) -> AssetHandle:
+        """
+        value: SpriteBlit | None
+        :param resample: 리사이즈 방식 (리사이즈 방식마다 따로 캐시됨)
+        """
+        sprite: SpriteBlit | None = load_sprite(path, width, height, resample)
+        ref: AssetRef = ("sprite", (path, width, height, resample))
+        return self._make_handle(ref, sprite, scope)
+
+    def acquire_font(
+        self, path: str, size: int, scope: Any = ACTIVE_SCOPE
+    ) -> AssetHandle:
+        """
+        value: ImageFont (읽지 못하면 기본 폰트)
+        :param scope: 담을 scope (기본: 지금 열려 있는 scope, None: 어느 씬에도 속하지 않음)
+        """
+        font: ImageFont.ImageFont | ImageFont.FreeTypeFont = load_custom_font(
+            path, size
+        )
+        return self._make_handle(("font", (path, size)), font, scope)
+
+    def release(self, handle: AssetHandle) -> None:
+        if handle.is_released:
+            return
+        handle.is_released = True
+        self._uncount(handle)
+        if handle.scope is not None and handle in handle.scope.handles:
+            handle.scope.handles.remove(handle)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "scopes": len(self._scopes),
+            "assets": len(self._ref_counts),
+            "references": sum(self._ref_counts.values()),
+        }
+
+    # --- 내부 ---
+
+    def _make_handle(self, ref: AssetRef, value: Any, scope: Any) -> AssetHandle:
+        if scope is ACTIVE_SCOPE:
+            scope = self._active_scope
+        handle = AssetHandle(ref, value, scope)
+        if value is None:
+            return handle  # 읽지 못한 에셋은 세지 않음
+        if scope is not None and scope.is_closed:
+            # 이미 반납한 scope의 컴포넌트 (화면에서 내려간 것) -> 세지 않음
+            handle.is_released = True
+            return handle
+        if scope is not None:
+            scope.handles.append(handle)
+        if scope is None or not scope.is_suspended:
+            self._count(handle)
+        return handle
+
+    def _count(self, handle: AssetHandle) -> None:
+        if handle.is_counted or handle.is_released:
+            return
+        handle.is_counted = True
+        count = self._ref_counts.get(handle.ref, 0) + 1
+        self._ref_counts[handle.ref] = count
+        if count == 1:
+            self._pin(handle.ref)
+
+    def _uncount(self, handle: AssetHandle) -> None:
+        if not handle.is_counted:
+            return
+        handle.is_counted = False
+        count = self._ref_counts[handle.ref] - 1
+        if count > 0:
+            self._ref_counts[handle.ref] = count
+            return
+        del self._ref_counts[handle.ref]
+        self._unpin(handle.ref)
+
+    def _pin(self, ref: AssetRef) -> None:
+        kind, key = ref
+        if kind == "image":
+            pin_image(*key)
+        elif kind == "sprite":
+            pin_sprite(*key)
+        else:
+            pin_font(*key)
+
+    def _unpin(self, ref: AssetRef) -> None:
+        kind, key = ref
+        if kind == "image":
+            unpin_image(*key)
+        elif kind == "sprite":
+            unpin_sprite(*key)
+        else:
+            unpin_font(*key)
@@ -2,7 +2,38 @@ import os
 import ctypes
 import platform
 import subprocess
+import threading
+import time
+from collections import deque
 from enum import Enum
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Tuple
+
+from classes.audio_backend import AudioBackend, create_audio_backend
+from classes.audio_mixer import BUS_BGM, BUS_SFX, AudioMixer, StreamVoice
+from settings.mushitroom_config import (
+    AUDIO_BACKEND,
+    AUDIO_CHANNELS,
+    AUDIO_GAIN_RAMP_MS,
+    AUDIO_LATENCY_MS,
+    AUDIO_MIXER_ENABLED,
+    AUDIO_PERIOD_FRAMES,
+    AUDIO_PROBE_TIMEOUT_SEC,
+    AUDIO_RECORD_PATH,
+    AUDIO_SAMPLE_RATE,
+    BGM_CROSSFADE_MS,
+    BGM_DUCK_ATTACK_MS,
+    BGM_DUCK_GAIN,
+    BGM_DUCK_RELEASE_MS,
+    SFX_COOLDOWN_MS,
+    SFX_MAX_VOICES,
+    SFX_STEAL_FADE_MS,
+    SFX_VOICE_STEALING,
+)
+from utils.archive_reader import has_archive_member
+from utils.pcm import WavStream, is_pcm_available, load_wav
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class AudioList(Enum):
@@ -12,13 +43,73 @@ class AudioList(Enum):
     BGM_02 = "src/assets/audio/bgm_02.wav"
 
 
+# aplay -l 결과 (None = 아직 확인 안 함). 한 번 확인하면 다시 실행하지 않음
+_device_probe_result: bool | None = None
+_device_probe_lock = threading.Lock()
+
+
+def probe_audio_device(system_os: str) -> bool:
+    """오디오 장치가 실제로 사용 가능한지 확인 (처음 한 번만 실행하고 결과를 기억)"""
+    global _device_probe_result
+    with _device_probe_lock:
+        if _device_probe_result is None:
+            _device_probe_result = _run_device_probe(system_os)
+        return _device_probe_result
+
+
+def _run_device_probe(system_os: str) -> bool:
+    if system_os == "Linux":
+        try:
+            # aplay -l 명령어로 재생 가능한 카드가 있는지 확인
+            result = subprocess.run(
+                ["aplay", "-l"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=AUDIO_PROBE_TIMEOUT_SEC,
+            )
+            # 'card'라는 단어가 출력에 없으면 장치가 없는 것으로 간주
+            if "card" not in result.stdout:
+                print("🚫 오디오 장치 없음: 오디오 기능을 비활성화합니다.")
+                return False
+        except Exception:
+            print("🚫 오디오 점검 실패: 오디오 기능을 비활성화합니다.")
+            return False
+    return True
+
+
 class AudioManager:
+    """
+    오디오 (Singleton)
+
+    공개 메서드(play_bgm, play_sfx, set_*_volume ...)는 명령을 대기열에 넣고 바로 반환합니다.
+    장치 점검(aplay -l), 믹서 시작, amixer, 파일 열기 같은 느린 일은 전부
+    "audio-worker" 스레드가 순서대로 처리하므로 씬 전환이나 부팅 중에 프레임이 멈추지 않습니다.
+    """
+
     _instance: "AudioManager | None" = None
     _system_os: str
     _bgm_process = None
     _bgm_alias = "bgm_alias"
-
-    # 오디오 기능 활성화 여부 플래그
+    # Linux 효과음 / BGM 믹서 (없으면 효과음마다 aplay, BGM은 aplay 반복 실행)
+    _mixer: AudioMixer | None = None
+    # 믹서 출력 (AUDIO_BACKEND, 처음 만들 때 넘기면 그것을 사용)
+    _backend: AudioBackend
+    # 믹서에서 재생 중인 BGM
+    _bgm_voice: StreamVoice | None = None
+    _bgm_audio: "AudioList | None" = None
+    # 디코딩한 효과음 PCM (None = 읽기 실패)
+    _sfx_cache: Dict["AudioList", "np.ndarray | None"]
+    # 효과음마다 마지막으로 튼 시각 (SFX_COOLDOWN_MS)
+    _sfx_last_played: Dict["AudioList", float]
+    # [믹서 없을 때] 재생 중인 효과음 aplay 프로세스 (SFX_MAX_VOICES개까지)
+    _sfx_processes: List[subprocess.Popen]
+    # 믹서 밖에서 센 효과음 수: 재생 / 쿨다운, 자리 부족으로 버림 / 자리를 빼앗김
+    sfx_played_count: int
+    sfx_dropped_count: int
+    sfx_stolen_count: int
+
+    # 오디오 기능 활성화 여부 플래그 (장치 점검이 끝나기 전에는 True로 보고 명령을 받아 둠)
     is_audio_enabled: bool = True
 
     _main_volume: int = 100
@@ -30,36 +121,135 @@ class AudioManager:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, backend: AudioBackend | None = None):
+        """
+        :param backend: 믹서 출력 (처음 만들 때만 적용). None이면 AUDIO_BACKEND 설정
+        """
         if not hasattr(self, "initialized"):
             self._system_os = platform.system()
+            self._backend = (
+                backend
+                if backend is not None
+                else create_audio_backend(AUDIO_BACKEND, AUDIO_RECORD_PATH)
+            )
             self._bgm_volume = 100
             self._sfx_volume = 100
             self._main_volume = 100
 
-            # [안전장치] 초기화 시 오디오 장치 점검
-            self.is_audio_enabled = self._check_audio_availability()
+            self._sfx_cache = {}
+            self._sfx_last_played = {}
+            self._sfx_processes = []
+            self.sfx_played_count = 0
+            self.sfx_dropped_count = 0
+            self.sfx_stolen_count = 0
+
+            # (키, 함수, 인자). 키가 있는 명령은 같은 키의 이전 명령을 대신함 (볼륨 등)
+            self._commands: Deque[Tuple[str | None, Callable, tuple]] = deque()
+            self._commands_changed = threading.Condition()
+            self._worker: threading.Thread | None = None
+            self._worker_running = False
+            # 처리 중인 명령이 있는지 (wait_idle용)
+            self._is_busy = False
+
+            # [안전장치] 오디오 장치 점검은 스레드에서 (첫 명령)
+            self._submit(None, self._initialize_device)
+            self._start_worker()
             self.initialized = True
 
-    def _check_audio_availability(self) -> bool:
-        """오디오 장치가 실제로 사용 가능한지 확인"""
-        if self._system_os == "Linux":
-            try:
-                # aplay -l 명령어로 재생 가능한 카드가 있는지 확인
-                result = subprocess.run(
-                    ["aplay", "-l"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
+    # --- 명령 스레드 ---
+
+    def _start_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker_running = True
+        self._worker = threading.Thread(
+            target=self._worker_loop, name="audio-worker", daemon=True
+        )
+        self._worker.start()
+
+    def stop_worker(self, timeout: float = 1.0) -> None:
+        """명령 스레드와 믹서를 멈춥니다. (남은 명령은 버림)"""
+        with self._commands_changed:
+            self._worker_running = False
+            self._commands.clear()
+            self._commands_changed.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+        self._worker = None
+        if self._mixer is not None:
+            self._mixer.stop()
+            self._mixer = None
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """대기열의 명령이 모두 처리될 때까지 기다립니다. (종료 직전, 벤치마크용)"""
+        with self._commands_changed:
+            return self._commands_changed.wait_for(
+                lambda: not self._commands and not self._is_busy, timeout
+            )
+
+    def _submit(self, key: str | None, func: Callable, *args) -> None:
+        with self._commands_changed:
+            if key is not None:
+                # 아직 처리 안 한 같은 종류의 명령은 마지막 것만 의미가 있음
+                self._commands = deque(
+                    command for command in self._commands if command[0] != key
                 )
-                # 'card'라는 단어가 출력에 없으면 장치가 없는 것으로 간주
-                if "card" not in result.stdout:
-                    print("🚫 오디오 장치 없음: 오디오 기능을 비활성화합니다.")
-                    return False
-            except Exception:
-                print("🚫 오디오 점검 실패: 오디오 기능을 비활성화합니다.")
-                return False
-        return True
+            self._commands.append((key, func, args))
+            self._commands_changed.notify_all()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._commands_changed:
+                while self._worker_running and not self._commands:
+                    self._commands_changed.wait()
+                if not self._worker_running:
+                    return
+                _, func, args = self._commands.popleft()
+                self._is_busy = True
+
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"⚠️ 오디오 명령 실패(무시함): {e}")
+
+            with self._commands_changed:
+                self._is_busy = False
+                self._commands_changed.notify_all()
+
+    def _initialize_device(self) -> None:
+        if not self._backend.is_device_backend:
+            # 장치가 필요 없는 출력 (null / record): 믹서를 못 쓰면 소리를 끔
+            self._start_mixer()
+            self.is_audio_enabled = self._mixer is not None
+            return
+        self.is_audio_enabled = probe_audio_device(self._system_os)
+        self._start_mixer()
+
+    def _start_mixer(self) -> None:
+        """효과음과 BGM을 섞어서 보낼 출력을 하나 열어 둡니다. (실패하면 예전 방식)"""
+        if (
+            (self._backend.is_device_backend and self._system_os != "Linux")
+            or not self.is_audio_enabled
+            or not AUDIO_MIXER_ENABLED
+            or not is_pcm_available()
+        ):
+            return
+        mixer = AudioMixer(
+            sample_rate=AUDIO_SAMPLE_RATE,
+            channels=AUDIO_CHANNELS,
+            period_frames=AUDIO_PERIOD_FRAMES,
+            latency_ms=AUDIO_LATENCY_MS,
+            max_voices=SFX_MAX_VOICES,
+            steal_voices=SFX_VOICE_STEALING,
+            steal_fade_ms=SFX_STEAL_FADE_MS,
+            backend=self._backend,
+        )
+        mixer.set_ducking(BGM_DUCK_GAIN, BGM_DUCK_ATTACK_MS, BGM_DUCK_RELEASE_MS)
+        if mixer.start():
+            self._mixer = mixer
+            # 시작 전에 받아 둔 볼륨을 그대로 적용 (천천히 바꿀 필요 없음)
+            self._apply_volumes(ramp_ms=0)
+            print(f"🔊 오디오 믹서 시작 (출력: {self._backend.name})")
 
     def _send_mci_command(self, command: str):
         if not self.is_audio_enabled:
@@ -71,38 +261,109 @@ class AudioManager:
             return False
         return True
 
+    # --- 볼륨 ---
+    # 값은 바로 바꾸고, 적용하는 일만 스레드로 보냅니다. (밀려 있으면 마지막 한 번만 실행)
+    # 믹서가 있으면 main / BGM / 효과음 볼륨을 믹서의 master / 버스 gain으로 따로 적용하고,
+    # 없을 때만 예전처럼 BGM 볼륨(main 포함)을 amixer / MCI로 적용합니다.
+
     def set_main_volume(self, volume: int):
         self._main_volume = max(0, min(100, volume))
-        self.set_bgm_volume(round(self._bgm_volume * (self._main_volume / 100)))
+        self._submit_volumes()
 
     def set_bgm_volume(self, volume: int):
+        self._bgm_volume = max(0, min(100, volume))
+        self._submit_volumes()
+
+    def set_sfx_volume(self, volume: int):
+        self._sfx_volume = max(0, min(100, volume))
+        self._submit_volumes()
+
+    def _submit_volumes(self) -> None:
         if not self.is_audio_enabled:
             return
+        self._submit("volume", self._apply_volumes, AUDIO_GAIN_RAMP_MS)
+
+    def _apply_volumes(self, ramp_ms: int) -> None:
+        mixer = self._mixer
+        if mixer is not None and mixer.is_running:
+            mixer.set_master_gain(self._main_volume / 100, ramp_ms)
+            mixer.set_bus_gain(BUS_BGM, self._bgm_volume / 100, ramp_ms)
+            mixer.set_bus_gain(BUS_SFX, self._sfx_volume / 100, ramp_ms)
+            return
+        self._apply_bgm_volume()
 
-        self._bgm_volume = max(0, min(100, volume))
+    def _apply_bgm_volume(self) -> None:
+        """[믹서 없을 때] BGM 볼륨을 장치에 적용"""
+        if not self.is_audio_enabled or (
+            self._mixer is not None and self._mixer.is_running
+        ):
+            return
 
+        bgm_volume = round(self._bgm_volume * (self._main_volume / 100))
         if self._system_os == "Windows":
-            mci_vol = self._bgm_volume * 10
+            mci_vol = bgm_volume * 10
             self._send_mci_command(f"setaudio {self._bgm_alias} volume to {mci_vol}")
 
         elif self._system_os == "Linux":
             try:
                 subprocess.run(
-                    f"amixer set PCM {self._bgm_volume}%",
-                    shell=True,
+                    ["amixer", "set", "PCM", f"{bgm_volume}%"],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
+                    timeout=AUDIO_PROBE_TIMEOUT_SEC,
                 )
-            except:
+            except Exception:
                 pass
 
-    def set_sfx_volume(self, volume: int):
-        self._sfx_volume = max(0, min(100, volume))
+    # --- 재생 ---
 
-    def play_bgm(self, audio: AudioList):
+    def play_bgm(
+        self, audio: AudioList, loop_points: tuple[int, int] | None = None
+    ):
+        """
+        BGM을 반복 재생합니다. (명령만 보내고 바로 반환)
+        :param loop_points: 반복 구간 (시작 프레임, 끝 프레임). None이면 WAV의 smpl 청크 또는 전체
+            (믹서를 쓸 때만 적용)
+        """
         # [안전장치] 오디오 비활성화 상태면 즉시 리턴
         if not self.is_audio_enabled:
             return
+        self._submit(None, self._play_bgm, audio, loop_points)
+
+    def play_sfx(self, audio: AudioList):
+        """
+        효과음을 재생합니다. (명령만 보내고 바로 반환)
+        같은 효과음을 SFX_COOLDOWN_MS 안에 다시 부르면 버립니다.
+        """
+        if not self.is_audio_enabled:
+            return
+        now = time.perf_counter()
+        last_played = self._sfx_last_played.get(audio)
+        if last_played is not None and now - last_played < SFX_COOLDOWN_MS / 1000:
+            self.sfx_dropped_count += 1
+            return
+        self._sfx_last_played[audio] = now
+        self._submit(None, self._play_sfx, audio)
+
+    def stop_bgm(self):
+        """BGM을 멈춥니다. (명령만 보내고 바로 반환)"""
+        if not self.is_audio_enabled:
+            return
+        self._submit(None, self._stop_bgm)
+
+    # --- 명령 처리 (audio-worker 스레드) ---
+
+    def _play_bgm(
+        self, audio: AudioList, loop_points: tuple[int, int] | None
+    ) -> None:
+        if not self.is_audio_enabled:
+            return
+
+        # 믹서가 있으면 같은 출력으로 스트리밍 (반복 지점에서 끊기지 않고, 바꿀 때 크로스페이드)
+        # OS와 상관없이 먼저 봄: null / record 출력은 Windows에서도 믹서를 씀
+        if self._mixer is not None and self._mixer.is_running:
+            self._play_bgm_stream(audio, loop_points)
+            return
 
         # 경로 절대경로로 변환
         abs_path = os.path.abspath(audio.value)
@@ -117,13 +378,13 @@ class AudioManager:
                     f'open "{abs_path_win}" type mpegvideo alias {self._bgm_alias}'
                 )
                 if self._send_mci_command(cmd_open):
-                    self.set_bgm_volume(self._bgm_volume)
+                    self._apply_bgm_volume()
                     cmd_play = f"play {self._bgm_alias} repeat"
                     if not self._send_mci_command(cmd_play):
                         self._send_mci_command(f"play {self._bgm_alias}")
 
             elif self._system_os == "Linux":
-                self.stop_bgm()
+                self._stop_bgm()
 
                 # [핵심 수정]
                 # 무한 루프(while true) 제거 -> 한 번 재생 후 끝나게 하거나
@@ -145,10 +406,60 @@ class AudioManager:
             print(f"⚠️ BGM 오류(무시함): {e}")
             self.is_audio_enabled = False  # 에러 나면 그냥 꺼버림
 
-    def play_sfx(self, audio: AudioList):
+    def _play_bgm_stream(
+        self, audio: AudioList, loop_points: tuple[int, int] | None
+    ) -> None:
+        # 같은 곡이 이미 나오고 있으면 처음부터 다시 틀지 않음 (씬을 오가도 이어서 재생)
+        voice = self._bgm_voice
+        if voice is not None and self._bgm_audio == audio and not voice.is_finished:
+            voice.fade(1.0, self._mixer.ms_to_frames(BGM_CROSSFADE_MS))
+            return
+
+        if not os.path.exists(audio.value) and not has_archive_member(audio.value):
+            return
+        try:
+            stream = WavStream(
+                audio.value,
+                AUDIO_SAMPLE_RATE,
+                AUDIO_CHANNELS,
+                loop=True,
+                loop_points=loop_points,
+            )
+        except Exception as e:
+            print(f"⚠️ BGM 오류(무시함): {audio.value} / {e}")
+            return
+
+        fade_frames = self._mixer.ms_to_frames(BGM_CROSSFADE_MS)
+        new_voice = StreamVoice(stream, gain=0.0)
+        new_voice.fade(1.0, fade_frames)
+        if not self._mixer.play_stream(new_voice):
+            stream.close()
+            return
+
+        self._fade_out_bgm()
+        self._bgm_voice = new_voice
+        self._bgm_audio = audio
+
+    def _fade_out_bgm(self) -> None:
+        """믹서의 BGM을 줄이면서 멈춤 (다 줄어들면 믹서가 파일을 닫음)"""
+        if self._bgm_voice is not None and self._mixer is not None:
+            self._bgm_voice.fade(
+                0.0, self._mixer.ms_to_frames(BGM_CROSSFADE_MS), stop=True
+            )
+        self._bgm_voice = None
+        self._bgm_audio = None
+
+    def _play_sfx(self, audio: AudioList) -> None:
         if not self.is_audio_enabled:
             return
 
+        # 믹서가 있으면 미리 디코딩한 PCM을 섞기만 함 (프로세스 생성 없음)
+        if self._mixer is not None and self._mixer.is_running:
+            samples = self._get_sfx_samples(audio)
+            if samples is not None:
+                self._mixer.play(samples)  # 볼륨은 SFX 버스 gain
+            return
+
         if not os.path.exists(audio.value):
             return
 
@@ -160,17 +471,77 @@ class AudioManager:
                     audio.value, winsound.SND_FILENAME | winsound.SND_ASYNC
                 )
             elif self._system_os == "Linux":
+                if not self._take_sfx_process_slot():
+                    return
                 # 에러 메시지 숨김 (stderr=subprocess.DEVNULL)
-                subprocess.Popen(
-                    ["aplay", "-q", audio.value], stderr=subprocess.DEVNULL
+                self._sfx_processes.append(
+                    subprocess.Popen(
+                        ["aplay", "-q", audio.value], stderr=subprocess.DEVNULL
+                    )
                 )
+                self.sfx_played_count += 1
         except:
             pass
 
-    def stop_bgm(self):
+    def _take_sfx_process_slot(self) -> bool:
+        """
+        [믹서 없을 때] 끝난 aplay를 치우고 새 효과음 자리를 만듭니다.
+        자리가 없으면 가장 오래된 aplay를 끝내고 (stealing), 그럴 수 없으면 False
+        """
+        self._sfx_processes = [
+            process for process in self._sfx_processes if process.poll() is None
+        ]
+        if SFX_MAX_VOICES <= 0 or len(self._sfx_processes) < SFX_MAX_VOICES:
+            return True
+        if not SFX_VOICE_STEALING:
+            self.sfx_dropped_count += 1
+            return False
+        oldest = self._sfx_processes.pop(0)
+        try:
+            oldest.terminate()
+        except OSError:
+            pass
+        self.sfx_stolen_count += 1
+        return True
+
+    def get_mixer_stats(self) -> Dict[str, float | int | str] | None:
+        """믹서 출력 종류와 CPU 사용량 등 (믹서를 안 쓰면 None)"""
+        mixer = self._mixer
+        return mixer.get_stats() if mixer is not None else None
+
+    def get_sfx_stats(self) -> Dict[str, int]:
+        """효과음 재생 / 버림 / 빼앗김 수와 지금 재생 중인 수"""
+        stats = {
+            "played": self.sfx_played_count,
+            "dropped": self.sfx_dropped_count,
+            "stolen": self.sfx_stolen_count,
+            "voices": len(self._sfx_processes),
+        }
+        mixer = self._mixer
+        if mixer is not None:
+            stats["played"] += mixer.played_count
+            stats["dropped"] += mixer.dropped_count
+            stats["stolen"] += mixer.stolen_count
+            stats["voices"] = mixer.get_voice_count()
+        return stats
+
+    def _get_sfx_samples(self, audio: AudioList):
+        """효과음을 처음 한 번만 믹서 형식 PCM으로 디코딩합니다."""
+        if audio not in self._sfx_cache:
+            self._sfx_cache[audio] = load_wav(
+                audio.value, AUDIO_SAMPLE_RATE, AUDIO_CHANNELS
+            )
+        return self._sfx_cache[audio]
+
+    def _stop_bgm(self) -> None:
         if not self.is_audio_enabled:
             return
 
+        # 믹서의 BGM (null / record 출력이면 Linux가 아니어도 믹서로 틀었음)
+        self._fade_out_bgm()
+        if self._mixer is not None and self._mixer.is_running:
+            return
+
         if self._system_os == "Windows":
             self._send_mci_command(f"stop {self._bgm_alias}")
             self._send_mci_command(f"close {self._bgm_alias}")
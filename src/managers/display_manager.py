@@ -0,0 +1,252 @@
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from PIL import Image
+
+from classes.render_rect import RenderRect, merge_rects
+from classes.spi_pixel_writer import SpiPixelWriter
+from managers.profiler_manager import ProfilerManager
+from utils.rgb565 import encode_rgb565, is_rgb565_available
+
+# ST7789 COLMOD(픽셀 포맷) 명령과 16bit(RGB565) 값
+_ST7789_COLMOD = 0x3A
+_COLMOD_RGB565 = 0x55
+
+# luma의 rotate 값(시계방향 90도 단위)과 같은 결과를 내는 transpose
+_ROTATE_TRANSPOSE = {
+    1: Image.Transpose.ROTATE_270,
+    2: Image.Transpose.ROTATE_180,
+    3: Image.Transpose.ROTATE_90,
+}
+
+
+class FrameJob:
+    """전송할 프레임 1장. 버퍼 재사용과 무관하도록 바뀐 영역만 복사해 둡니다."""
+
+    size: Tuple[int, int]
+    regions: List[Tuple[RenderRect, Image.Image]]
+    is_full_frame: bool
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        regions: List[Tuple[RenderRect, Image.Image]],
+        is_full_frame: bool,
+    ) -> None:
+        self.size = size
+        self.regions = regions
+        self.is_full_frame = is_full_frame
+
+
+class DisplayManager:
+    """
+    화면 출력 담당 (Singleton)
+
+    - ST7789(luma)처럼 set_window/data를 지원하는 장치에는 바뀐 영역만
+      CASET/RASET 창(window)으로 잘라 전송합니다.
+    - 그 외 장치(Tkinter 에뮬레이터 등)는 바뀐 게 있을 때만 전체 화면을 넘깁니다.
+    - NumPy와 spidev를 쓸 수 있으면 패널을 RGB565 모드로 바꾸고, 회전+RGB565 변환을
+      NumPy 한 번으로 끝낸 바이트를 spidev로 바로 보냅니다. (luma의 변환/전송 생략)
+    - start_worker()를 호출하면 변환 + 전송은 출력 스레드가 맡고,
+      게임 루프는 submit()으로 프레임을 넘기기만 합니다.
+    """
+
+    _instance: Optional["DisplayManager"] = None
+
+    device: Any
+    _supports_window: bool
+    _pixel_writer: SpiPixelWriter | None
+    # submit()이 아직 안 보낸 프레임을 덮어쓴 횟수
+    dropped_frames: int
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "initialized"):
+            return
+
+        self.device = None
+        self._supports_window = False
+        self._pixel_writer = None
+        self.dropped_frames = 0
+
+        self._worker: threading.Thread | None = None
+        self._worker_running = False
+        self._pending: FrameJob | None = None
+        self._job_ready = threading.Condition()
+        self.initialized = True
+
+    def set_device(
+        self, device: Any, pixel_writer: SpiPixelWriter | None = None
+    ) -> None:
+        """
+        :param pixel_writer: 픽셀 데이터를 보낼 writer. 없으면 luma 장치에서 꺼내 만듭니다.
+        """
+        self.device = device
+        self._supports_window = all(
+            hasattr(device, attr) for attr in ("set_window", "data", "rotate")
+        )
+        self._pixel_writer = None
+
+        if not self._supports_window or not is_rgb565_available():
+            return
+        if pixel_writer is None:
+            pixel_writer = SpiPixelWriter.from_luma(
+                getattr(device, "_serial_interface", None)
+            )
+        if pixel_writer is None:
+            return
+
+        try:
+            # luma는 18bit(0x06)로 초기화하므로 16bit로 바꿔야 2바이트/픽셀로 보낼 수 있음
+            device.command(_ST7789_COLMOD, _COLMOD_RGB565)
+            self._pixel_writer = pixel_writer
+            print("🖥️ RGB565 직접 전송 모드 사용")
+        except Exception as e:
+            print(f"⚠️ RGB565 모드 전환 실패, luma 전송 사용: {e}")
+
+    def present(self, frame: Image.Image, dirty_rects: List[RenderRect]) -> None:
+        """
+        바로 전송합니다. (호출한 스레드에서 변환 + 전송)
+        :param frame: 논리 좌표계(회전 전)의 전체 프레임
+        :param dirty_rects: RenderManager.end_frame()이 돌려준 바뀐 영역
+        """
+        if self.device is None or not dirty_rects:
+            return
+        self._send(self._capture(frame, dirty_rects, detach=False))
+
+    # --- 출력 스레드 ---
+
+    def start_worker(self) -> None:
+        """
+        전송 전용 스레드를 시작합니다. 이후 submit()으로 넘긴 프레임은 이 스레드가 전송하므로
+        게임 루프는 N+1 프레임을 그리는 동안 N 프레임 전송을 기다리지 않습니다.
+        """
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker_running = True
+        self._worker = threading.Thread(
+            target=self._worker_loop, name="display-output", daemon=True
+        )
+        self._worker.start()
+        print("🖥️ 화면 출력 스레드 시작")
+
+    def stop_worker(self, timeout: float = 1.0) -> None:
+        """출력 스레드를 멈춥니다. (대기 중인 프레임은 버림)"""
+        with self._job_ready:
+            self._worker_running = False
+            self._pending = None
+            self._job_ready.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+        self._worker = None
+
+    def submit(self, frame: Image.Image, dirty_rects: List[RenderRect]) -> None:
+        """
+        완성된 프레임을 출력 스레드에 넘깁니다. (기다리지 않음)
+        대기열은 1칸이라, 아직 못 보낸 프레임이 있으면 그 영역을 합쳐 최신 프레임으로 교체합니다.
+        출력 스레드가 없으면 present()와 같습니다.
+        """
+        if self._worker is None:
+            self.present(frame, dirty_rects)
+            return
+        if self.device is None or not dirty_rects:
+            return
+
+        with self._job_ready:
+            if self._pending is not None:
+                # 못 보낸 프레임의 영역도 최신 프레임에서 다시 잘라 보냅니다.
+                dirty_rects = merge_rects(
+                    [rect for rect, _ in self._pending.regions] + dirty_rects
+                )
+                self.dropped_frames += 1
+            # frame은 곧 back 버퍼로 재사용되므로 필요한 영역만 복사해서 넘깁니다.
+            self._pending = self._capture(frame, dirty_rects, detach=True)
+            self._job_ready.notify()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._job_ready:
+                while self._worker_running and self._pending is None:
+                    self._job_ready.wait()
+                if not self._worker_running:
+                    return
+                job = self._pending
+                self._pending = None
+
+            if job is None:
+                continue
+            start = time.perf_counter()
+            try:
+                self._send(job)
+            except Exception as e:
+                print(f"❌ 화면 전송 실패: {e}")
+            # 출력 스레드의 변환 + 전송 시간
+            ProfilerManager().record(
+                "display_transfer", (time.perf_counter() - start) * 1000
+            )
+
+    # --- 전송 ---
+
+    def _capture(
+        self, frame: Image.Image, dirty_rects: List[RenderRect], detach: bool
+    ) -> FrameJob:
+        """
+        :param detach: True면 전체 화면도 복사합니다. (다른 스레드가 나중에 읽을 때)
+        """
+        frame_rect = RenderRect(0, 0, frame.width, frame.height)
+        is_full_frame = not self._supports_window or (
+            len(dirty_rects) == 1 and dirty_rects[0].contains(frame_rect)
+        )
+        if is_full_frame:
+            # 창 전송을 못 하는 장치(Tkinter 등)는 항상 전체 화면
+            dirty_rects = [frame_rect]
+        if is_full_frame and not detach:
+            regions = [(frame_rect, frame)]
+        else:
+            regions = [(rect, frame.crop(rect.as_box())) for rect in dirty_rects]
+        return FrameJob(size=frame.size, regions=regions, is_full_frame=is_full_frame)
+
+    def _send(self, job: FrameJob) -> None:
+        if job.is_full_frame and self._pixel_writer is None:
+            self.device.display(job.regions[0][1])
+            return
+
+        for rect, region in job.regions:
+            self._push_window(region, rect, job.size)
+
+    def _push_window(
+        self, region: Image.Image, rect: RenderRect, frame_size: Tuple[int, int]
+    ) -> None:
+        rotate = self.device.rotate
+        left, top, right, bottom = self._to_panel_box(rect, *frame_size)
+
+        if self._pixel_writer is not None:
+            payload = encode_rgb565(region, rotate)
+            self.device.set_window(left, top, right, bottom)
+            self._pixel_writer.write(payload)
+            return
+
+        region = region.convert("RGB")
+        if rotate in _ROTATE_TRANSPOSE:
+            region = region.transpose(_ROTATE_TRANSPOSE[rotate])
+
+        self.device.set_window(left, top, right, bottom)
+        self.device.data(list(region.tobytes()))
+
+    def _to_panel_box(
+        self, rect: RenderRect, width: int, height: int
+    ) -> Tuple[int, int, int, int]:
+        """논리 좌표의 영역을 패널(회전 후) 좌표로 바꿉니다."""
+        rotate = self.device.rotate
+        if rotate == 1:
+            return (height - rect.bottom, rect.left, height - rect.top, rect.right)
+        if rotate == 2:
+            return (width - rect.right, height - rect.bottom, width - rect.left, height - rect.top)
+        if rotate == 3:
+            return (rect.top, width - rect.right, rect.bottom, width - rect.left)
+        return rect.as_box()
@@ -0,0 +1,93 @@
+from typing import List, Optional
+
+from PIL import Image, ImageDraw
+
+from classes.render_rect import RenderRect, merge_rects
+from settings.mushitroom_config import (
+    BG_COLOR,
+    DIRTY_RECT_MERGE_GAP,
+    DISPLAY_HEIGHT,
+    DISPLAY_WIDTH,
+)
+
+
+class FrameBuffer:
+    """미리 만들어 둔 캔버스 1장과 그 캔버스에 묶인 ImageDraw"""
+
+    canvas: Image.Image
+    draw_tool: ImageDraw.ImageDraw
+    # 이 버퍼가 최신 프레임과 달라져 있는(다시 칠해야 하는) 영역
+    stale_rects: List[RenderRect]
+
+    def __init__(self, width: int, height: int) -> None:
+        self.canvas = Image.new("RGBA", (width, height), BG_COLOR)
+        self.draw_tool = ImageDraw.Draw(self.canvas)
+        self.stale_rects = [RenderRect(0, 0, width, height)]
+
+    def clear(self, rects: List[RenderRect]) -> None:
+        """지정한 영역만 배경색으로 지웁니다."""
+        for rect in rects:
+            self.canvas.paste(BG_COLOR, rect.as_box())
+
+
+class FrameBufferManager:
+    """
+    프레임 버퍼 관리 (Singleton)
+
+    - front: 마지막으로 완성된 프레임 (화면 출력용)
+    - back : 지금 그리고 있는 프레임
+
+    두 캔버스는 처음에 한 번만 만들고 계속 재사용합니다. (프레임마다 300KB 할당 X)
+    back 버퍼는 한 프레임 전 내용을 담고 있으므로, 그 사이 바뀐 영역(stale_rects)과
+    이번 프레임에서 바뀐 영역만 지우고 다시 그리면 됩니다.
+    """
+
+    _instance: Optional["FrameBufferManager"] = None
+
+    frame_rect: RenderRect
+    _buffers: List[FrameBuffer]
+    _back_index: int
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "initialized"):
+            return
+
+        self.frame_rect = RenderRect(0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+        self._buffers = [
+            FrameBuffer(DISPLAY_WIDTH, DISPLAY_HEIGHT),
+            FrameBuffer(DISPLAY_WIDTH, DISPLAY_HEIGHT),
+        ]
+        self._back_index = 0
+        self.initialized = True
+
+    @property
+    def back(self) -> FrameBuffer:
+        return self._buffers[self._back_index]
+
+    @property
+    def front(self) -> FrameBuffer:
+        return self._buffers[1 - self._back_index]
+
+    def invalidate(self) -> None:
+        """두 버퍼 모두 전체를 다시 그리도록 표시합니다."""
+        for buffer in self._buffers:
+            buffer.stale_rects = [self.frame_rect]
+
+    def swap(self, dirty_rects: List[RenderRect]) -> FrameBuffer:
+        """
+        back 버퍼를 다 그렸으면 호출합니다. back과 front를 맞바꾸고 새 front를 반환합니다.
+        :param dirty_rects: 이번 프레임에서 바뀐 영역 (새 back 버퍼는 이만큼 뒤처져 있음)
+        """
+        finished = self.back
+        finished.stale_rects = []
+
+        self._back_index = 1 - self._back_index
+        self.back.stale_rects = merge_rects(
+            self.back.stale_rects + dirty_rects, DIRTY_RECT_MERGE_GAP
+        )
+        return finished
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Set, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Set, Dict, List, Optional, Tuple
 from settings.mushitroom_enums import InputActions
 from settings import mushitroom_config
 
@@ -137,6 +137,62 @@ class RpiInputStrategy(InputStrategy):
             print(f"❌ GPIO 설정 오류: {e}")
 
 
+# -------------------------------------------------------------------------
+# [Concrete Strategy 3] 스크립트 입력 (헤드리스 벤치마크용)
+# -------------------------------------------------------------------------
+# (대기 프레임 수, 누를 액션) - 액션 대신 함수를 넣으면 그 프레임에 호출 (씬 이동 등)
+ScriptStep = Tuple[int, "InputActions | Callable[[], None]"]
+
+
+class ScriptedInputStrategy(InputStrategy):
+    """
+    미리 정해 둔 순서대로 버튼을 누르는 전략
+    매 프레임 handle_input 전에 advance()를 호출해야 합니다.
+    누른 버튼은 다음 프레임에 뗍니다.
+    """
+
+    def __init__(self, state: InputState, script: List[ScriptStep], loop: bool = True):
+        super().__init__(state)
+        self.script = script
+        self.loop = loop
+        self._step_index = 0
+        self._wait_frames = script[0][0] if script else 0
+        self._held: InputActions | None = None
+
+    def setup(self, **kwargs):
+        print("[System] Input Strategy: Scripted (Headless) Connected")
+
+    @property
+    def is_finished(self) -> bool:
+        return not self.loop and self._step_index >= len(self.script)
+
+    def advance(self) -> None:
+        """한 프레임 진행합니다."""
+        if self._held is not None:
+            self._update_action_state(self._held, is_pressed=False)
+            self._held = None
+
+        if not self.script or self.is_finished:
+            return
+
+        if self._wait_frames > 0:
+            self._wait_frames -= 1
+            return
+
+        _, step = self.script[self._step_index]
+        if isinstance(step, InputActions):
+            self._update_action_state(step, is_pressed=True)
+            self._held = step
+        else:
+            step()
+
+        self._step_index += 1
+        if self._step_index >= len(self.script) and self.loop:
+            self._step_index = 0
+        if self._step_index < len(self.script):
+            self._wait_frames = self.script[self._step_index][0]
+
+
 # -------------------------------------------------------------------------
 # [Context] Input Manager (Singleton)
 # -------------------------------------------------------------------------
@@ -151,10 +207,15 @@ class InputManager:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, is_windows: bool = True):
+    def __init__(
+        self,
+        is_windows: bool = True,
+        script: Optional[List[ScriptStep]] = None,
+    ):
         """
         초기화 시에는 플랫폼 결정만 합니다.
         실제 바인딩(setup)은 initialize() 메서드에서 수행합니다.
+        :param script: 주면 키보드/GPIO 대신 스크립트 입력을 사용 (헤드리스 실행)
         """
         if hasattr(self, "initialized") and self.initialized:
             return
@@ -162,7 +223,9 @@ class InputManager:
         self.state = InputState()
 
         # 전략 선택 (Factory Logic)
-        if is_windows:
+        if script is not None:
+            self.strategy = ScriptedInputStrategy(self.state, script)
+        elif is_windows:
             self.strategy = WindowsInputStrategy(self.state)
         else:
             self.strategy = RpiInputStrategy(self.state)
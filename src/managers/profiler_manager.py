@@ -0,0 +1,204 @@
+import csv
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Deque, Dict, Iterator, List, Optional
+
+from settings.mushitroom_config import (
+    PROFILER_CSV_DIR,
+    PROFILER_ENABLED,
+    PROFILER_HISTORY,
+    PROFILER_OVERLAY,
+)
+
+_NULL_CONTEXT = nullcontext()
+
+
+class FrameSample:
+    """프레임 1장의 측정값 (단위: ms)"""
+
+    timestamp: float
+    interval_ms: float
+    busy_ms: float
+    phases: Dict[str, float]
+
+    def __init__(
+        self,
+        timestamp: float,
+        interval_ms: float,
+        busy_ms: float,
+        phases: Dict[str, float],
+    ) -> None:
+        self.timestamp = timestamp
+        self.interval_ms = interval_ms
+        self.busy_ms = busy_ms
+        self.phases = phases
+
+
+class ProfilerManager:
+    """
+    단계별 프레임 프로파일러 (Singleton)
+
+    - measure("draw") 블록의 시간을 현재 프레임에 더합니다. (같은 이름은 합산)
+    - end_frame()마다 프레임 측정값을 ring buffer(PROFILER_HISTORY 장)에 넣습니다.
+    - dump_csv()로 버퍼를 CSV로 저장합니다. (기기별 비교용)
+    - 꺼져 있으면 measure()는 아무것도 하지 않는 context를 돌려줍니다.
+    """
+
+    _instance: Optional["ProfilerManager"] = None
+
+    enabled: bool
+    overlay_visible: bool
+    samples: Deque[FrameSample]
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "initialized"):
+            return
+
+        self.enabled = PROFILER_ENABLED or PROFILER_OVERLAY
+        self.overlay_visible = PROFILER_OVERLAY
+        self.samples = deque(maxlen=PROFILER_HISTORY)
+
+        # 출력 스레드도 record()를 호출하므로 현재 프레임 값은 lock으로 보호
+        self._lock = threading.Lock()
+        self._phases: Dict[str, float] = {}
+        self._busy_ms = 0.0
+        self._depth = 0
+        self._last_frame_time: float | None = None
+        self.initialized = True
+
+    # --- 측정 ---
+
+    def measure(self, phase: str):
+        """with ProfilerManager().measure("update"): ... 형태로 사용"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._measure(phase)
+
+    @contextmanager
+    def _measure(self, phase: str) -> Iterator[None]:
+        is_top_level = self._depth == 0
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._depth -= 1
+            self.record(phase, elapsed_ms, is_top_level)
+
+    def record(self, phase: str, elapsed_ms: float, is_top_level: bool = False) -> None:
+        """
+        직접 잰 시간을 현재 프레임에 더합니다. (다른 스레드에서 호출해도 됨)
+        :param is_top_level: True면 프레임의 작업 시간(busy)에도 더함
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._phases[phase] = self._phases.get(phase, 0.0) + elapsed_ms
+            if is_top_level:
+                self._busy_ms += elapsed_ms
+
+    def end_frame(self) -> None:
+        """한 프레임이 끝날 때(화면 출력 후) 호출합니다."""
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        interval_ms = 0.0
+        if self._last_frame_time is not None:
+            interval_ms = (now - self._last_frame_time) * 1000
+        self._last_frame_time = now
+
+        with self._lock:
+            sample = FrameSample(now, interval_ms, self._busy_ms, self._phases)
+            self._phases = {}
+            self._busy_ms = 0.0
+        self.samples.append(sample)
+
+    # --- 조회 ---
+
+    def get_fps(self, window_sec: float = 1.0) -> float:
+        """최근 window_sec초 동안의 평균 FPS"""
+        if len(self.samples) < 2:
+            return 0.0
+        latest = self.samples[-1].timestamp
+        frames = 0
+        oldest = latest
+        for sample in reversed(self.samples):
+            if latest - sample.timestamp > window_sec:
+                break
+            oldest = sample.timestamp
+            frames += 1
+        if frames < 2 or latest <= oldest:
+            return 0.0
+        return (frames - 1) / (latest - oldest)
+
+    def get_phase_names(self) -> List[str]:
+        names: List[str] = []
+        for sample in self.samples:
+            for name in sample.phases:
+                if name not in names:
+                    names.append(name)
+        return names
+
+    # --- 제어 ---
+
+    def toggle_overlay(self) -> None:
+        """화면 오버레이를 켜고 끕니다. (켜면 측정도 시작)"""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+        print(f"📊 프로파일러 오버레이: {'ON' if self.overlay_visible else 'OFF'}")
+
+    def dump_csv(self, path: str | None = None) -> str | None:
+        """
+        ring buffer를 CSV로 저장하고 경로를 반환합니다.
+        :param path: 없으면 PROFILER_CSV_DIR/profile_<시각>.csv
+        """
+        samples = list(self.samples)
+        if not samples:
+            print("⚠️ 저장할 프로파일 데이터가 없습니다.")
+            return None
+
+        if path is None:
+            file_name = time.strftime("profile_%Y%m%d_%H%M%S.csv")
+            path = os.path.join(PROFILER_CSV_DIR, file_name)
+
+        phase_names = self.get_phase_names()
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(
+                    ["frame", "timestamp", "interval_ms", "busy_ms"]
+                    + [f"{name}_ms" for name in phase_names]
+                )
+                for index, sample in enumerate(samples):
+                    writer.writerow(
+                        [
+                            index,
+                            f"{sample.timestamp:.6f}",
+                            f"{sample.interval_ms:.3f}",
+                            f"{sample.busy_ms:.3f}",
+                        ]
+                        + [
+                            f"{sample.phases.get(name, 0.0):.3f}"
+                            for name in phase_names
+                        ]
+                    )
+        except Exception as e:
+            print(f"❌ 프로파일 저장 실패: {path} / {e}")
+            return None
+
+        print(f"📊 프로파일 저장: {path} ({len(samples)} frames)")
+        return path
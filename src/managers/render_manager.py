@@ -0,0 +1,192 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
+
+from PIL import ImageDraw
+
+from classes.render_rect import RenderRect, merge_rects
+from managers.frame_buffer_manager import FrameBufferManager
+from settings.mushitroom_config import (
+    DIRTY_RECT_FULL_FRAME_RATIO,
+    DIRTY_RECT_MERGE_GAP,
+)
+
+if TYPE_CHECKING:
+    from classes.render_object import RenderObject
+
+
+class RenderItem:
+    """한 프레임에 그려질 객체의 스냅샷 (display list 항목)"""
+
+    render_object: "RenderObject"
+    bounds: RenderRect
+    key: Hashable
+
+    def __init__(self, render_object: "RenderObject", bounds: RenderRect) -> None:
+        self.render_object = render_object
+        self.bounds = bounds
+        # 이전 프레임 목록이 객체를 붙잡고 있으므로 id()가 재사용될 걱정은 없습니다.
+        self.key = (id(render_object), bounds.as_box(), render_object.render_key())
+
+
+class RenderManager:
+    """
+    Dirty rect 기반 렌더러 (Singleton)
+
+    1. begin_frame()으로 프레임을 시작하면 UiComponentManager.draw()는 바로 그리지 않고
+       submit()으로 그릴 객체와 영역만 등록합니다.
+    2. end_frame()에서 이전 프레임 목록과 비교해 바뀐 영역(dirty rect)을 구하고,
+       back 버퍼에서 (바뀐 영역 + back 버퍼가 뒤처진 영역)만 지운 뒤 그 영역에 걸친 객체만 다시 그립니다.
+       다 그리면 front/back 버퍼를 맞바꿉니다.
+    3. 반환된 dirty rect 목록은 DisplayManager가 바뀐 창(window)만 SPI로 보내는 데 사용합니다.
+    """
+
+    _instance: Optional["RenderManager"] = None
+
+    frame_rect: RenderRect
+    frame_buffer: FrameBufferManager
+    is_recording: bool
+    dirty_rects: List[RenderRect]
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "initialized"):
+            return
+
+        self.frame_buffer = FrameBufferManager()
+        self.frame_rect = self.frame_buffer.frame_rect
+        self.is_recording = False
+        self.dirty_rects = []
+
+        self._items: List[RenderItem] = []
+        self._prev_items: List[RenderItem] = []
+        self._full_damage = True
+
+        self.initialized = True
+
+    def invalidate(self) -> None:
+        """다음 프레임을 전체 다시 그리도록 표시합니다. (씬 전환 등)"""
+        self._full_damage = True
+        self.frame_buffer.invalidate()
+
+    def begin_frame(self) -> ImageDraw.ImageDraw:
+        """프레임 기록을 시작하고 back 버퍼의 ImageDraw를 돌려줍니다. (매 프레임 같은 객체)"""
+        self._items = []
+        self.is_recording = True
+        return self.frame_buffer.back.draw_tool
+
+    def submit(self, render_object: "RenderObject") -> None:
+        """이번 프레임에 그릴 객체를 등록합니다. (화면 밖이면 무시)"""
+        bounds = render_object.get_bounds()
+        if bounds is None:
+            return
+        bounds = bounds.clip(self.frame_rect)
+        if bounds is None:
+            return
+        self._items.append(RenderItem(render_object, bounds))
+
+    def end_frame(self) -> List[RenderRect]:
+        """
+        바뀐 영역만 다시 그리고, 그 영역 목록을 반환합니다.
+        빈 리스트면 화면이 바뀌지 않았으므로 전송할 필요가 없습니다.
+        """
+        self.is_recording = False
+
+        # 화면(front)과 비교해 바뀐 영역 = 전송할 영역
+        damage = self._normalize_damage(self._collect_damage())
+
+        # back 버퍼는 한 프레임 뒤처져 있으므로 그 영역까지 함께 다시 칠합니다.
+        back = self.frame_buffer.back
+        repaint, redraw_items = self._expand_damage(damage + back.stale_rects)
+
+        back.clear(repaint)
+        for item in redraw_items:
+            render_object = item.render_object
+            if not render_object.is_clippable:
+                render_object.draw(back.draw_tool)
+                continue
+            # 잘라 그릴 수 있는 객체는 다시 칠하는 영역 안쪽만 그립니다.
+            for rect in repaint:
+                part = item.bounds.clip(rect)
+                if part is not None:
+                    render_object.draw_clipped(back.draw_tool, part)
+
+        self.frame_buffer.swap(damage)
+
+        self._prev_items = self._items
+        self._full_damage = False
+        self.dirty_rects = damage
+        return damage
+
+    def _collect_damage(self) -> List[RenderRect]:
+        """이전 프레임과 달라진 항목의 (이전/현재) 영역을 모읍니다."""
+        if self._full_damage:
+            return [self.frame_rect]
+
+        bounds_by_key: Dict[Hashable, RenderRect] = {}
+        for item in self._prev_items:
+            bounds_by_key[item.key] = item.bounds
+        for item in self._items:
+            bounds_by_key[item.key] = item.bounds
+
+        prev_keys = Counter(item.key for item in self._prev_items)
+        current_keys = Counter(item.key for item in self._items)
+
+        # 사라진 항목은 예전 자리를, 새로 생긴 항목은 새 자리를 지워야 합니다.
+        changed = (prev_keys - current_keys) + (current_keys - prev_keys)
+        return [bounds_by_key[key] for key in changed]
+
+    def _expand_damage(
+        self, damage: List[RenderRect]
+    ) -> Tuple[List[RenderRect], List[RenderItem]]:
+        """
+        dirty rect에 걸친 객체는 통째로 다시 그려지므로 그 객체의 영역까지 dirty rect를 넓힙니다.
+        (넓히지 않으면 객체가 영역 밖에 그려진 위쪽 객체를 덮어버립니다.)
+        잘라 그릴 수 있는(is_clippable) 객체는 영역을 넓히지 않습니다.
+        """
+        damage = self._normalize_damage(damage)
+        if not damage:
+            return [], []
+
+        while True:
+            if damage == [self.frame_rect]:
+                return damage, list(self._items)
+
+            redraw_items = [
+                item
+                for item in self._items
+                if any(item.bounds.intersects(rect) for rect in damage)
+            ]
+            expanded = merge_rects(
+                damage
+                + [
+                    item.bounds
+                    for item in redraw_items
+                    if not item.render_object.is_clippable
+                ],
+                DIRTY_RECT_MERGE_GAP,
+            )
+            if set(expanded) == set(damage):
+                return damage, redraw_items
+            damage = self._normalize_damage(expanded)
+
+    def _normalize_damage(self, damage: List[RenderRect]) -> List[RenderRect]:
+        """가까운 영역을 합치고, 너무 넓으면 전체 화면 하나로 바꿉니다."""
+        if not damage:
+            return []
+
+        damage = merge_rects(damage, DIRTY_RECT_MERGE_GAP)
+        damage = [
+            clipped
+            for clipped in (rect.clip(self.frame_rect) for rect in damage)
+            if clipped is not None
+        ]
+        if sum(rect.area for rect in damage) >= (
+            self.frame_rect.area * DIRTY_RECT_FULL_FRAME_RATIO
+        ):
+            # 조각조각 보내는 것보다 한 번에 보내는 게 빠릅니다.
+            return [self.frame_rect]
+        return damage
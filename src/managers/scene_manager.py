@@ -3,6 +3,9 @@ from typing import TYPE_CHECKING, Dict, Type, Optional
 # 순환 참조(Circular Import) 방지를 위한 타입 힌팅용 임포트
 from settings.mushitroom_enums import SceneType
 from managers.sq_manager import SqManager
+from managers.render_manager import RenderManager
+from managers.asset_preloader import AssetPreloader
+from managers.asset_registry import AssetRegistry, AssetScope
 
 if TYPE_CHECKING:
     from classes.scene_base import BaseScene
@@ -15,7 +18,11 @@ class SceneManager:
     # 타입 힌트
     db: "SqManager"
     current_scene: Optional["BaseScene"]
+    current_scene_type: Optional[SceneType]
     scene_cache: Dict[SceneType, "BaseScene"]
+    # 씬 객체를 만들 때(__init__) 빌린 에셋 / 지금 씬에 들어와서(on_enter 이후) 빌린 에셋
+    scene_asset_scopes: Dict[SceneType, AssetScope]
+    _enter_asset_scope: Optional[AssetScope]
     scene_registry: Dict[SceneType, Type["BaseScene"]]
 
     def __new__(cls, *args, **kwargs):
@@ -35,7 +42,10 @@ class SceneManager:
         # 최초 생성 시 DB 인스턴스는 필수입니다.
         self.db = SqManager()
         self.current_scene = None
+        self.current_scene_type = None
         self.scene_cache = {}
+        self.scene_asset_scopes = {}
+        self._enter_asset_scope = None
 
         # [핵심 2] Enum과 실제 클래스를 연결하는 등록부
         # 순환 참조 방지를 위한 내부 import 유지
@@ -63,32 +73,75 @@ class SceneManager:
         :param scene_type: 이동할 씬의 Enum 타입
         :param kwargs: 다음 씬의 on_enter로 넘겨줄 데이터
         """
+        if scene_type not in self.scene_registry:
+            print(f"[Error] {scene_type} 은(는) 레지스트리에 등록되지 않았습니다!")
+            return
+
+        # 0. 다음 씬 에셋 준비 (미리 불러오지 못한 것만 여기서 읽음)
+        preloader = AssetPreloader()
+        preloader.wait_for(self.scene_registry[scene_type].asset_manifest)
+
         # 1. 캐시에 씬이 없으면 생성 (Lazy Loading)
+        registry = AssetRegistry()
         if scene_type not in self.scene_cache:
-            if scene_type not in self.scene_registry:
-                print(f"[Error] {scene_type} 은(는) 레지스트리에 등록되지 않았습니다!")
-                return
-
             # 클래스 가져오기
             scene_class = self.scene_registry[scene_type]
 
             # 인스턴스 생성 (__init__ 실행) 및 캐시 저장
+            # __init__에서 만든 컴포넌트는 씬 객체와 함께 남으므로 따로 기록
             print(f"[System] 씬 최초 생성: {scene_type}")
+            self.scene_asset_scopes[scene_type] = registry.open_scope(
+                f"{scene_type.name}:init"
+            )
             self.scene_cache[scene_type] = scene_class()
+        else:
+            registry.resume_scope(self.scene_asset_scopes[scene_type])
 
         # 2. 캐시에서 인스턴스 꺼내기
         next_scene = self.scene_cache[scene_type]
+        prev_scene_type = self.current_scene_type
+        prev_enter_scope = self._enter_asset_scope
 
         # 3. 현재 씬 정리 (Exit)
         if self.current_scene:
             self.current_scene.on_exit()
 
-        # 4. 씬 교체
+        # 4. 씬 교체 (화면이 통째로 바뀌므로 다음 프레임은 전체 다시 그리기)
         self.current_scene = next_scene
+        self.current_scene_type = scene_type
+        RenderManager().invalidate()
 
         # 5. 새 씬 진입 및 데이터 주입 (Enter + Data)
+        self._enter_asset_scope = registry.open_scope(scene_type.name)
         self.current_scene.on_enter(**kwargs)
 
+        # 6. 이전 씬이 빌린 에셋 반납
+        #    (새 씬이 먼저 빌린 뒤에 반납해야 두 씬이 같이 쓰는 에셋이 캐시에서 버려지지 않음)
+        self._release_scene_assets(prev_scene_type, prev_enter_scope)
+
+        # 7. 이 씬에서 갈 만한 씬의 에셋을 백그라운드에서 미리 읽기
+        for preload_type in next_scene.preload_scenes:
+            preload_class = self.scene_registry.get(preload_type)
+            if preload_class is not None:
+                preloader.preload(preload_class.asset_manifest)
+
+    def _release_scene_assets(
+        self, scene_type: Optional[SceneType], enter_scope: Optional[AssetScope]
+    ) -> None:
+        """씬을 나갈 때 on_enter 이후 빌린 에셋은 반납하고, __init__ 때 빌린 에셋은 쉬게 합니다."""
+        registry = AssetRegistry()
+        if enter_scope is not None:
+            registry.close_scope(enter_scope)
+        if scene_type is not None and scene_type != self.current_scene_type:
+            registry.suspend_scope(self.scene_asset_scopes[scene_type])
+
+    def get_preload_progress(self, scene_type: SceneType) -> tuple[int, int]:
+        """씬 에셋 준비 상황 (준비된 수, 전체 수)"""
+        scene_class = self.scene_registry.get(scene_type)
+        if scene_class is None:
+            return 0, 0
+        return AssetPreloader().get_progress(scene_class.asset_manifest)
+
     def handle_input(self):
         if self.current_scene:
             self.current_scene.handle_input()
@@ -104,3 +157,7 @@ class SceneManager:
     def quit(self):
         if self.current_scene:
             self.current_scene.on_exit()
+            scene_type = self.current_scene_type
+            self.current_scene_type = None
+            self._release_scene_assets(scene_type, self._enter_asset_scope)
+            self._enter_asset_scope = None
@@ -1,6 +1,9 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Hashable, List, Optional
 from managers.audio_manager import AudioList, AudioManager
+from managers.render_manager import RenderManager
+from managers.profiler_manager import ProfilerManager
 from components.render_ui_component import RenderUiComponent
+from components.render_static_layer import RenderStaticLayer
 from classes.render_object import RenderObject
 
 if TYPE_CHECKING:
@@ -14,6 +17,8 @@ class UiComponentManager:
     selected_index: int
     cursor: Optional[RenderObject]
     disabled: bool
+    _static_layer: RenderStaticLayer
+    _static_snapshot: Optional[List[Hashable]]
 
     def __init__(
         self, cursor: Optional[RenderObject] = None, disabled: bool = False
@@ -24,6 +29,8 @@ class UiComponentManager:
         self.cursor = cursor
         self.sound_manager = AudioManager()
         self.disabled = disabled
+        self._static_layer = RenderStaticLayer()
+        self._static_snapshot = None
         if self.cursor:
             self.cursor.hidden = True
 
@@ -37,12 +44,15 @@ class UiComponentManager:
     def clear_components(self, reset_index: bool = True) -> None:
         self.render_components.clear()
         self.selectable_components.clear()
+        self.invalidate_static_layer()
         print("ui_manager cleared")
         if reset_index:
             self.selected_index = -1
 
     def add_component(self, component: RenderUiComponent) -> None:
         self.render_components.append(component)
+        if component.is_static:
+            self.invalidate_static_layer()
 
         if component.is_selectable:
             self.selectable_components.append(component)
@@ -55,13 +65,62 @@ class UiComponentManager:
                 self._update_cursor_position()
 
     def draw(self, canvas: "ImageDraw") -> None:
+        with ProfilerManager().measure("ui_draw"):
+            self._draw(canvas)
+
+    def _draw(self, canvas: "ImageDraw") -> None:
         self.on_cursor()
-        for component in self.render_components:
+        if self.cursor is not None and not self.cursor.hidden:
+            self.cursor.update()
+
+        # 정적 컴포넌트는 한 장의 레이어로 먼저 그리고, 나머지(애니메이션)는 그 위에 그립니다.
+        self._refresh_static_layer()
+        dynamic_components = [c for c in self.render_components if not c.is_static]
+
+        # 프레임 기록 중이면 바로 그리지 않고 RenderManager에 등록만 합니다.
+        # (바뀐 영역만 다시 그리기 위함)
+        render_manager = RenderManager()
+        if render_manager.is_recording:
+            render_manager.submit(self._static_layer)
+            for component in dynamic_components:
+                render_manager.submit(component.render_object)
+            if self.cursor is not None and not self.cursor.hidden:
+                render_manager.submit(self.cursor)
+            return
+
+        self._static_layer.draw(canvas)
+        for component in dynamic_components:
             component.draw(canvas)
 
         if self.cursor is not None and not self.cursor.hidden:
             self.cursor.draw(canvas)
 
+    def invalidate_static_layer(self) -> None:
+        """정적 레이어를 다음 draw에서 다시 합성하도록 표시합니다."""
+        self._static_snapshot = None
+
+    def _refresh_static_layer(self) -> None:
+        """정적 컴포넌트가 추가/제거/변경되었으면 레이어를 다시 합성합니다."""
+        static_objects = [
+            c.render_object for c in self.render_components if c.is_static
+        ]
+        # 위치나 내용(render_key)이 바뀌면 자동으로 다시 합성됩니다.
+        snapshot: List[Hashable] = []
+        for render_object in static_objects:
+            bounds = render_object.get_bounds()
+            snapshot.append(
+                (
+                    id(render_object),
+                    bounds.as_box() if bounds else None,
+                    render_object.render_key(),
+                )
+            )
+        if snapshot == self._static_snapshot:
+            return
+
+        self._static_layer.compose(static_objects)
+        self._static_snapshot = snapshot
+
     def _try_wake_up_cursor(self) -> bool:
         if self.cursor and self.cursor.hidden:
             self.cursor.hidden = False
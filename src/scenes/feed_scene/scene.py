@@ -5,6 +5,8 @@ from settings.mushitroom_enums import InputActions, SceneType
 
 
 class FeedScene(BaseScene):
+    preload_scenes = [SceneType.LOBBY_SCENE]
+
     def __init__(self) -> None:
         super().__init__()
 
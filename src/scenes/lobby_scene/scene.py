@@ -1,6 +1,8 @@
 import time
 from typing import TypedDict, Unpack, TYPE_CHECKING
 
+from classes.asset_manifest import AssetManifest
+from classes.mushroom_class import MushroomType
 from classes.scene_base import BaseScene
 from classes.render_coordinate import RenderCoordinate
 from classes.render_size import RenderSize
@@ -11,7 +13,7 @@ from managers.input_manager.input_manager import InputManager
 from managers.audio_manager import AudioList, AudioManager
 from managers.sq_manager import SqManager
 from managers.ui_component_manager import UiComponentManager
-from settings.mushitroom_enums import InputActions, SceneType
+from settings.mushitroom_enums import FontStyle, InputActions, SceneType
 
 # 분리한 모듈 임포트
 from . import logic
@@ -29,6 +31,18 @@ class LobbySceneArgs(TypedDict):
 
 
 class LobbyScene(BaseScene):
+    asset_manifest = (
+        AssetManifest()
+        .add_cursor(RenderSize(82, 30))
+        .add_mushrooms([MushroomType.MAGUI], RenderSize(50, 50))
+        .add_font(FontStyle.COOKIE_BOLD, 12)
+        .add_font(FontStyle.COOKIE_BOLD, 10)
+        .add_image("./src/assets/images/btn_adopt.png", RenderSize(320 // 4, 100 // 4))
+        .add_image("./src/assets/images/btn_dance.png", RenderSize(320 // 4, 100 // 4))
+        .add_image("./src/assets/images/btn_supply.png", RenderSize(320 // 4, 100 // 4))
+    )
+    preload_scenes = [SceneType.FEED_SCENE, SceneType.SELECT_USER]
+
     ui_component_manager: UiComponentManager
     db: SqManager
 
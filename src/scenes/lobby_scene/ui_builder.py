@@ -40,7 +40,9 @@ def build_lobby_ui(scene: "LobbyScene"):
         font_style=FontStyle.COOKIE_BOLD,
     )
     scene.ui_component_manager.add_component(
-        RenderUiComponent(is_selectable=False, render_object=user_id_text)
+        RenderUiComponent(
+            is_selectable=False, is_static=True, render_object=user_id_text
+        )
     )
 
     # 3. 보유 버섯 목록 표시
@@ -62,6 +64,7 @@ def _build_mushroom_list(scene: "LobbyScene"):
         scene.ui_component_manager.add_component(
             RenderUiComponent(
                 is_selectable=False,
+                is_static=True,
                 render_object=RenderText(
                     font_size=12,
                     font_style=FontStyle.COOKIE_BOLD,
@@ -77,6 +80,7 @@ def _build_mushroom_list(scene: "LobbyScene"):
             scene.ui_component_manager.add_component(
                 RenderUiComponent(
                     is_selectable=False,
+                    is_static=True,
                     render_object=RenderText(
                         font_size=10,
                         font_style=FontStyle.COOKIE_BOLD,
@@ -108,6 +112,7 @@ def _build_bottom_buttons(scene: "LobbyScene"):
     scene.ui_component_manager.add_component(
         RenderUiComponent(
             is_selectable=is_adoptable,
+            is_static=True,
             # scene에 정의된 래퍼 메서드를 호출하거나 logic 함수를 직접 연결
             on_activate=scene.handle_adopt,
             render_object=adopt_button,
@@ -123,6 +128,7 @@ def _build_bottom_buttons(scene: "LobbyScene"):
     scene.ui_component_manager.add_component(
         RenderUiComponent(
             is_selectable=True,
+            is_static=True,
             on_activate=lambda: print("춤추기!"),
             render_object=dance_button,
         )
@@ -137,6 +143,7 @@ def _build_bottom_buttons(scene: "LobbyScene"):
     scene.ui_component_manager.add_component(
         RenderUiComponent(
             is_selectable=True,
+            is_static=True,
             on_activate=scene.handle_feed,
             render_object=supply_button,
         )
@@ -1,13 +1,15 @@
 from typing import TypedDict, Unpack
 
 from PIL.ImageDraw import ImageDraw
+from classes.asset_manifest import AssetManifest
 from classes.mushroom_class import MushroomType
+from classes.render_size import RenderSize
 from classes.scene_base import BaseScene
 from managers.ui_component_manager import UiComponentManager
 from scenes.mushroom_select_scene import logic, ui_builder
 from schemas.mushitroom_schema import MushitroomSchema
 from schemas.user_schema import GameState
-from settings.mushitroom_enums import InputActions, SceneType
+from settings.mushitroom_enums import FontStyle, InputActions, SceneType
 from utils.new_mushroom import new_mushroom
 
 
@@ -16,6 +18,17 @@ class SelectMushroomSceneArgs(TypedDict):
 
 
 class SelectMushroomScene(BaseScene):
+    asset_manifest = (
+        AssetManifest()
+        .add_cursor(RenderSize(320 // 3, 100 // 3))
+        .add_cursor(RenderSize(50, 50))
+        .add_button(RenderSize(320 // 3, 100 // 3), font_size=14)
+        .add_font(FontStyle.COOKIE_BOLD, 10)
+        # 유저가 가진 버섯은 종류를 미리 알 수 없으므로 전부
+        .add_mushrooms(MushroomType, RenderSize(50, 50))
+    )
+    preload_scenes = [SceneType.TITLE_SCENE]
+
     _user_id: str
     _game_state: GameState | None
     _mushroom_ui_manager: UiComponentManager
@@ -65,6 +65,7 @@ def build_mushrooms(scene: "SelectMushroomScene") -> None:
         )
         mushit_name_comp = RenderUiComponent(
             render_object=mushit_name_text,
+            is_static=True,
         )
 
         def jump_mushit_room(u_comp: RenderUiComponent):
@@ -128,5 +129,6 @@ def build_mushroom_select_scene_ui(scene: "SelectMushroomScene"):
         render_object=adopt_button,
         on_activate=lambda: logic.adopt_mushroom(scene=scene),
         is_selectable=True,
+        is_static=True,
     )
     _ui_manager.add_component(adopt_button_component)
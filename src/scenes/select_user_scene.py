@@ -8,6 +8,7 @@ from components.cursor_component import CursorComponent
 from classes.render_coordinate import RenderCoordinate
 from classes.render_size import RenderSize
 from classes.scene_base import BaseScene
+from classes.asset_manifest import AssetManifest
 
 # import settings
 from settings import mushitroom_config
@@ -36,6 +37,15 @@ LAYOUT_OFFSET_X = 0
 
 
 class SelectUserScene(BaseScene):
+    # 버튼 100x30, 커서는 버튼보다 4 큼
+    asset_manifest = (
+        AssetManifest()
+        .add_cursor(RenderSize(104, 34))
+        .add_button(RenderSize(100, 30), font_size=10)
+        .add_button(RenderSize(100, 30))
+    )
+    preload_scenes = [SceneType.SELECT_MUSHROOM, SceneType.TITLE_SCENE]
+
     _ui_component_manager: UiComponentManager
     _sound_fx_manager: AudioManager
     _input_manager: InputManager
@@ -88,6 +98,7 @@ class SelectUserScene(BaseScene):
         self._ui_component_manager.add_component(
             RenderUiComponent(
                 is_selectable=True,
+                is_static=True,
                 render_object=render_button,
                 on_activate=lambda: self.create_new_user(),
             )
@@ -106,6 +117,7 @@ class SelectUserScene(BaseScene):
             ui_component = RenderUiComponent(
                 render_object=user_btn,
                 is_selectable=True,
+                is_static=True,
                 on_activate=lambda u=user: self.select_user(u),
             )
 
@@ -2,6 +2,8 @@ import sys
 from typing import Any, List, Tuple
 
 from PIL.ImageDraw import ImageDraw
+from classes.asset_manifest import AssetManifest
+from classes.mushroom_class import MushroomType
 from classes.render_coordinate import RenderCoordinate
 from classes.render_size import RenderSize
 from classes.scene_base import BaseScene
@@ -13,10 +15,31 @@ from managers.scene_manager import SceneManager
 from managers.timer_manager import TimerManager
 from managers.ui_component_manager import UiComponentManager
 from scenes.title_scene.ui_builder import TitleSceneUiBuilder
-from settings.mushitroom_enums import InputActions, SceneType
+from settings.mushitroom_enums import FontStyle, InputActions, SceneType
 
 
 class TitleScene(BaseScene):
+    # 타이틀 버섯 7종은 TitleSceneUiBuilder와 같은 목록
+    asset_manifest = (
+        AssetManifest()
+        .add_cursor(RenderSize(100, 30))
+        .add_button(RenderSize(100, 30))
+        .add_font(FontStyle.COOKIE_BOLD, 30)
+        .add_mushrooms(
+            [
+                MushroomType.SALGU,
+                MushroomType.GWANG,
+                MushroomType.DALGYAL,
+                MushroomType.MAGUI,
+                MushroomType.GOMBO,
+                MushroomType.SASUM,
+                MushroomType.HWANGUM,
+            ],
+            RenderSize(30, 30),
+        )
+    )
+    preload_scenes = [SceneType.SELECT_USER]
+
     _ui_manager: UiComponentManager
     _ui_builder: TitleSceneUiBuilder
     _animated_mushit: List[Tuple[MushroomComponent, RenderUiComponent]]
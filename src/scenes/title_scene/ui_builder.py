@@ -30,6 +30,7 @@ class TitleSceneUiBuilder:
             ),
             is_selectable=False,
             on_activate=None,
+            is_static=True,
         )
         self.buttons: List[RenderUiComponent] = [
             RenderUiComponent(
@@ -92,6 +93,7 @@ class TitleSceneUiBuilder:
             # 1. START 버튼
             RenderUiComponent(
                 is_selectable=True,
+                is_static=True,
                 on_activate=on_start,
                 render_object=RenderButton(
                     coordinate=RenderCoordinate(CENTER_X, CENTER_Y + 30),  # 위치 조정
@@ -102,6 +104,7 @@ class TitleSceneUiBuilder:
             # 2. EXIT 버튼
             RenderUiComponent(
                 is_selectable=True,
+                is_static=True,
                 on_activate=on_exit,
                 render_object=RenderButton(
                     coordinate=RenderCoordinate(
@@ -114,6 +117,7 @@ class TitleSceneUiBuilder:
             # 2. GOEHA 버튼
             RenderUiComponent(
                 is_selectable=True,
+                is_static=True,
                 on_activate=on_goeha,
                 render_object=RenderButton(
                     coordinate=RenderCoordinate(
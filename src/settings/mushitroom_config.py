@@ -3,6 +3,7 @@
 # ===
 
 from enum import IntEnum
+import os
 import platform
 
 ZOOM_IN: int = 3
@@ -24,6 +25,106 @@ BG_COLOR = "white"
 FPS: int = 24
 SPI_SPEED = 48 * 1_000 * 1_000
 
+# ============
+# Game Loop (고정 timestep)
+# ============
+# 늦었을 때 한 번에 몰아서 실행할 최대 update 횟수 (넘으면 밀린 시간은 버림)
+MAX_CATCH_UP_STEPS: int = 5
+# 따라잡는 동안 연속으로 그리기를 건너뛸 수 있는 최대 프레임 수
+MAX_FRAME_SKIP: int = 4
+
+# ============
+# Profiler (프레임 계측)
+# ============
+# 단계별 시간 측정 (SIGUSR1 / F12 키로 CSV 저장)
+PROFILER_ENABLED: bool = False
+# 화면 왼쪽 위에 FPS와 프레임 시간 그래프 표시 (SIGUSR2 / F11 키로 켜고 끔)
+PROFILER_OVERLAY: bool = False
+# 보관할 프레임 수 (ring buffer)
+PROFILER_HISTORY: int = 240
+PROFILER_CSV_DIR: str = "./profiles"
+
+# ============
+# Dirty Rect (부분 갱신)
+# ============
+# 이 거리(px) 안에 있는 dirty rect는 하나의 창으로 합쳐서 전송
+DIRTY_RECT_MERGE_GAP: int = 8 * ZOOM_IN
+# dirty rect 넓이가 화면의 이 비율을 넘으면 전체 화면을 한 번에 전송
+DIRTY_RECT_FULL_FRAME_RATIO: float = 0.6
+
+# ============
+# Text Bitmap (글자 캐시)
+# ============
+# 미리 그려 둔 글자 비트맵(알파 마스크)에 쓸 최대 메모리 (bytes)
+TEXT_BITMAP_CACHE_MAX_BYTES: int = 512 * 1024
+
+
+# ============
+# Assets (빌드 결과물)
+# ============
+# build.py가 만드는 스프라이트 아틀라스 (없으면 개별 PNG를 읽음)
+ATLAS_DIR: str = "./src/assets/atlas"
+ATLAS_INDEX_PATH: str = f"{ATLAS_DIR}/atlas.json"
+# build.py가 씬 asset_manifest 크기대로 미리 리사이즈해 둔 스프라이트 팩
+# (디코딩된 픽셀을 그대로 저장해 mmap으로 복사 없이 읽음. 없으면 실행 시 리사이즈)
+ASSET_PACK_PATH: str = "./src/assets/pack/sprites.mpk"
+# build.py가 만드는 폰트 서브셋 (게임이 쓰는 글자만 남긴 폰트, 없으면 원본 폰트)
+FONT_SUBSET_DIR: str = "./src/assets/fonts/subset"
+FONT_SUBSET_CHARSET_PATH: str = f"{FONT_SUBSET_DIR}/charset.json"
+
+# 에셋 캐시 메모리 한도 (bytes). 넘으면 덜 쓴 것부터 버림 ("lru" / "lfu")
+# 이미지는 화면 크기에 맞춰 리사이즈해 두므로 ZOOM_IN^2 배
+IMAGE_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * ZOOM_IN * ZOOM_IN
+# 스프라이트 = 투명 테두리를 잘라낸 이미지 + 미리 만든 마스크
+SPRITE_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * ZOOM_IN * ZOOM_IN
+# 폰트 1개 = 폰트 파일 크기 (약 2MB)
+FONT_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+# 아틀라스 시트는 원본 크기. 스프라이트를 잘라낸 뒤에는 다시 쓰일 일이 적음
+ATLAS_SHEET_CACHE_MAX_BYTES: int = 4 * 1024 * 1024
+CACHE_EVICTION_POLICY: str = "lru"
+# 리사이즈한 이미지를 디스크에 저장해 두고 다음 실행부터 디코딩 없이 읽음
+# (원본 파일 내용 + 크기 + Pillow 버전으로 키를 만들므로 에셋이 바뀌면 자동으로 새로 만듦)
+DISK_CACHE_ENABLED: bool = True
+DISK_CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "mushitroom")
+# 넘으면 오래된 것부터 지움
+DISK_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+# 씬 에셋 목록(asset_manifest)을 보고 다음에 갈 만한 씬의 에셋을 백그라운드에서 미리 읽음
+ASSET_PRELOAD_ENABLED: bool = True
+
+# ============
+# Audio (효과음 / BGM 믹서)
+# ============
+# aplay 하나를 계속 띄워 두고 효과음과 BGM을 섞어서 보냄
+# (False면 효과음마다 aplay, BGM은 aplay 반복 실행)
+AUDIO_MIXER_ENABLED: bool = True
+AUDIO_SAMPLE_RATE: int = 44100
+AUDIO_CHANNELS: int = 2
+# 한 번에 섞는 프레임 수 (256 = 약 6ms)
+AUDIO_PERIOD_FRAMES: int = 256
+# 출력 장치에 미리 써 두는 양. 짧을수록 소리가 빨리 나오지만 끊기기 쉬움
+AUDIO_LATENCY_MS: int = 40
+# 믹서 출력: "aplay" (실제 장치) / "null" (버림) / "record" (AUDIO_RECORD_PATH에 WAV + 시각 기록)
+# null / record는 장치가 없어도 되므로 헤드리스 테스트와 audio_benchmark.py에서 사용
+AUDIO_BACKEND: str = "aplay"
+AUDIO_RECORD_PATH: str = "./audio_record.wav"
+# aplay -l / amixer가 응답하지 않을 때 기다리는 최대 시간 (오디오 스레드에서 실행)
+AUDIO_PROBE_TIMEOUT_SEC: float = 3.0
+# BGM을 바꾸거나 멈출 때 서로 겹쳐 줄이고 키우는 시간
+BGM_CROSSFADE_MS: int = 400
+# 볼륨을 바꿀 때 걸리는 시간 (바로 바꾸면 '틱' 소리가 남)
+AUDIO_GAIN_RAMP_MS: int = 50
+# 효과음이 나는 동안 BGM을 줄이는 정도 (1.0이면 줄이지 않음)
+BGM_DUCK_GAIN: float = 0.6
+BGM_DUCK_ATTACK_MS: int = 20
+BGM_DUCK_RELEASE_MS: int = 300
+# 효과음 동시 재생 수. 넘으면 가장 오래된 소리를 SFX_STEAL_FADE_MS 동안 줄이고 뺌
+# (SFX_VOICE_STEALING = False면 새 소리를 버림)
+SFX_MAX_VOICES: int = 4
+SFX_VOICE_STEALING: bool = True
+SFX_STEAL_FADE_MS: int = 5
+# 같은 효과음을 이 시간 안에 다시 틀면 버림 (목록을 빠르게 넘길 때 등)
+SFX_COOLDOWN_MS: int = 40
+
 
 # ============
 # GPIO PIN OUT
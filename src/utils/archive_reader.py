@@ -0,0 +1,221 @@
+import io
+import mmap
+import os
+import posixpath
+import struct
+import threading
+import zipfile
+
+# --------------------------------------------------------------------------
+# .pyz(zipapp) 안의 에셋 읽기
+# 아카이브는 처음 한 번만 열고 목록(central directory)을 색인해 둡니다.
+# 압축하지 않고 저장한 항목(ZIP_STORED)은 mmap 위의 memoryview로 복사 없이 넘깁니다.
+# --------------------------------------------------------------------------
+
+# zip local file header (30 bytes): signature ~ extra field length
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+_ARCHIVES: dict[str, "PyzArchive | None"] = {}
+_archives_lock = threading.Lock()
+
+
+class MemoryViewStream(io.RawIOBase):
+    """
+    memoryview를 파일처럼 읽는 스트림 (전체를 복사하지 않음)
+    getbuffer()는 io.BytesIO와 같은 이름
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self._view = view
+        self._position = 0
+
+    def getbuffer(self) -> memoryview:
+        return self._view
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"negative seek position: {position}")
+        self._position = position
+        return position
+
+    def read(self, size: int | None = -1) -> bytes:
+        # RawIOBase.read는 readinto를 여러 번 부르므로 한 번에 잘라서 반환
+        end = len(self._view) if size is None or size < 0 else self._position + size
+        data = self._view[self._position : end].tobytes()
+        self._position += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self._view[self._position : self._position + len(buffer)]
+        size = len(data)
+        buffer[:size] = data
+        self._position += size
+        return size
+
+
+class PyzArchive:
+    """
+    열어 둔 .pyz 아카이브 하나
+
+    - 항목 이름(정규화한 경로) -> ZipInfo 색인
+    - ZIP_STORED 항목: mmap 위치를 계산해 memoryview로 반환 (복사 없음)
+    - 압축된 항목: 한 번 풀어서 반환
+    """
+
+    path: str
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "r")
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._members = {
+            posixpath.normpath(info.filename): info
+            for info in self._zip.infolist()
+            if not info.is_dir()
+        }
+        # 항목 데이터 시작 위치 (local header를 읽어야 알 수 있으므로 처음 읽을 때 계산)
+        self._data_offsets: dict[str, int] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return posixpath.normpath(name) in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def get_info(self, name: str) -> zipfile.ZipInfo | None:
+        """항목 정보 (CRC, 크기 등). 내용은 읽지 않음. 없으면 None"""
+        return self._members.get(posixpath.normpath(name))
+
+    def read(self, name: str) -> memoryview | None:
+        """항목 내용. 없으면 None"""
+        name = posixpath.normpath(name)
+        info = self._members.get(name)
+        if info is None:
+            return None
+
+        if info.compress_type == zipfile.ZIP_STORED:
+            start = self._get_data_offset(name, info)
+            return memoryview(self._mmap)[start : start + info.file_size]
+        # ZipFile은 여러 스레드에서 읽어도 파일 위치를 lock으로 보호함
+        return memoryview(self._zip.read(info))
+
+    def open(self, name: str) -> MemoryViewStream | None:
+        view = self.read(name)
+        if view is None:
+            return None
+        return MemoryViewStream(view)
+
+    def _get_data_offset(self, name: str, info: zipfile.ZipInfo) -> int:
+        offset = self._data_offsets.get(name)
+        if offset is not None:
+            return offset
+
+        # header_offset은 ZipFile이 앞에 붙은 shebang 길이까지 더해 둔 값
+        header_start = info.header_offset
+        header = _LOCAL_HEADER.unpack_from(self._mmap, header_start)
+        if header[0] != _LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"잘못된 local header: {name}")
+        name_length, extra_length = header[9], header[10]
+        offset = header_start + _LOCAL_HEADER.size + name_length + extra_length
+        self._data_offsets[name] = offset
+        return offset
+
+
+def get_archive(archive_path: str) -> PyzArchive | None:
+    """archive_path의 아카이브를 (처음 한 번만) 열어 반환합니다. 열 수 없으면 None"""
+    archive_path = os.path.abspath(archive_path)
+    with _archives_lock:
+        if archive_path in _ARCHIVES:
+            return _ARCHIVES[archive_path]
+
+        archive: PyzArchive | None = None
+        try:
+            archive = PyzArchive(archive_path)
+            print(f"📦 아카이브 색인: {archive_path} ({len(archive)}개)")
+        except Exception as e:
+            print(f"❌ 아카이브 열기 실패: {archive_path} / {e}")
+        _ARCHIVES[archive_path] = archive
+        return archive
+
+
+def _split_archive_path(path: str) -> tuple[str, str] | None:
+    """
+    [내부 함수] 리소스 경로를 (아카이브 경로, 내부 경로)로 나눕니다.
+    - "/app/mushitroom.pyz/src/classes/../assets/a.ttf" -> ("/app/mushitroom.pyz", "src/assets/a.ttf")
+    - "./src/assets/a.png" -> .pyz로 실행 중이면 (실행 중인 .pyz, "src/assets/a.png")
+    """
+    unified_path = path.replace("\\", "/")
+    if ".pyz/" in unified_path:
+        archive_path, internal_path = unified_path.split(".pyz/", 1)
+        return archive_path + ".pyz", posixpath.normpath(internal_path)
+
+    running_archive_path = _get_running_archive_path()
+    if running_archive_path is None or posixpath.isabs(unified_path):
+        return None
+    return running_archive_path, posixpath.normpath(unified_path)
+
+
+def _get_running_archive_path() -> str | None:
+    """[내부 함수] .pyz로 실행 중이면 그 경로 (이 모듈의 __file__이 .pyz 안에 있음)"""
+    unified_path = __file__.replace("\\", "/")
+    if ".pyz/" not in unified_path:
+        return None
+    return unified_path.split(".pyz/", 1)[0] + ".pyz"
+
+
+def read_archive_member(path: str) -> memoryview | None:
+    """.pyz 안의 리소스 내용. .pyz 경로가 아니거나 없으면 None"""
+    split_path = _split_archive_path(path)
+    if split_path is None:
+        return None
+    archive = get_archive(split_path[0])
+    if archive is None:
+        return None
+    return archive.read(split_path[1])
+
+
+def open_archive_member(path: str) -> MemoryViewStream | None:
+    """.pyz 안의 리소스를 스트림으로 엽니다. .pyz 경로가 아니거나 없으면 None"""
+    view = read_archive_member(path)
+    if view is None:
+        return None
+    return MemoryViewStream(view)
+
+
+def get_archive_member_info(path: str) -> zipfile.ZipInfo | None:
+    """.pyz 안의 리소스 정보 (색인에 있는 값만, 내용은 읽지 않음). 없으면 None"""
+    split_path = _split_archive_path(path)
+    if split_path is None:
+        return None
+    archive = get_archive(split_path[0])
+    if archive is None:
+        return None
+    return archive.get_info(split_path[1])
+
+
+def has_archive_member(path: str) -> bool:
+    split_path = _split_archive_path(path)
+    if split_path is None:
+        return False
+    archive = get_archive(split_path[0])
+    return archive is not None and split_path[1] in archive
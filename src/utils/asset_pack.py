@@ -0,0 +1,147 @@
+import json
+import mmap
+import os
+import struct
+import threading
+
+from PIL import Image
+
+from settings.mushitroom_config import ZOOM_IN
+from utils.archive_reader import read_archive_member
+from utils.sprite_blit import BLIT_ALPHA, BLIT_OPAQUE, SpriteBlit
+
+# --------------------------------------------------------------------------
+# 에셋 팩 (.mpk): build.py가 디코딩/리사이즈까지 끝낸 픽셀을 그대로 저장한 파일
+#
+#   [헤더 20 bytes] magic(8) / version(u32) / 인덱스 길이(u32) / 픽셀 영역 시작(u32)
+#   [인덱스 JSON]   {"mode": "RGBA", "zoom": 1,
+#                    "images": {"src/assets/images/a.png": {"WxH": [offset, bbox, kind]}}}
+#                    bbox: 보이는 영역 [left, top, right, bottom] (완전히 투명하면 null)
+#                    kind: sprite_blit의 paste 방식 (opaque / binary / alpha)
+#   [픽셀 블록]     PACK_ALIGNMENT 단위로 정렬, offset은 픽셀 영역 시작부터
+#                    블록 뒤에 한 줄만큼 여유를 둠 (bbox 뷰는 마지막 줄도 한 줄 길이를 요구함)
+#
+# 파일을 mmap 하고 Image.frombuffer로 그 위에 이미지를 만들므로 디코딩도 복사도 없습니다.
+# 스프라이트도 bbox 부분을 줄 간격(stride)만 원본 너비로 준 뷰로 만들므로 잘라낸 복사본이 없습니다.
+# (픽셀은 페이지 캐시에 있고, 메모리가 부족하면 커널이 버렸다가 다시 읽음)
+# frombuffer 이미지는 읽기 전용이라 수정하면 PIL이 먼저 복사합니다.
+# --------------------------------------------------------------------------
+
+PACK_HEADER = struct.Struct("<8sIII")
+PACK_MAGIC = b"MUSHPAK\x00"
+PACK_VERSION = 2
+PACK_ALIGNMENT = 64
+PACK_MODE = "RGBA"
+
+_packs: dict[str, "AssetPack | None"] = {}
+_packs_lock = threading.Lock()
+
+
+class AssetPack:
+    """
+    열어 둔 에셋 팩 하나
+    get_image(키, 너비, 높이) -> mmap 위의 읽기 전용 이미지 (없으면 None)
+    get_sprite(키, 너비, 높이) -> 보이는 영역만 가리키는 mmap 위의 스프라이트 (없으면 None)
+    """
+
+    path: str
+    mode: str
+    # 빌드할 때 맞춘 ZOOM_IN (없으면 모름)
+    zoom: int | None
+
+    def __init__(self, path: str, buffer: memoryview) -> None:
+        self.path = path
+        self._buffer = buffer
+
+        magic, version, index_length, data_start = PACK_HEADER.unpack_from(buffer, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("에셋 팩 형식이 아님")
+        if version != PACK_VERSION:
+            raise ValueError(f"지원하지 않는 에셋 팩 버전: {version}")
+
+        index_start = PACK_HEADER.size
+        index = json.loads(bytes(buffer[index_start : index_start + index_length]))
+        self.mode = index["mode"]
+        self.zoom = index.get("zoom")
+        self._images: dict[str, dict[str, list]] = index["images"]
+        self._bands = Image.getmodebands(self.mode)
+        self._data_start = data_start
+
+    def __len__(self) -> int:
+        return sum(len(sizes) for sizes in self._images.values())
+
+    def get_image(self, key: str, width: int, height: int) -> Image.Image | None:
+        entry = self._get_entry(key, width, height)
+        if entry is None:
+            return None
+        return self._map(entry[0], (0, 0, width, height), width)
+
+    def get_sprite(self, key: str, width: int, height: int) -> SpriteBlit | None:
+        """
+        빌드할 때 정해 둔 bbox와 paste 방식으로 스프라이트를 만듭니다. (자르기/마스크 복사 없음)
+        투명도가 있으면 RGBA 이미지 자신을 마스크로 씀 (binary도 알파가 0/255라 결과가 같음)
+        """
+        entry = self._get_entry(key, width, height)
+        if entry is None:
+            return None
+        offset, bbox, kind = entry
+        if bbox is None:
+            return SpriteBlit(BLIT_ALPHA, None, None, (0, 0))  # 완전히 투명
+        image = self._map(offset, tuple(bbox), width)
+        mask = None if kind == BLIT_OPAQUE else image
+        return SpriteBlit(kind, image, mask, (bbox[0], bbox[1]))
+
+    def _get_entry(self, key: str, width: int, height: int) -> list | None:
+        sizes = self._images.get(key)
+        return sizes.get(f"{width}x{height}") if sizes else None
+
+    def _map(
+        self, offset: int, box: tuple[int, int, int, int], full_width: int
+    ) -> Image.Image:
+        """블록(full_width 너비) 안의 box 부분을 가리키는 읽기 전용 이미지"""
+        left, top, right, bottom = box
+        stride = full_width * self._bands
+        start = self._data_start + offset + top * stride + left * self._bands
+        return Image.frombuffer(
+            self.mode,
+            (right - left, bottom - top),
+            self._buffer[start : start + (bottom - top) * stride],
+            "raw",
+            self.mode,
+            stride,
+            1,
+        )
+
+
+def _open_pack_buffer(path: str) -> memoryview | None:
+    """[내부 함수] 팩 파일 전체를 memoryview로 (파일은 mmap, .pyz 안이면 아카이브의 mmap)"""
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            # mmap은 파일을 닫아도 유지됨
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    # build.py가 압축 없이 저장하므로 복사 없이 아카이브 mmap을 가리킴
+    return read_archive_member(path)
+
+
+def get_asset_pack(path: str) -> AssetPack | None:
+    """path의 에셋 팩을 (처음 한 번만) 열어 반환합니다. 없거나 열 수 없으면 None"""
+    with _packs_lock:
+        if path in _packs:
+            return _packs[path]
+
+        pack: AssetPack | None = None
+        try:
+            buffer = _open_pack_buffer(path)
+            if buffer is not None:
+                pack = AssetPack(path, buffer)
+                print(f"📦 에셋 팩: {path} ({len(pack)}개)")
+                if pack.zoom is not None and pack.zoom != ZOOM_IN:
+                    print(
+                        f"⚠️ 에셋 팩이 ZOOM_IN {pack.zoom}용입니다. (현재 {ZOOM_IN})"
+                        f" 'python build.py sprites --zoom {ZOOM_IN}'로 다시 만들어 주세요."
+                    )
+        except Exception as e:
+            print(f"❌ 에셋 팩 열기 실패: {path} / {e}")
+        _packs[path] = pack
+        return pack
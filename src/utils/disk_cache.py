@@ -0,0 +1,180 @@
+import hashlib
+import os
+import struct
+import threading
+
+import PIL
+from PIL import Image
+
+from settings.mushitroom_config import (
+    DISK_CACHE_DIR,
+    DISK_CACHE_ENABLED,
+    DISK_CACHE_MAX_BYTES,
+)
+
+# --------------------------------------------------------------------------
+# 디코딩/리사이즈한 이미지를 실행이 끝나도 남겨 두는 디스크 캐시
+#
+#   DISK_CACHE_DIR/images/<키>.rgba = [헤더 12 bytes] magic(4) / 너비(u32) / 높이(u32) + RGBA 픽셀
+#
+# 키 = 원본 정보 + 크기 + 리사이즈 방식 + 이 형식의 버전 + Pillow 버전의 해시
+#   원본 정보는 원본을 읽지 않고 얻는 값 (파일: 경로/크기/수정 시각, .pyz: 항목 CRC/크기)
+#   -> 캐시에 있으면 부팅할 때 원본 에셋은 열지도 않음
+# 원본 에셋이나 리사이즈 결과가 바뀔 수 있는 빌드가 바뀌면 키가 달라지므로 옛 항목은 쓰이지 않고,
+# DISK_CACHE_MAX_BYTES를 넘을 때 오래된 것부터 지워집니다.
+# --------------------------------------------------------------------------
+
+_ENTRY_HEADER = struct.Struct("<4sII")
+_ENTRY_MAGIC = b"MSHC"
+_ENTRY_SUFFIX = ".rgba"
+# 저장 형식이나 load_resized_image의 변환 방식(키 포함)이 바뀌면 올립니다.
+DISK_CACHE_VERSION = 3
+
+_lock = threading.Lock()
+# None = 아직 확인 안 함, False = 쓸 수 없음 (읽기 전용 등)
+_image_dir: str | None | bool = None
+_is_pruned = False
+_stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+
+def make_image_key(source_stamp: str, width: int, height: int, resample: int) -> str:
+    """
+    원본 정보, 크기, 리사이즈 방식으로 캐시 키를 만듭니다.
+    :param source_stamp: 원본이 바뀌면 달라지는 값 (resource_loader가 원본을 읽지 않고 만듦)
+    """
+    digest = hashlib.blake2b(source_stamp.encode("utf-8"), digest_size=16)
+    build_info = f"|{width}x{height}|r{int(resample)}|v{DISK_CACHE_VERSION}"
+    digest.update(f"{build_info}|pil{PIL.__version__}".encode())
+    return digest.hexdigest()
+
+
+def load_cached_image(key: str, width: int, height: int) -> Image.Image | None:
+    """디스크에 저장해 둔 이미지. 없거나 깨졌으면 None"""
+    image_dir = _get_image_dir()
+    if not image_dir:
+        return None
+
+    entry_path = os.path.join(image_dir, key + _ENTRY_SUFFIX)
+    try:
+        with open(entry_path, "rb") as f:
+            data = f.read()  # 헤더와 픽셀을 한 번에 읽음
+    except FileNotFoundError:
+        _count("misses")
+        return None
+    except OSError as e:
+        print(f"⚠️ 디스크 캐시 읽기 실패: {entry_path} / {e}")
+        _count("errors")
+        return None
+
+    pixel_size = width * height * 4
+    if len(data) != _ENTRY_HEADER.size + pixel_size or _ENTRY_HEADER.unpack_from(
+        data
+    ) != (_ENTRY_MAGIC, width, height):
+        print(f"⚠️ 디스크 캐시 항목이 깨져 있어 다시 만듭니다: {entry_path}")
+        _count("errors")
+        return None
+
+    _count("hits")
+    try:
+        os.utime(entry_path)  # 정리할 때 최근에 쓴 항목을 남기기 위함
+    except OSError:
+        pass
+    # 읽은 bytes 위에 바로 이미지를 만듦 (복사 없음, 읽기 전용)
+    return Image.frombuffer(
+        "RGBA",
+        (width, height),
+        memoryview(data)[_ENTRY_HEADER.size :],
+        "raw",
+        "RGBA",
+        0,
+        1,
+    )
+
+
+def save_cached_image(key: str, image: Image.Image) -> None:
+    """이미지를 디스크에 저장합니다. (실패해도 게임에는 영향 없음)"""
+    image_dir = _get_image_dir()
+    if not image_dir or image.mode != "RGBA":
+        return
+
+    entry_path = os.path.join(image_dir, key + _ENTRY_SUFFIX)
+    # 다른 스레드/프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 이름을 바꿈
+    temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(_ENTRY_HEADER.pack(_ENTRY_MAGIC, image.width, image.height))
+            f.write(image.tobytes())
+        os.replace(temp_path, entry_path)
+    except OSError as e:
+        print(f"⚠️ 디스크 캐시 저장 실패: {entry_path} / {e}")
+        _count("errors")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+
+    _count("writes")
+    _prune_once()
+
+
+def get_disk_cache_stats() -> dict[str, int | str]:
+    with _lock:
+        return {"dir": DISK_CACHE_DIR, **_stats}
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _stats[name] += 1
+
+
+def _get_image_dir() -> str | None:
+    """[내부 함수] 캐시 폴더 (처음 한 번 만들어 봄). 쓸 수 없으면 None"""
+    global _image_dir
+    with _lock:
+        if _image_dir is None:
+            _image_dir = False
+            if DISK_CACHE_ENABLED:
+                image_dir = os.path.join(DISK_CACHE_DIR, "images")
+                try:
+                    os.makedirs(image_dir, exist_ok=True)
+                    _image_dir = image_dir
+                except OSError as e:
+                    print(f"⚠️ 디스크 캐시를 쓸 수 없습니다: {image_dir} / {e}")
+        return _image_dir or None
+
+
+def _prune_once() -> None:
+    """[내부 함수] 실행마다 처음 저장할 때 한 번, 한도를 넘은 만큼 오래된 항목을 지웁니다."""
+    global _is_pruned
+    with _lock:
+        if _is_pruned:
+            return
+        _is_pruned = True
+
+    image_dir = _get_image_dir()
+    if not image_dir:
+        return
+    try:
+        entries = []
+        for entry in os.scandir(image_dir):
+            if entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError as e:
+        print(f"⚠️ 디스크 캐시 정리 실패: {e}")
+        return
+
+    total_bytes = sum(size for _, size, _ in entries)
+    removed_count = 0
+    for _, size, path in sorted(entries):  # 오래된 것부터
+        if total_bytes <= DISK_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            total_bytes -= size
+            removed_count += 1
+        except OSError:
+            pass
+    if removed_count:
+        print(f"📦 디스크 캐시 정리: {removed_count}개 삭제")
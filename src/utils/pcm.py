@@ -0,0 +1,268 @@
+import os
+import struct
+import wave
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from utils.archive_reader import open_archive_member
+
+# 한 번에 파일에서 읽는 최소 프레임 수 (BGM 스트리밍)
+_STREAM_READ_FRAMES = 4096
+
+# RIFF 청크 크기, smpl 청크 헤더(36 bytes)와 루프 항목(24 bytes)
+_CHUNK_SIZE = struct.Struct("<I")
+_SMPL_HEADER = struct.Struct("<9I")
+_SMPL_LOOP = struct.Struct("<6I")
+
+
+def is_pcm_available() -> bool:
+    """NumPy가 있어야 PCM 디코딩/믹싱을 쓸 수 있습니다."""
+    return np is not None
+
+
+def _open_wav(path: str) -> wave.Wave_read | None:
+    """[내부 함수] 파일 또는 .pyz 안의 WAV를 엽니다."""
+    if os.path.exists(path):
+        return wave.open(path, "rb")
+    member_stream = open_archive_member(path)  # .pyz 안
+    if member_stream is None:
+        print(f"⚠️ 오디오 파일을 찾을 수 없음: {path}")
+        return None
+    return wave.open(member_stream, "rb")
+
+
+def _decode_frames(
+    data: bytes, sample_width: int, source_channels: int, channels: int
+) -> "np.ndarray":
+    """[내부 함수] PCM bytes -> float32 (프레임 수, channels). 샘플레이트는 그대로"""
+    if sample_width == 1:
+        # 8bit WAV는 unsigned
+        samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) * 256
+    else:
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32)
+    samples = samples.reshape(-1, source_channels)
+
+    # 채널 맞추기 (모노 <-> 스테레오)
+    if source_channels != channels:
+        mono = samples.mean(axis=1, keepdims=True)
+        samples = np.repeat(mono, channels, axis=1)
+    return samples
+
+
+def load_wav(path: str, sample_rate: int, channels: int) -> "np.ndarray | None":
+    """
+    WAV 파일을 믹서 형식으로 디코딩합니다.
+    :return: int16 배열 (프레임 수, channels). 읽을 수 없으면 None
+    """
+    if np is None:
+        raise RuntimeError("PCM 디코딩에는 numpy가 필요합니다.")
+
+    try:
+        wav_file = _open_wav(path)
+        if wav_file is None:
+            return None
+        with wav_file:
+            source_channels = wav_file.getnchannels()
+            sample_width = wav_file.getsampwidth()
+            source_rate = wav_file.getframerate()
+            data = wav_file.readframes(wav_file.getnframes())
+    except (OSError, EOFError, wave.Error) as e:
+        print(f"❌ WAV 읽기 실패: {path} / {e}")
+        return None
+
+    if sample_width not in (1, 2):
+        print(f"❌ 지원하지 않는 WAV 형식 ({sample_width * 8}bit): {path}")
+        return None
+    samples = _decode_frames(data, sample_width, source_channels, channels)
+
+    # 샘플레이트 맞추기 (선형 보간, 효과음 용도로는 충분)
+    if source_rate != sample_rate and len(samples) > 0:
+        frame_count = max(1, round(len(samples) * sample_rate / source_rate))
+        source_times = np.arange(len(samples)) / source_rate
+        target_times = np.arange(frame_count) / sample_rate
+        samples = np.stack(
+            [
+                np.interp(target_times, source_times, samples[:, channel])
+                for channel in range(channels)
+            ],
+            axis=1,
+        )
+
+    return np.clip(samples, -32768, 32767).astype(np.int16)
+
+
+def read_wav_loop_points(path: str) -> tuple[int, int] | None:
+    """
+    WAV의 smpl 청크에 적힌 첫 번째 루프 구간 (시작 프레임, 끝 프레임)
+    (끝 프레임은 포함하지 않음) 없으면 None
+    """
+    try:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+        else:
+            member_stream = open_archive_member(path)
+            if member_stream is None:
+                return None
+            data = member_stream.getbuffer()
+    except OSError:
+        return None
+
+    if len(data) < 12 or bytes(data[0:4]) != b"RIFF" or bytes(data[8:12]) != b"WAVE":
+        return None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = bytes(data[offset : offset + 4])
+        (chunk_size,) = _CHUNK_SIZE.unpack_from(data, offset + 4)
+        body = offset + 8
+        if chunk_id == b"smpl" and chunk_size >= _SMPL_HEADER.size:
+            loop_count = _SMPL_HEADER.unpack_from(data, body)[7]
+            loop_offset = body + _SMPL_HEADER.size
+            if loop_count > 0 and loop_offset + _SMPL_LOOP.size <= len(data):
+                _, _, start, end, _, _ = _SMPL_LOOP.unpack_from(data, loop_offset)
+                if end > start:
+                    return start, end + 1  # smpl의 끝은 마지막 프레임을 포함함
+            return None
+        offset = body + chunk_size + (chunk_size & 1)  # 청크는 2바이트 정렬
+    return None
+
+
+class WavStream:
+    """
+    WAV를 조금씩 읽어 믹서 형식으로 돌려주는 스트림 (BGM용)
+
+    파일 전체를 디코딩하지 않고 read()가 부를 때마다 필요한 만큼만 읽습니다.
+    loop이면 loop_end에 닿는 순간 loop_start로 돌아가 이어 읽으므로
+    반복 지점에서 끊김이 없습니다. (같은 read() 안에서 이어 붙임)
+    샘플레이트가 다르면 앞 조각의 마지막 프레임을 남겨 두고 선형 보간합니다.
+    """
+
+    path: str
+    sample_rate: int
+    channels: int
+    loop: bool
+    loop_start: int
+    loop_end: int
+    # 끝까지 읽었음 (loop가 아닐 때)
+    is_finished: bool
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: int,
+        channels: int,
+        loop: bool = True,
+        loop_points: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        :param loop_points: 반복 구간 (시작 프레임, 끝 프레임), 원본 샘플레이트 기준.
+            None이면 smpl 청크, 그것도 없으면 파일 전체
+        """
+        if np is None:
+            raise RuntimeError("PCM 디코딩에는 numpy가 필요합니다.")
+
+        wav_file = _open_wav(path)
+        if wav_file is None:
+            raise FileNotFoundError(path)
+        self._wav_file = wav_file
+        self._source_channels = wav_file.getnchannels()
+        self._sample_width = wav_file.getsampwidth()
+        if self._sample_width not in (1, 2):
+            wav_file.close()
+            raise wave.Error(f"지원하지 않는 WAV 형식 ({self._sample_width * 8}bit)")
+        frame_count = wav_file.getnframes()
+
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.loop = loop
+        if loop_points is None:
+            loop_points = read_wav_loop_points(path)
+        if loop_points is None:
+            loop_points = (0, frame_count)
+        self.loop_start = max(0, min(loop_points[0], frame_count))
+        self.loop_end = max(self.loop_start, min(loop_points[1], frame_count))
+        if self.loop_end == self.loop_start:
+            self.loop = False  # 반복할 구간이 없음
+        self.is_finished = False
+
+        # 원본 프레임 / 출력 프레임
+        self._step = wav_file.getframerate() / sample_rate
+        # 아직 다 쓰지 않은 원본 프레임과, 그 안에서 다음 출력 프레임의 위치
+        self._pending = np.zeros((0, channels), dtype=np.float32)
+        self._phase = 0.0
+        self._source_ended = False
+
+    def read(self, frame_count: int) -> "np.ndarray":
+        """
+        float32 (최대 frame_count, channels). 끝에 닿으면 짧게, 다 읽었으면 빈 배열
+        (믹싱 스레드에서 부름)
+        """
+        if self._step == 1.0:
+            self._fill(frame_count)
+            chunk = self._pending[:frame_count]
+            self._pending = self._pending[len(chunk) :]
+        else:
+            # 보간에 다음 프레임 하나가 더 필요함
+            needed = int(self._phase + (frame_count - 1) * self._step) + 2
+            self._fill(needed)
+            available = len(self._pending) - 1
+            if available < 1:
+                chunk = self._pending[:0]
+            else:
+                positions = self._phase + np.arange(frame_count) * self._step
+                positions = positions[positions < available]
+                indexes = positions.astype(np.int64)
+                weights = (positions - indexes).astype(np.float32)[:, None]
+                chunk = (
+                    self._pending[indexes] * (1 - weights)
+                    + self._pending[indexes + 1] * weights
+                )
+                next_position = self._phase + len(chunk) * self._step
+                consumed = int(next_position)
+                self._pending = self._pending[consumed:]
+                self._phase = next_position - consumed
+
+        if len(chunk) == 0 and self._source_ended:
+            self.is_finished = True
+        return chunk
+
+    def close(self) -> None:
+        try:
+            self._wav_file.close()
+        except Exception:
+            pass
+
+    def _fill(self, frame_count: int) -> None:
+        """[내부 함수] _pending에 원본 프레임이 frame_count개 이상 있도록 읽음"""
+        missing = frame_count - len(self._pending)
+        if missing <= 0 or self._source_ended:
+            return
+
+        pieces = [self._pending]
+        while missing > 0:
+            position = self._wav_file.tell()
+            if position >= self.loop_end:
+                if not self.loop:
+                    self._source_ended = True
+                    break
+                self._wav_file.setpos(self.loop_start)
+                position = self.loop_start
+            read_count = min(max(missing, _STREAM_READ_FRAMES), self.loop_end - position)
+            data = self._wav_file.readframes(read_count)
+            if not data:
+                # 헤더보다 파일이 짧음 -> 여기를 끝으로 봄
+                self.loop_end = position
+                if not self.loop or position <= self.loop_start:
+                    self._source_ended = True
+                    break
+                continue
+            piece = _decode_frames(
+                data, self._sample_width, self._source_channels, self.channels
+            )
+            pieces.append(piece)
+            missing -= len(piece)
+        self._pending = np.concatenate(pieces)
@@ -1,35 +1,147 @@
 import os
 import io
-import zipfile
+import json
 import posixpath
 from PIL import Image, ImageFont, UnidentifiedImageError
 
+from utils.archive_reader import (
+    MemoryViewStream,
+    get_archive_member_info,
+    has_archive_member,
+    open_archive_member,
+)
+from utils.asset_pack import get_asset_pack
+from utils.sprite_blit import SpriteBlit, classify_sprite
+from utils.disk_cache import (
+    get_disk_cache_stats,
+    load_cached_image,
+    make_image_key,
+    save_cached_image,
+)
+from classes.byte_budget_cache import ByteBudgetCache, get_image_byte_size
+from settings.mushitroom_config import (
+    ATLAS_DIR,
+    ATLAS_INDEX_PATH,
+    ASSET_PACK_PATH,
+    ATLAS_SHEET_CACHE_MAX_BYTES,
+    CACHE_EVICTION_POLICY,
+    DISK_CACHE_ENABLED,
+    FONT_CACHE_MAX_BYTES,
+    FONT_SUBSET_CHARSET_PATH,
+    FONT_SUBSET_DIR,
+    IMAGE_CACHE_MAX_BYTES,
+    SPRITE_CACHE_MAX_BYTES,
+)
+
 # --------------------------------------------------------------------------
 # [Global Cache Storage]
-# 이미지는 (경로, 너비, 높이)를 키로 저장
-# 폰트는 (경로, 크기)를 키로 저장
+# 이미지는 (경로, 너비, 높이, 리사이즈 방식)을 키로 저장
+# 폰트는 (경로, 크기)를 키로 저장 (크기 = 폰트 파일 크기, FreeType이 통째로 들고 있음)
+# 스프라이트(잘라낸 이미지 + 마스크)는 이미지와 같은 키로 저장
+# 아틀라스 시트는 시트 이름을 키로 저장 (프레임마다가 아니라 시트마다 1개)
+# 각각 메모리 한도가 있고, 넘으면 CACHE_EVICTION_POLICY에 따라 덜 쓴 것부터 버립니다.
 # --------------------------------------------------------------------------
-_IMAGE_CACHE: dict[tuple[str, int, int], Image.Image] = {}
-_FONT_CACHE: dict[tuple[str, int], ImageFont.ImageFont | ImageFont.FreeTypeFont] = {}
+_IMAGE_CACHE: ByteBudgetCache[tuple[str, int, int, int], Image.Image] = (
+    ByteBudgetCache("image", IMAGE_CACHE_MAX_BYTES, CACHE_EVICTION_POLICY)
+)
+_FONT_CACHE: ByteBudgetCache[
+    tuple[str, int], ImageFont.ImageFont | ImageFont.FreeTypeFont
+] = ByteBudgetCache("font", FONT_CACHE_MAX_BYTES, CACHE_EVICTION_POLICY)
+_SPRITE_CACHE: ByteBudgetCache[tuple[str, int, int, int], SpriteBlit] = (
+    ByteBudgetCache("sprite", SPRITE_CACHE_MAX_BYTES, CACHE_EVICTION_POLICY)
+)
+_ATLAS_SHEET_CACHE: ByteBudgetCache[str, Image.Image] = ByteBudgetCache(
+    "atlas_sheet", ATLAS_SHEET_CACHE_MAX_BYTES, CACHE_EVICTION_POLICY
+)
+# build.py가 만든 인덱스 (None = 아직 안 읽음, 빈 dict = 빌드 결과물 없음)
+_atlas_index: dict | None = None
+# 폰트 서브셋 정보 (None = 아직 안 읽음) / 서브셋에 들어 있는 글자
+_font_subset_info: dict | None = None
+_font_subset_chars: frozenset[str] = frozenset()
 
 
 def clear_caches():
     """
     [메모리 관리] 캐시된 모든 이미지와 폰트를 메모리에서 해제합니다.
-    씬(Scene) 전환 시나 메모리 부족 시 호출하세요.
+    평소에는 메모리 한도로 충분하고, 메모리가 급히 필요할 때만 호출하세요.
     """
     _IMAGE_CACHE.clear()
+    _SPRITE_CACHE.clear()
     _FONT_CACHE.clear()
+    _ATLAS_SHEET_CACHE.clear()
+
+
+def is_image_cached(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> bool:
+    """load_resized_image(path, width, height, resample)가 바로 반환되는지 확인합니다."""
+    return (path, width, height, resample) in _IMAGE_CACHE
+
+
+def is_sprite_cached(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> bool:
+    """load_sprite(path, width, height, resample)가 바로 반환되는지 확인합니다."""
+    return (path, width, height, resample) in _SPRITE_CACHE
+
+
+def is_font_cached(path: str, size: int) -> bool:
+    """load_custom_font(path, size)가 바로 반환되는지 확인합니다."""
+    return (path, size) in _FONT_CACHE
+
+
+def pin_image(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> None:
+    """항상 화면에 있는 이미지(커서 등)는 메모리 한도를 넘어도 버리지 않습니다."""
+    _IMAGE_CACHE.pin((path, width, height, resample))
+
 
+def unpin_image(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> None:
+    _IMAGE_CACHE.unpin((path, width, height, resample))
 
-def _get_resource_stream(path: str) -> io.BytesIO | None:
+
+def pin_sprite(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> None:
     """
-    [내부 함수] 경로를 받아 파일 데이터를 바이트 스트림(io.BytesIO)으로 반환합니다.
-    (IO 작업이므로 캐싱하지 않고, 호출 시마다 스트림을 새로 엽니다.)
+    스프라이트만 pin 합니다. 만들 때 쓴 리사이즈 이미지는 pin 하지 않으므로
+    메모리 한도를 넘으면 먼저 버려질 수 있습니다. (같은 픽셀을 두 번 붙잡지 않음)
     """
-    # 1. 경로 구분자 통일
-    unified_path = path.replace("\\", "/")
+    _SPRITE_CACHE.pin((path, width, height, resample))
+
+
+def unpin_sprite(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> None:
+    _SPRITE_CACHE.unpin((path, width, height, resample))
+
+
+def pin_font(path: str, size: int) -> None:
+    _FONT_CACHE.pin((path, size))
+
+
+def unpin_font(path: str, size: int) -> None:
+    _FONT_CACHE.unpin((path, size))
+
 
+def get_cache_stats() -> dict[str, dict[str, int | str]]:
+    """캐시별 사용량과 hit/miss/eviction 수"""
+    stats: dict[str, dict[str, int | str]] = {
+        cache.name: cache.get_stats()
+        for cache in (_IMAGE_CACHE, _SPRITE_CACHE, _FONT_CACHE, _ATLAS_SHEET_CACHE)
+    }
+    stats["disk"] = get_disk_cache_stats()
+    return stats
+
+
+def _get_resource_stream(path: str) -> io.BytesIO | MemoryViewStream | None:
+    """
+    [내부 함수] 경로를 받아 파일 데이터를 바이트 스트림으로 반환합니다.
+    (IO 작업이므로 캐싱하지 않고, 호출 시마다 스트림을 새로 엽니다.)
+    """
     # [CASE 1] 일반 파일 시스템에 존재하는 경우
     if os.path.exists(path):
         try:
@@ -40,22 +152,13 @@ def _get_resource_stream(path: str) -> io.BytesIO | None:
             return None
 
     # [CASE 2] .pyz (Zip) 내부에 존재하는 경우
-    if ".pyz/" in unified_path:
-        try:
-            zip_file_path, internal_path_raw = unified_path.split(".pyz/")
-            zip_file_path += ".pyz"
-
-            # 내부 경로 정규화
-            internal_path_clean = posixpath.normpath(internal_path_raw)
-
-            # Zip 열고 데이터 읽기
-            with zipfile.ZipFile(zip_file_path, "r") as z:
-                file_data = z.read(internal_path_clean)
-                return io.BytesIO(file_data)
-        except KeyError:
-            pass
-        except Exception as e:
-            print(f"❌ Zip 내부 읽기 실패: {path} / {e}")
+    # 아카이브는 한 번만 열어 색인해 두고, 압축 안 한 항목은 복사 없이 읽습니다.
+    try:
+        member_stream = open_archive_member(path)
+        if member_stream is not None:
+            return member_stream
+    except Exception as e:
+        print(f"❌ Zip 내부 읽기 실패: {path} / {e}")
 
     # 못 찾음
     print(f"⚠️ 리소스를 찾을 수 없음: {path}")
@@ -71,17 +174,19 @@ def load_custom_font(
     """
     # 1. 캐시 확인
     cache_key = (path, size)
-    if cache_key in _FONT_CACHE:
-        return _FONT_CACHE[cache_key]
+    cached_font = _FONT_CACHE.get(cache_key)
+    if cached_font is not None:
+        return cached_font
 
     # 2. 리소스 로드 (캐시에 없을 경우)
     font_stream = _get_resource_stream(path)
 
     if font_stream:
         try:
+            font_byte_size = font_stream.getbuffer().nbytes
             font = ImageFont.truetype(font_stream, size)
             # 3. 캐시에 저장
-            _FONT_CACHE[cache_key] = font
+            _FONT_CACHE.put(cache_key, font, font_byte_size)
             return font
         except Exception as e:
             print(f"❌ 폰트 생성 실패: {path} / {e}")
@@ -90,34 +195,238 @@ def load_custom_font(
     return ImageFont.load_default()
 
 
-def load_resized_image(path: str, width: int, height: int) -> Image.Image | None:
+def resolve_font_path(path: str, text: str = "") -> str:
+    """
+    text를 그릴 폰트 경로를 고릅니다.
+    build.py가 만든 서브셋 폰트가 있고 text의 글자가 모두 들어 있으면 서브셋 경로,
+    아니면 (처음 보는 글자가 섞이면) 원본 경로를 반환합니다.
+    """
+    info = _get_font_subset_info()
+    font_name = posixpath.basename(path.replace("\\", "/"))
+    if font_name not in info.get("fonts", ()):
+        return path
+    if not _font_subset_chars.issuperset(text):
+        return path
+    return f"{FONT_SUBSET_DIR}/{font_name}"
+
+
+def _get_font_subset_info() -> dict:
+    """[내부 함수] build.py가 만든 charset.json을 한 번만 읽습니다."""
+    global _font_subset_info, _font_subset_chars
+    if _font_subset_info is not None:
+        return _font_subset_info
+
+    info = _read_build_index(FONT_SUBSET_CHARSET_PATH)
+    _font_subset_chars = frozenset(info.get("chars", ""))
+    _font_subset_info = info
+    return _font_subset_info
+
+
+def load_resized_image(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> Image.Image | None:
     """
     이미지를 로드하고 리사이징하여 반환합니다. (캐싱 적용됨)
-    동일한 경로, 너비, 높이의 요청은 메모리에서 즉시 반환합니다.
+    동일한 경로, 너비, 높이, 리사이즈 방식의 요청은 메모리에서 즉시 반환합니다.
+    :param resample: 리사이즈 방식 (기본 NEAREST: 픽셀 아트, 에셋 팩도 이 방식으로 만듦)
     """
     # 1. 캐시 확인
-    cache_key = (path, width, height)
-    if cache_key in _IMAGE_CACHE:
-        return _IMAGE_CACHE[cache_key]
+    cache_key = (path, width, height, resample)
+    cached_img = _IMAGE_CACHE.get(cache_key)
+    if cached_img is not None:
+        return cached_img
+
+    # 2. build.py가 에셋 팩에 이 크기로 넣어 둔 것이 있으면 mmap 위에서 바로 사용
+    #    (페이지 캐시를 가리킬 뿐 힙 메모리를 쓰지 않으므로 캐시 한도에 세지 않음)
+    if resample == Image.Resampling.NEAREST:
+        packed_img = _load_packed_image(path, width, height)
+        if packed_img is not None:
+            _IMAGE_CACHE.put(cache_key, packed_img, 0)
+            return packed_img
+
+    # 3. 이전 실행에서 디스크에 저장해 둔 것이 있으면 한 번 읽기만 함
+    disk_key = _get_disk_cache_key(path, width, height, resample)
+    if disk_key is not None:
+        disk_img = load_cached_image(disk_key, width, height)
+        if disk_img is not None:
+            _IMAGE_CACHE.put(cache_key, disk_img, get_image_byte_size(disk_img))
+            return disk_img
+
+    # 4. 리소스 로드 (아틀라스 우선, 없으면 개별 파일)
+    img = _load_from_atlas(path)
+    if img is None:
+        img = _load_image_file(path)
+    if img is None:
+        return None
+
+    try:
+        resized_img = img.resize((width, height), resample=resample)
+    except Exception as e:
+        print(f"❌ 이미지 처리 실패: {path} / {e}")
+        return None
+
+    # 5. 캐시에 저장 (다음 실행을 위해 디스크에도)
+    _IMAGE_CACHE.put(cache_key, resized_img, get_image_byte_size(resized_img))
+    if disk_key is not None:
+        save_cached_image(disk_key, resized_img)
+    return resized_img
 
-    # 2. 리소스 로드
+
+def _get_disk_cache_key(
+    path: str, width: int, height: int, resample: int
+) -> str | None:
+    """[내부 함수] 원본 정보로 디스크 캐시 키를 만듭니다. (원본은 읽지 않음)"""
+    if not DISK_CACHE_ENABLED:
+        return None
+    source_stamp = _get_source_stamp(path)
+    if source_stamp is None:
+        return None
+    return make_image_key(source_stamp, width, height, resample)
+
+
+def _get_source_stamp(path: str) -> str | None:
+    """
+    [내부 함수] 원본이 바뀌면 달라지는 값 (_get_resource_stream과 같은 순서로 찾음)
+    - 파일: 절대 경로 + 크기 + 수정 시각
+    - .pyz 항목: 내부 경로 + CRC + 크기 (아카이브 색인에 있는 값)
+    없으면 None
+    """
+    if os.path.exists(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return f"file|{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    info = get_archive_member_info(path)
+    if info is None:
+        return None
+    return f"pyz|{info.filename}|{info.CRC:08x}|{info.file_size}"
+
+
+def load_sprite(
+    path: str, width: int, height: int, resample: int = Image.Resampling.NEAREST
+) -> SpriteBlit | None:
+    """
+    load_resized_image 결과를 붙여넣기 좋게 준비해 반환합니다. (캐싱 적용됨)
+    투명한 테두리를 잘라내고, 알파를 보고 마스크 없이 / 1-bit / 알파 중 paste 방식을 정해 둡니다.
+    """
+    cache_key = (path, width, height, resample)
+    cached_sprite = _SPRITE_CACHE.get(cache_key)
+    if cached_sprite is not None:
+        return cached_sprite
+
+    # 에셋 팩에 있으면 build.py가 정해 둔 영역/방식으로 mmap 픽셀을 그대로 가리킴
+    # (잘라낸 복사본과 마스크를 만들지 않으므로 캐시 한도에 0으로 셈)
+    # 에셋 팩은 NEAREST로 만들었으므로 다른 리사이즈 방식은 직접 만듦
+    sprite = None
+    if resample == Image.Resampling.NEAREST:
+        sprite = _load_packed_sprite(path, width, height)
+    if sprite is None:
+        img = load_resized_image(path, width, height, resample)
+        if img is None:
+            return None
+        sprite = classify_sprite(img)
+    _SPRITE_CACHE.put(cache_key, sprite, sprite.get_byte_size())
+    return sprite
+
+
+def _load_image_file(path: str) -> Image.Image | None:
+    """[내부 함수] 이미지 파일 하나를 읽어 RGBA로 반환합니다."""
     img_stream = _get_resource_stream(path)
+    if not img_stream:
+        return None
+
+    try:
+        with Image.open(img_stream) as img:
+            return img.convert("RGBA")
+    except UnidentifiedImageError:
+        print(f"❌ 이미지 식별 불가: {path}")
+    except Exception as e:
+        print(f"❌ 이미지 처리 실패: {path} / {e}")
+    return None
+
 
-    if img_stream:
+def _read_build_index(path: str) -> dict:
+    """[내부 함수] build.py가 만든 JSON 인덱스를 읽습니다. 없으면 빈 dict"""
+    if not os.path.exists(path) and not has_archive_member(path):
+        return {}  # build.py를 실행하지 않은 개발 환경
+
+    index_stream = _get_resource_stream(path)
+    if index_stream:
         try:
-            with Image.open(img_stream) as img:
-                img = img.convert("RGBA")
-
-                resized_img = img.resize(
-                    (width, height), resample=Image.Resampling.NEAREST
-                )
-
-                # 3. 캐시에 저장
-                _IMAGE_CACHE[cache_key] = resized_img
-                return resized_img
-        except UnidentifiedImageError:
-            print(f"❌ 이미지 식별 불가: {path}")
+            return json.load(index_stream)
         except Exception as e:
-            print(f"❌ 이미지 처리 실패: {path} / {e}")
+            print(f"❌ 빌드 인덱스 읽기 실패: {path} / {e}")
+    return {}
 
-    return None
+
+def _get_atlas_index() -> dict:
+    """[내부 함수] 아틀라스 인덱스를 한 번만 읽습니다."""
+    global _atlas_index
+    if _atlas_index is None:
+        _atlas_index = _read_build_index(ATLAS_INDEX_PATH)
+    return _atlas_index
+
+
+def _get_sheet(sheet_key: str, file_path: str) -> Image.Image | None:
+    """[내부 함수] 시트 이미지 (한 번 디코딩하면 시트 캐시에서 반환)"""
+    sheet = _ATLAS_SHEET_CACHE.get(sheet_key)
+    if sheet is None:
+        sheet = _load_image_file(file_path)
+        if sheet is None:
+            return None
+        _ATLAS_SHEET_CACHE.put(sheet_key, sheet, get_image_byte_size(sheet))
+    return sheet
+
+
+def _load_packed_image(path: str, width: int, height: int) -> Image.Image | None:
+    """[내부 함수] build.py가 이 크기로 에셋 팩에 넣어 둔 이미지. 없으면 None"""
+    pack = get_asset_pack(ASSET_PACK_PATH)
+    key = _get_atlas_key(path)
+    if pack is None or key is None:
+        return None
+    return pack.get_image(key, width, height)
+
+
+def _load_packed_sprite(path: str, width: int, height: int) -> SpriteBlit | None:
+    """[내부 함수] 에셋 팩에 이 크기로 들어 있는 스프라이트. 없으면 None"""
+    pack = get_asset_pack(ASSET_PACK_PATH)
+    key = _get_atlas_key(path)
+    if pack is None or key is None:
+        return None
+    return pack.get_sprite(key, width, height)
+
+
+def _get_atlas_key(path: str) -> str | None:
+    """[내부 함수] "./src/assets/images/a.png" -> "src/assets/images/a.png" """
+    unified_path = path.replace("\\", "/")
+    start = unified_path.rfind("src/assets/")
+    if start < 0:
+        return None
+    return posixpath.normpath(unified_path[start:])
+
+
+def _load_from_atlas(path: str) -> Image.Image | None:
+    """
+    [내부 함수] 아틀라스 시트에서 잘라 원래 크기의 이미지로 복원합니다.
+    아틀라스에 없으면 None
+    """
+    index = _get_atlas_index()
+    key = _get_atlas_key(path)
+    sprite = index.get("sprites", {}).get(key) if key else None
+    if sprite is None:
+        return None
+
+    sheet_name = sprite["sheet"]
+    sheet_info = index["sheets"][sheet_name]
+    sheet = _get_sheet(sheet_name, f"{ATLAS_DIR}/{sheet_info['file']}")
+    if sheet is None:
+        return None
+
+    # 투명 테두리를 잘라서 저장했으므로 원래 크기의 투명 캔버스에 되돌려 놓습니다.
+    x, y, w, h = sprite["rect"]
+    img = Image.new("RGBA", tuple(sprite["source_size"]), (0, 0, 0, 0))
+    if w > 0 and h > 0:
+        img.paste(sheet.crop((x, y, x + w, y + h)), tuple(sprite["offset"]))
+    return img
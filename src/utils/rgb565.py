@@ -0,0 +1,37 @@
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def is_rgb565_available() -> bool:
+    """NumPy가 있어야 RGB565 변환을 쓸 수 있습니다."""
+    return np is not None
+
+
+def encode_rgb565(image: Image.Image, rotate: int = 0) -> bytes:
+    """
+    RGB/RGBA 이미지를 패널에 바로 보낼 수 있는 big-endian RGB565 바이트로 바꿉니다.
+    회전도 같은 패스에서 처리합니다. (알파 채널은 무시)
+    :param rotate: luma와 같은 시계방향 90도 단위 회전 값 (0~3)
+    """
+    if np is None:
+        raise RuntimeError("RGB565 변환에는 numpy가 필요합니다.")
+
+    pixels = np.asarray(image)
+    rotate %= 4
+    if rotate:
+        # np.rot90은 반시계 방향이므로 음수로 (복사 없이 view만 바뀜)
+        pixels = np.rot90(pixels, -rotate)
+
+    red = pixels[..., 0]
+    green = pixels[..., 1]
+    blue = pixels[..., 2]
+
+    # [RRRRRGGG][GGGBBBBB] 순서 (상위 바이트 먼저)
+    encoded = np.empty(red.shape + (2,), dtype=np.uint8)
+    np.bitwise_or(red & 0xF8, green >> 5, out=encoded[..., 0])
+    np.bitwise_or((green << 3) & 0xE0, blue >> 3, out=encoded[..., 1])
+    return encoded.tobytes()
@@ -0,0 +1,121 @@
+from PIL import Image, ImageDraw
+
+# --------------------------------------------------------------------------
+# 스프라이트 붙여넣기 방식
+# 알파 채널을 로드할 때 한 번 살펴보고 가장 싼 paste 방식을 정해 둡니다.
+#   opaque : 보이는 부분이 전부 불투명 -> 마스크 없이 paste (복사만 함)
+#   binary : 알파가 0 아니면 255       -> 1-bit 마스크 ("1" 모드, 섞지 않고 고르기만 함)
+#   alpha  : 반투명 픽셀이 있음        -> 알파 채널("L")로 섞기
+# 세 방식 모두 결과 픽셀은 RGBA 이미지 자신을 마스크로 쓴 것과 같습니다.
+# --------------------------------------------------------------------------
+
+BLIT_OPAQUE = "opaque"
+BLIT_BINARY = "binary"
+BLIT_ALPHA = "alpha"
+
+# 마지막으로 찾은 (ImageDraw, 그 ImageDraw가 그리는 Image)
+# 프레임마다 back 버퍼가 바뀌므로 프레임당 한 번만 새로 찾게 됩니다.
+_last_canvas: ImageDraw.ImageDraw | None = None
+_last_canvas_image: Image.Image | None = None
+
+
+class SpriteBlit:
+    """
+    붙여넣기 준비를 끝낸 스프라이트
+
+    - image: 투명한 테두리를 잘라낸 보이는 부분 (완전히 투명하면 None)
+    - offset: 원래 이미지 안에서 image의 왼쪽 위 위치
+    - mask: kind에 맞춰 미리 만든 마스크 (opaque면 None)
+      에셋 팩 스프라이트는 복사본을 만들지 않도록 image(RGBA) 자신을 마스크로 씀
+    """
+
+    kind: str
+    image: Image.Image | None
+    mask: Image.Image | None
+    offset: tuple[int, int]
+
+    def __init__(
+        self,
+        kind: str,
+        image: Image.Image | None,
+        mask: Image.Image | None,
+        offset: tuple[int, int],
+    ) -> None:
+        self.kind = kind
+        self.image = image
+        self.mask = mask
+        self.offset = offset
+
+    def get_byte_size(self) -> int:
+        """
+        잘라낸 이미지와 마스크가 차지하는 메모리
+        mmap 위의 읽기 전용 이미지(에셋 팩)는 힙을 쓰지 않으므로 세지 않음
+        """
+        images = [self.image]
+        if self.mask is not self.image:
+            images.append(self.mask)
+        byte_size = 0
+        for image in images:
+            if image is None or image.readonly:
+                continue
+            byte_size += len(image.getbands()) * image.width * image.height
+        return byte_size
+
+    def paste(
+        self,
+        target: Image.Image,
+        xy: tuple[int, int],
+        box: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        """
+        target의 xy에 붙여넣습니다.
+        :param box: image 안에서 붙여넣을 부분 (None이면 전체)
+        """
+        if self.image is None:
+            return
+        image, mask = self.image, self.mask
+        if box is not None:
+            image = image.crop(box)
+            if mask is self.image:
+                mask = image
+            elif mask is not None:
+                mask = mask.crop(box)
+        target.paste(image, xy, mask)
+
+
+def classify_sprite(image: Image.Image) -> SpriteBlit:
+    """투명한 테두리를 잘라내고, 남은 부분의 알파를 보고 paste 방식을 정합니다."""
+    if image.mode != "RGBA":
+        return SpriteBlit(BLIT_OPAQUE, image, None, (0, 0))
+
+    alpha = image.getchannel("A")
+    bbox = alpha.getbbox()
+    if bbox is None:
+        return SpriteBlit(BLIT_ALPHA, None, None, (0, 0))  # 완전히 투명
+
+    if bbox != (0, 0, image.width, image.height):
+        image = image.crop(bbox)
+        alpha = alpha.crop(bbox)
+    offset = (bbox[0], bbox[1])
+
+    histogram = alpha.histogram()
+    if histogram[255] == alpha.width * alpha.height:
+        return SpriteBlit(BLIT_OPAQUE, image, None, offset)
+    if sum(histogram[1:255]) == 0:
+        mask = alpha.convert("1", dither=Image.Dither.NONE)
+        return SpriteBlit(BLIT_BINARY, image, mask, offset)
+    return SpriteBlit(BLIT_ALPHA, image, alpha, offset)
+
+
+def get_canvas_image(canvas: ImageDraw.ImageDraw) -> Image.Image | None:
+    """ImageDraw가 그리는 Image (paste용). 같은 canvas면 다시 찾지 않습니다."""
+    global _last_canvas, _last_canvas_image
+    if canvas is _last_canvas:
+        return _last_canvas_image
+
+    target_image = getattr(canvas, "_image", None) or getattr(canvas, "im", None)
+    if not isinstance(target_image, Image.Image):
+        target_image = None
+    _last_canvas = canvas
+    _last_canvas_image = target_image
+    return target_image
@@ -0,0 +1,118 @@
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from classes.byte_budget_cache import POLICY_LRU, ByteBudgetCache
+from settings.mushitroom_config import TEXT_BITMAP_CACHE_MAX_BYTES
+
+
+class TextBitmap:
+    """
+    한 번 래스터화한 글자 비트맵
+    - mask: 글자 모양 알파 마스크 ("L")
+    - offset: 기준 좌표(anchor)에서 마스크 왼쪽 위까지의 거리
+    - ink: 캔버스 모드(RGBA)로 바꿔 둔 글자색
+    """
+
+    mask: Image.Image
+    offset: tuple[int, int]
+    ink: tuple[int, ...]
+    byte_size: int
+
+    def __init__(
+        self, mask: Image.Image, offset: tuple[int, int], ink: tuple[int, ...]
+    ) -> None:
+        self.mask = mask
+        self.offset = offset
+        self.ink = ink
+        self.byte_size = mask.width * mask.height
+
+
+# --------------------------------------------------------------------------
+# [Global Cache Storage]
+# (글자, 폰트 파일, 크기, 색, anchor)를 키로 저장. 가장 오래 안 쓴 것부터 버림 (LRU)
+# --------------------------------------------------------------------------
+_TEXT_BITMAP_CACHE: ByteBudgetCache[tuple[str, str, int, str, str], TextBitmap] = (
+    ByteBudgetCache("text_bitmap", TEXT_BITMAP_CACHE_MAX_BYTES, POLICY_LRU)
+)
+
+
+def clear_text_bitmap_cache():
+    """캐시된 글자 비트맵을 모두 해제합니다."""
+    _TEXT_BITMAP_CACHE.clear()
+
+
+def get_text_bitmap_cache_stats() -> dict[str, int | str]:
+    return _TEXT_BITMAP_CACHE.get_stats()
+
+
+def get_text_bitmap(
+    font: ImageFont.ImageFont | ImageFont.FreeTypeFont,
+    font_path: str,
+    font_size: int,
+    text: str,
+    color: str,
+    anchor: str = "mm",
+) -> TextBitmap | None:
+    """
+    글자 비트맵을 반환합니다. (캐싱 적용됨)
+    처음 요청일 때만 FreeType으로 그리고, 이후에는 메모리에서 반환합니다.
+    그릴 게 없으면(빈 문자열 등) None
+    """
+    # 1. 캐시 확인
+    cache_key = (text, font_path, font_size, color, anchor)
+    bitmap = _TEXT_BITMAP_CACHE.get(cache_key)
+    if bitmap is not None:
+        return bitmap
+
+    # 2. 래스터화 (캐시에 없을 경우)
+    bitmap = _rasterize(font, text, color, anchor)
+    if bitmap is None:
+        return None
+
+    # 3. 캐시에 저장 (한도를 넘으면 오래된 것부터 제거)
+    _TEXT_BITMAP_CACHE.put(cache_key, bitmap, bitmap.byte_size)
+
+    return bitmap
+
+
+def _rasterize(
+    font: ImageFont.ImageFont | ImageFont.FreeTypeFont,
+    text: str,
+    color: str,
+    anchor: str,
+) -> TextBitmap | None:
+    """ImageDraw.text와 같은 결과가 나오도록 글자를 알파 마스크에 그립니다."""
+    if not text:
+        return None
+
+    try:
+        try:
+            left, top, right, bottom = font.getbbox(text, anchor=anchor)
+            draw_anchor: str | None = anchor
+            offset = (int(left), int(top))
+        except TypeError:
+            # 기본 비트맵 폰트는 anchor를 지원하지 않으므로 직접 가운데 정렬
+            left, top, right, bottom = font.getbbox(text)
+            draw_anchor = None
+            offset = (-int(right - left) // 2, -int(bottom - top) // 2)
+
+        width = int(right - left)
+        height = int(bottom - top)
+        if width <= 0 or height <= 0:
+            return None
+
+        mask = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(mask).text(
+            (-int(left), -int(top)),
+            text,
+            fill=255,
+            font=font,
+            anchor=draw_anchor,
+        )
+        ink = ImageColor.getcolor(color, "RGBA")
+    except Exception as e:
+        print(f"❌ 글자 비트맵 생성 실패: {text} / {e}")
+        return None
+
+    if not isinstance(ink, tuple):
+        ink = (ink, ink, ink, 255)
+    return TextBitmap(mask, offset, ink)